@@ -11,10 +11,35 @@ __author__ = "Mark A. Greenslade et al"
 __license__ = "Apache 2.0"
 
 
-from actusmp.codegen.enums import TargetLanguage
-from actusmp.codegen.writer import write
-from actusmp.model import Contract
-from actusmp.model import ContractSet
-from actusmp.model import Term
-from actusmp.model import TermSet
-from actusmp.model import Dictionary
+# Public API: name <-> defining module, imported upon first access (PEP 562) so that
+# importing the package, (e.g. for its version), does not load jinja2 or the meta-model.
+_EXPORTS = {
+    "TargetLanguage": "actusmp.codegen.enums",
+    "write": "actusmp.codegen.writer",
+    "write_many": "actusmp.codegen.writer",
+    "Contract": "actusmp.model",
+    "ContractSet": "actusmp.model",
+    "Term": "actusmp.model",
+    "TermSet": "actusmp.model",
+    "Dictionary": "actusmp.model",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Resolves a public API member upon first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    """Returns module attribute names including lazily resolved members."""
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -1,9 +1,15 @@
+import dataclasses
+import functools
 import re
+import sys
+import typing
 
+from actusmp.model import Dictionary
 from actusmp.model import Enum
 from actusmp.model import EnumMember
 from actusmp.model import ScalarType
 from actusmp.model import Term
+from actusmp.utils import memo
 
 
 def to_camel_case(name: str, separator: str = '_'):
@@ -42,6 +48,20 @@ def to_pascal_case(name: str, separator: str = '_'):
     return r
 
 
+@functools.lru_cache(maxsize=4096)
+def get_enum_default_acronym(term: Term) -> str:
+    """Returns acronym of the enum member matching an enum term's default value.
+
+    Memoized so that the scan over allowed values, (and any warning), happens once per term.
+
+    """
+    for member in term.allowed_values:
+        if member.is_match(term.default):
+            return member.acronym
+    print(f"WARNING: enum member default is incorrect, reverting to option 0 :: {term}")
+    return term.allowed_values[0].acronym
+
+
 def to_py_type(term: Term) -> str:
     """Maps an Actus term's type to it's pythonic equivalent.
 
@@ -74,16 +94,9 @@ def to_py_default(term: Term) -> str:
     """Maps an Actus term's default value to it's pythonic equivalent.
 
     """
-    def get_enum_default_acronym():
-        for member in term.allowed_values:
-            if member.is_match(term.default):
-                return member.acronym
-        print(f"WARNING: enum member default is incorrect, reverting to option 0 :: {term}")
-        return term.allowed_values[0].acronym
-
     if term.default:
         if term.scalar_type == ScalarType.Enum:
-            return f"enums.{to_camel_case(term.identifier)}.{get_enum_default_acronym()}"
+            return f"enums.{to_camel_case(term.identifier)}.{get_enum_default_acronym(term)}"
         elif term.scalar_type == ScalarType.Period:
             return "None"
         elif term.scalar_type == ScalarType.Real:
@@ -95,6 +108,29 @@ def to_py_default(term: Term) -> str:
         return f"'TODO: format {term.scalar_type} :: {term.default}'"
 
 
+def to_py_column(term: Term) -> typing.Tuple[str, str]:
+    """Maps an Actus term's type to a NumPy column kind & dtype declaration.
+
+    """
+    if term.is_array:
+        return "object", "np.dtype(object)"
+    elif term.scalar_type == ScalarType.Cycle:
+        return "cycle", "CYCLE_DTYPE"
+    elif term.scalar_type == ScalarType.Enum:
+        options = [int(i.option) for i in term.allowed_values if isinstance(i, EnumMember)]
+        if all(-128 < i < 128 for i in options):
+            return "enum", "np.dtype(np.int8)"
+        return "enum", "np.dtype(np.int16)"
+    elif term.scalar_type == ScalarType.Period:
+        return "period", "PERIOD_DTYPE"
+    elif term.scalar_type == ScalarType.Real:
+        return "real", "np.dtype(np.float64)"
+    elif term.scalar_type == ScalarType.Timestamp:
+        return "timestamp", "np.dtype(\"datetime64[s]\")"
+
+    return "object", "np.dtype(object)"
+
+
 def to_py_enum_member(definition: Enum, member: EnumMember) -> str:
     """Maps an enum member to a python safe enum member name.
 
@@ -147,16 +183,9 @@ def to_rs_default(term: Term) -> str:
     """Maps an Actus term's default value to it's rusty equivalent.
 
     """
-    def get_enum_default_acronym():
-        for member in term.allowed_values:
-            if member.is_match(term.default):
-                return member.acronym
-        print(f"WARNING: enum member default is incorrect, reverting to option 0 :: {term}")
-        return term.allowed_values[0].acronym
-
     if term.default:
         if term.scalar_type == ScalarType.Enum:
-            return f"enums.{to_camel_case(term.identifier)}.{get_enum_default_acronym()}"
+            return f"enums.{to_camel_case(term.identifier)}.{get_enum_default_acronym(term)}"
         elif term.scalar_type == ScalarType.Period:
             return "None"
         elif term.scalar_type == ScalarType.Real:
@@ -219,13 +248,6 @@ def to_ts_default(term: Term) -> str:
     """Maps an Actus term's default value to it's typescript equivalent.
 
     """
-    def get_enum_default_acronym():
-        for member in term.allowed_values:
-            if member.is_match(term.default):
-                return member.acronym
-        print(f"WARNING: enum member default is incorrect, reverting to option 0 :: {term}")
-        return term.allowed_values[0].acronym
-
     if term.is_array:
         return "[]"
 
@@ -233,7 +255,7 @@ def to_ts_default(term: Term) -> str:
         if term.scalar_type == ScalarType.Cycle:
             return ""
         elif term.scalar_type == ScalarType.Enum:
-            return f"enums.{to_camel_case(term.identifier)}.{get_enum_default_acronym()}"
+            return f"enums.{to_camel_case(term.identifier)}.{get_enum_default_acronym(term)}"
         elif term.scalar_type == ScalarType.Period:
             return ""
         elif term.scalar_type == ScalarType.Real:
@@ -291,3 +313,146 @@ def to_underscore_case(target: str):
     r = r.lower()
 
     return r
+
+
+@dataclasses.dataclass(frozen=True)
+class Names():
+    """Set of mangled forms of a dictionary identifier or acronym.
+
+    """
+    # Camel case form, e.g. ContractType.
+    camel: str
+
+    # Pascal case form, e.g. contractType.
+    pascal: str
+
+    # Underscore case form, e.g. contract_type.
+    snake: str
+
+    @staticmethod
+    def create(name: str) -> "Names":
+        """Factory: returns mangled forms of a name."""
+        return Names(
+            camel=to_camel_case(name),
+            pascal=to_pascal_case(name),
+            snake=to_underscore_case(name)
+        )
+
+
+class NameTable():
+    """Precomputed mangled names of a dictionary's identifiers, acronyms & enum members.
+
+    Exposes the convertor's name mangling functions so that it may be passed to templates
+    in place of this module, (see __getattr__ for non name mangling functions).
+
+    """
+    def __init__(self, names: typing.Dict[str, Names], members: typing.Dict[str, str]):
+        """Instance constructor.
+
+        :param names: Map: identifier | acronym <-> mangled names.
+        :param members: Map: enum member acronym <-> language safe member name.
+
+        """
+        self.names = names
+        self.members = members
+
+    def __getattr__(self, name: str):
+        """Falls back to module level convertor functions."""
+        return getattr(sys.modules[__name__], name)
+
+    def __len__(self) -> int:
+        """Instance iterator length."""
+        return len(self.names)
+
+    def __str__(self) -> str:
+        """Instance string representation."""
+        return f"name-table|{len(self.names)}|{len(self.members)}"
+
+    def get(self, name: str) -> Names:
+        """Returns mangled forms of a name, names not yet tabled are added upon demand."""
+        try:
+            return self.names[name]
+        except KeyError:
+            return self.names.setdefault(name, Names.create(name))
+
+    def get_member_name(self, member: EnumMember) -> str:
+        """Returns language safe name of an enum member."""
+        try:
+            return self.members[member.acronym]
+        except KeyError:
+            return self.members.setdefault(member.acronym, _to_enum_member(member))
+
+    def to_camel_case(self, name: str, separator: str = '_'):
+        """Table backed equivalent of module level function."""
+        if name is None or separator != '_':
+            return to_camel_case(name, separator)
+        return self.get(name).camel
+
+    def to_pascal_case(self, name: str, separator: str = '_'):
+        """Table backed equivalent of module level function."""
+        if name is None or separator != '_':
+            return to_pascal_case(name, separator)
+        return self.get(name).pascal
+
+    def to_underscore_case(self, target: str):
+        """Table backed equivalent of module level function."""
+        if target is None:
+            return ''
+        return self.get(target).snake
+
+    def to_py_enum_member(self, definition: Enum, member: EnumMember) -> str:
+        """Table backed equivalent of module level function."""
+        return self.get_member_name(member)
+
+    def to_rs_enum_member(self, definition: Enum, member: EnumMember) -> str:
+        """Table backed equivalent of module level function."""
+        return self.get_member_name(member)
+
+    def to_ts_enum_member(self, member: EnumMember) -> str:
+        """Table backed equivalent of module level function."""
+        return self.get_member_name(member)
+
+
+@memo.per_instance
+def get_name_table(dictionary: Dictionary) -> NameTable:
+    """Returns name table of a dictionary, building it upon first request.
+
+    :param dictionary: ACTUS dictionary wrapper.
+    :returns: Table of precomputed mangled names.
+
+    """
+    names, members = set(), {}
+
+    def _add(entity):
+        names.update((entity.identifier, entity.acronym))
+        if entity.acronym:
+            names.add(entity.acronym.lower())
+
+    def _add_members(values: list):
+        for value in values:
+            if isinstance(value, EnumMember):
+                members[value.acronym] = _to_enum_member(value)
+
+    for enum in dictionary.enum_set:
+        _add(enum)
+        _add_members(enum.allowed_values if isinstance(enum, Term) else enum.members)
+    for contract in dictionary.contract_set:
+        _add(contract.type_info)
+    for state in dictionary.state_set:
+        _add(state)
+    for term in dictionary.term_set:
+        _add(term)
+
+    names.discard(None)
+
+    return NameTable({i: Names.create(i) for i in sorted(names)}, members)
+
+
+def _to_enum_member(member: EnumMember) -> str:
+    """Maps an enum member to a language safe enum member name.
+
+    """
+    # Some enum members begin with an integer which is unsafe in py, rs & js.
+    member_name = member.acronym.upper()
+
+    return f"_{member_name}" if member_name[0].isdigit() else member_name
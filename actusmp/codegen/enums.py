@@ -16,6 +16,7 @@ class TargetGenerator(enum.Enum):
     """Enumeration: set of supported generator types.
 
     """
+    BatchIndex = enum.auto()
     Enum = enum.auto()
     EnumIndex = enum.auto()
     FuncIndex = enum.auto()
@@ -24,7 +25,11 @@ class TargetGenerator(enum.Enum):
     FuncStubIndex = enum.auto()
     FuncStubMain = enum.auto()
     StateSpace = enum.auto()
+    StateSpaceBatch = enum.auto()
     Termset = enum.auto()
+    TermsetBatch = enum.auto()
+    TermsetDecoder = enum.auto()
+    TermsetDecoderIndex = enum.auto()
     TermsetIndex = enum.auto()
 
 
@@ -36,6 +41,16 @@ LANG_TEMPLATE_SUBFOLDER: dict = {
 }
 
 
+# Map: Generator type <-> supported language targets, (generators not mapped support all).
+GENERATOR_LANGS: dict = {
+    TargetGenerator.BatchIndex: (TargetLanguage.python,),
+    TargetGenerator.StateSpaceBatch: (TargetLanguage.python,),
+    TargetGenerator.TermsetBatch: (TargetLanguage.python,),
+    TargetGenerator.TermsetDecoder: (TargetLanguage.python,),
+    TargetGenerator.TermsetDecoderIndex: (TargetLanguage.python,),
+}
+
+
 # Map: Generator type <-> ACTUS function type.
 GENERATOR_ACTUS_FN = {
     TargetGenerator.FuncStubPOF: FunctionType.POF,
@@ -1,13 +1,24 @@
 import pathlib
+import typing
 
 from actusmp.codegen import convertor
+from actusmp.codegen import viewmodel
 from actusmp.codegen.enums import TargetGenerator
 from actusmp.codegen.enums import TargetLanguage
 from actusmp.codegen.enums import LANG_TEMPLATE_SUBFOLDER
 from actusmp.codegen.enums import GENERATOR_ACTUS_FN
+from actusmp.codegen.enums import GENERATOR_LANGS
 from actusmp.model import Dictionary
-from actusmp.model import IterableEntity
 from actusmp.utils import fsys
+from actusmp.utils import funcindex
+from actusmp.utils import profiler
+
+if typing.TYPE_CHECKING:
+    import jinja2
+
+
+# Size, (characters), to which streamed template output is buffered before being yielded.
+_STREAM_BUFFER_SIZE = 1 << 16
 
 
 class GeneratorContext():
@@ -34,6 +45,16 @@ class GeneratorContext():
         self.dictionary = dictionary
         self.path_to_java_funcs = path_to_java_funcs
 
+    @property
+    def names(self) -> convertor.NameTable:
+        """Table of precomputed mangled names, shared by all generators of a dictionary."""
+        return convertor.get_name_table(self.dictionary)
+
+    @property
+    def views(self) -> viewmodel.ViewModel:
+        """Language neutral views over fields & enumerations, shared by all generators."""
+        return viewmodel.get_view_model(self.dictionary)
+
 
 def generate(ctx: GeneratorContext):
     """Returns code emitted by a generator.
@@ -43,41 +64,121 @@ def generate(ctx: GeneratorContext):
 
     """
     # Set template.
-    tmpl = _get_template(ctx)
+    tmpl = get_template(ctx)
+
+    # Yield 2 member tuple: (code block, domain entity).
+    for entity in get_entities(ctx):
+        yield render(ctx, entity, tmpl), entity
 
-    # Set code block factory.
+
+def get_entities(ctx: GeneratorContext) -> typing.List[typing.Any]:
+    """Returns set of entities for each of which a generator emits a code block.
+
+    :param ctx: Generator contextual information.
+    :returns: Ordered set of domain entities.
+
+    """
     if ctx.typeof in (TargetGenerator.FuncStubPOF, TargetGenerator.FuncStubSTF):
-        factory = _gen_from_java_funcs(tmpl, ctx)
-    else:
-        entity = _get_entity(ctx)
-        if entity == ctx.dictionary:
-            factory = _gen_from_dictionary(tmpl, entity)
-        else:
-            factory = _gen_from_iterable_entity(tmpl, entity)
+        f_type = GENERATOR_ACTUS_FN[ctx.typeof]
+        f_iterator = funcindex.yield_funcset(ctx.dictionary, ctx.path_to_java_funcs, f_type)
+        return [(defn, f_type, event_type, suffix) for defn, event_type, suffix in f_iterator]
 
-    # Yield 2 member tuple: (code block, domain entity).
-    for entity, code_block in factory:
-        yield code_block, entity
+    entity = _get_entity(ctx)
+    if entity == ctx.dictionary:
+        return [entity]
+
+    return list(entity)
 
 
-def _gen_from_dictionary(tmpl: pathlib.Path, dictionary: Dictionary):
-    """Yields a single generated code block."""
-    yield dictionary, tmpl.render(defn=dictionary, dictionary=dictionary, utils=convertor)
+def get_generators(lang: TargetLanguage) -> typing.List[TargetGenerator]:
+    """Returns set of generators supporting a target language.
 
+    :param lang: Target programming language.
+    :returns: Ordered set of generators.
 
-def _gen_from_iterable_entity(tmpl: pathlib.Path, definitions: IterableEntity):
-    """Yields a set of generated code blocks."""
-    for defn in definitions:
-        yield defn, tmpl.render(defn=defn, utils=convertor)
+    """
+    return [i for i in TargetGenerator if lang in GENERATOR_LANGS.get(i, (lang,))]
 
 
-def _gen_from_java_funcs(tmpl: pathlib.Path, ctx: GeneratorContext):
-    """Returns generator yielding set of function stubs."""
-    f_type = GENERATOR_ACTUS_FN[ctx.typeof]
-    f_iterator = fsys.yield_funcset(ctx.dictionary, ctx.path_to_java_funcs, f_type)
-    for defn, event_type, suffix in f_iterator:
-        yield (defn, f_type, event_type, suffix), \
-              tmpl.render(defn=defn, event_type=event_type, suffix=suffix, utils=convertor)
+def get_entity_id(ctx: GeneratorContext, entity: typing.Any) -> typing.Optional[str]:
+    """Returns identifier of an entity for which a generator emits a code block.
+
+    :param ctx: Generator contextual information.
+    :param entity: Domain entity as returned from get_entities.
+    :returns: Identifier unique within generator scope, e.g. PAM or PAM_IED, None
+              if the generator emits a single dictionary level code block.
+
+    """
+    if ctx.typeof in (TargetGenerator.FuncStubPOF, TargetGenerator.FuncStubSTF):
+        defn, _, event_type, suffix = entity
+        return f"{defn.type_info.acronym}_{event_type}{suffix}"
+    elif isinstance(entity, Dictionary):
+        return None
+    elif hasattr(entity, "type_info"):
+        return entity.type_info.acronym
+
+    return entity.identifier
+
+
+def render(ctx: GeneratorContext, entity: typing.Any, tmpl: "jinja2.Template" = None) -> str:
+    """Returns code block emitted by a generator for a single entity.
+
+    :param ctx: Generator contextual information.
+    :param entity: Domain entity as returned from get_entities.
+    :param tmpl: Template over which generation will execute, if omitted it is loaded.
+    :returns: A generated code block.
+
+    """
+    tmpl = tmpl or get_template(ctx)
+    if profiler.is_enabled():
+        profiler.count("codegen.templates_rendered")
+        with profiler.span(f"codegen.render.{tmpl.name}", entity=get_entity_id(ctx, entity)):
+            return tmpl.render(**_get_render_args(ctx, entity))
+
+    return tmpl.render(**_get_render_args(ctx, entity))
+
+
+def render_stream(
+    ctx: GeneratorContext,
+    entity: typing.Any,
+    tmpl: "jinja2.Template" = None
+) -> typing.Iterator[str]:
+    """Returns code block emitted by a generator for a single entity as a stream of chunks.
+
+    Rendering is lazy, thus memory use is bounded by chunk size rather than by the size
+    of the code block, which matters for index files over large dictionaries.
+
+    :param ctx: Generator contextual information.
+    :param entity: Domain entity as returned from get_entities.
+    :param tmpl: Template over which generation will execute, if omitted it is loaded.
+    :returns: Iterator over generated code block chunks.
+
+    """
+    tmpl = tmpl or get_template(ctx)
+    profiler.count("codegen.templates_rendered")
+
+    buffer, size = [], 0
+    for chunk in tmpl.generate(**_get_render_args(ctx, entity)):
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= _STREAM_BUFFER_SIZE:
+            yield "".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer)
+
+
+def _get_render_args(ctx: GeneratorContext, entity: typing.Any) -> dict:
+    """Returns variables passed to a template when rendering a single entity.
+
+    """
+    if ctx.typeof in (TargetGenerator.FuncStubPOF, TargetGenerator.FuncStubSTF):
+        defn, _, event_type, suffix = entity
+        return dict(defn=defn, event_type=event_type, suffix=suffix, utils=ctx.names)
+    elif isinstance(entity, Dictionary):
+        return dict(defn=entity, dictionary=entity, utils=ctx.names, views=ctx.views)
+    else:
+        return dict(defn=entity, utils=ctx.names, views=ctx.views)
 
 
 def _get_entity(ctx: GeneratorContext):
@@ -92,17 +193,34 @@ def _get_entity(ctx: GeneratorContext):
         TargetGenerator.FuncStubPOF,
         TargetGenerator.FuncStubSTF,
         TargetGenerator.Termset,
+        TargetGenerator.TermsetBatch,
+        TargetGenerator.TermsetDecoder,
     ):
         return ctx.dictionary.contract_set
 
     return ctx.dictionary
 
 
-def _get_template(ctx: GeneratorContext):
+def get_template(ctx: GeneratorContext) -> "jinja2.Template":
     """Returns template over which generation will execute.
 
+    :param ctx: Generator contextual information.
+    :returns: A compiled template, reloaded by jinja2 if its source has changed.
+
+    """
+    with profiler.span("codegen.template_load"):
+        return fsys.get_template(get_template_name(ctx.lang, ctx.typeof))
+
+
+def get_template_name(lang: TargetLanguage, typeof: TargetGenerator) -> str:
+    """Returns name of template over which a generator executes.
+
+    :param lang: Target programming language.
+    :param typeof: Target generator type.
+    :returns: Template file name, e.g. py_termset.txt.
+
     """
-    dirname = LANG_TEMPLATE_SUBFOLDER[ctx.lang]
-    filename = convertor.to_underscore_case(ctx.typeof.name).lower()
+    dirname = LANG_TEMPLATE_SUBFOLDER[lang]
+    filename = convertor.to_underscore_case(typeof.name).lower()
 
-    return fsys.get_template(f"{dirname}_{filename}.txt")
+    return f"{dirname}_{filename}.txt"
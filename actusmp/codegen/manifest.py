@@ -0,0 +1,273 @@
+import dataclasses
+import hashlib
+import json
+import os
+import pathlib
+import typing
+
+from actusmp.utils import fsys
+from actusmp.utils import profiler
+from actusmp.utils import sinks
+
+
+# Name of manifest file written to root of an output directory.
+MANIFEST_FNAME = ".actusmp-manifest.json"
+
+# Size, (characters), of each block read when hashing a file's current content.
+_READ_SIZE = 1 << 16
+
+
+@dataclasses.dataclass
+class WriteSummary():
+    """Summary of a generation run against an output directory.
+
+    """
+    # Files whose content changed & were therefore (re)written.
+    written: typing.List[pathlib.Path] = dataclasses.field(default_factory=list)
+
+    # Files whose content was unchanged & were therefore left untouched.
+    skipped: typing.List[pathlib.Path] = dataclasses.field(default_factory=list)
+
+    # Files previously generated but no longer emitted by any generator.
+    stale: typing.List[pathlib.Path] = dataclasses.field(default_factory=list)
+
+    # Flag indicating whether stale files were deleted.
+    pruned: bool = False
+
+    def __str__(self) -> str:
+        """Instance string representation."""
+        stale = "pruned" if self.pruned else "stale"
+
+        return "|".join([
+            f"written={len(self.written)}",
+            f"skipped={len(self.skipped)}",
+            f"{stale}={len(self.stale)}",
+        ])
+
+    def extend(self, other: "WriteSummary"):
+        """Merges another summary into this one."""
+        self.written += other.written
+        self.skipped += other.skipped
+        self.stale += other.stale
+        self.pruned = self.pruned or other.pruned
+
+
+@dataclasses.dataclass
+class Manifest():
+    """Map of generated file path to content hash persisted within an output directory.
+
+    """
+    # Directory to which manifest relates.
+    root: pathlib.Path
+
+    # Map: file path relative to root <-> [content hash, file size, file mtime (ns)].
+    entries: typing.Dict[str, list] = dataclasses.field(default_factory=dict)
+
+    def __len__(self) -> int:
+        """Instance iterator length."""
+        return len(self.entries)
+
+    def __str__(self) -> str:
+        """Instance string representation."""
+        return f"manifest|{self.root}|{len(self)}"
+
+    @staticmethod
+    def load(root: pathlib.Path) -> "Manifest":
+        """Returns manifest persisted within an output directory, else an empty one.
+
+        :param root: Path to an output directory.
+        :returns: A manifest.
+
+        """
+        try:
+            with open(root / MANIFEST_FNAME, "r") as fstream:
+                entries = json.load(fstream)
+        except (OSError, ValueError):
+            entries = {}
+        if not isinstance(entries, dict):
+            entries = {}
+
+        # N.B. keys escaping the output directory, (e.g. hand edited), are never trusted.
+        for key in [i for i in entries if not _is_within(root, i)]:
+            print(f"WARNING: manifest entry outside output directory, ignoring :: {key}")
+            del entries[key]
+
+        return Manifest(root, entries)
+
+    def commit(
+        self,
+        entries: typing.Dict[pathlib.Path, list],
+        prune: bool = False
+    ) -> typing.List[pathlib.Path]:
+        """Replaces manifest entries with those of a completed run & persists manifest.
+
+        Stale files that are not pruned remain within the manifest so that they continue
+        to be reported by subsequent runs.  Must be called once pending writes are flushed.
+
+        :param entries: Map: path of each emitted file <-> manifest entry.
+        :param prune: Flag indicating whether stale files are to be deleted.
+        :returns: Ordered set of stale files, i.e. previously emitted but no longer.
+
+        """
+        entries = {self._get_key(k): _get_entry(k, v[0]) if v[1] is None else v
+                   for k, v in entries.items()}
+        stale = []
+        for key in sorted(i for i in self.entries if i not in entries):
+            fpath = self.root / key
+            if not _is_within(self.root, key):
+                print(f"WARNING: stale file outside output directory, ignoring :: {fpath}")
+                continue
+            stale.append(key)
+            if prune:
+                if fpath.exists():
+                    fpath.unlink()
+            elif fpath.exists():
+                entries[key] = self.entries[key]
+
+        entries = dict(sorted(entries.items()))
+        fpath = self.root / MANIFEST_FNAME
+
+        # N.B. an unchanged manifest is not rewritten so that no-op runs touch no file.
+        if entries != self.entries or not fpath.exists():
+            self.entries = entries
+            fsys.write(fpath, json.dumps(self.entries, indent=1))
+
+        return [self.root / i for i in stale]
+
+    def write(
+        self,
+        fpath: pathlib.Path,
+        content: str,
+        sink: typing.Optional[sinks.Sink] = None
+    ) -> typing.Tuple[list, bool]:
+        """Writes file content unless it is unchanged since the previous run.
+
+        A file is deemed unchanged if its size & mtime match those recorded alongside an
+        identical content hash, else its current content is compared.
+
+        N.B. The manifest itself is not mutated so that it can be shared by workers.
+
+        :param fpath: Target file path.
+        :param content: File content to be written.
+        :param sink: Sink to which changed content is written, defaults to fsys.write.
+        :returns: 2 member tuple: (manifest entry, flag indicating whether file was written).
+
+        """
+        digest = get_hash(content)
+        entry = self._get_unchanged_entry(fpath, digest)
+        if entry is not None:
+            profiler.count("io.files_skipped")
+            return entry, False
+
+        if sink is None:
+            fsys.write(fpath, content)
+        else:
+            sink.write(fpath, content)
+
+        # N.B. file stats are resolved upon commit as sink writes may be pending.
+        return [digest, None, None], True
+
+    def write_chunks(
+        self,
+        fpath: pathlib.Path,
+        chunks: typing.Iterable[str],
+        sink: typing.Optional[sinks.Sink] = None
+    ) -> typing.Tuple[list, bool]:
+        """Writes file content streamed as chunks unless it is unchanged since the previous run.
+
+        Content is hashed as it is streamed to a temporary file, which is discarded if
+        unchanged, thus memory use is independent of file size.
+
+        :param fpath: Target file path.
+        :param chunks: File content to be written, e.g. as yielded by a template.
+        :param sink: Sink to which changed content is written, defaults to fsys.write_chunks.
+        :returns: 2 member tuple: (manifest entry, flag indicating whether file was written).
+
+        """
+        hasher = hashlib.sha256()
+        entry = None
+
+        def _get_chunks():
+            for chunk in chunks:
+                hasher.update(chunk.encode("utf-8"))
+                yield chunk
+
+        def _is_changed() -> bool:
+            nonlocal entry
+            entry = self._get_unchanged_entry(fpath, hasher.hexdigest())
+            return entry is None
+
+        if sink is None:
+            is_written = fsys.write_chunks(fpath, _get_chunks(), _is_changed)
+        else:
+            is_written = sink.write_chunks(fpath, _get_chunks(), _is_changed)
+        if not is_written:
+            profiler.count("io.files_skipped")
+            return entry, False
+
+        return [hasher.hexdigest(), None, None], True
+
+    def _get_unchanged_entry(self, fpath: pathlib.Path, digest: str) -> typing.Optional[list]:
+        """Returns manifest entry of a file if its content is unchanged, else None.
+
+        """
+        try:
+            stat = fpath.stat()
+        except FileNotFoundError:
+            return None
+
+        entry = [digest, stat.st_size, stat.st_mtime_ns]
+        if self.entries.get(self._get_key(fpath)) == entry:
+            return entry
+        if _read_hash(fpath) == digest:
+            return entry
+
+        return None
+
+    def _get_key(self, fpath: pathlib.Path) -> str:
+        """Returns manifest key of a file path."""
+        return pathlib.Path(os.path.relpath(fpath, self.root)).as_posix()
+
+
+def get_hash(content: str) -> str:
+    """Returns hash of file content.
+
+    :param content: File content.
+    :returns: Hex digest.
+
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _get_entry(fpath: pathlib.Path, digest: str) -> list:
+    """Returns manifest entry of a written file.
+
+    """
+    stat = fpath.stat()
+
+    return [digest, stat.st_size, stat.st_mtime_ns]
+
+
+def _is_within(root: pathlib.Path, key: str) -> bool:
+    """Predicate: returns true if a manifest key resolves to a path within an output directory.
+
+    """
+    root = pathlib.Path(root).resolve()
+    fpath = (root / key).resolve()
+
+    return fpath != root and root in fpath.parents
+
+
+def _read_hash(fpath: pathlib.Path) -> typing.Optional[str]:
+    """Returns hash of a file's current content.
+
+    """
+    hasher = hashlib.sha256()
+    try:
+        with open(fpath, "r") as fstream:
+            for chunk in iter(lambda: fstream.read(_READ_SIZE), ""):
+                hasher.update(chunk.encode("utf-8"))
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    return hasher.hexdigest()
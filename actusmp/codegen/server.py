@@ -0,0 +1,354 @@
+import collections
+import dataclasses
+import hashlib
+import http.server
+import json
+import os
+import pathlib
+import socketserver
+import threading
+import time
+import typing
+import urllib.parse
+
+from actusmp.codegen import generator
+from actusmp.codegen import watcher
+from actusmp.codegen import writer
+from actusmp.codegen.enums import TargetGenerator
+from actusmp.codegen.enums import TargetLanguage
+from actusmp.dictionary import get_dictionary
+from actusmp.dictionary.accessor import get_path
+from actusmp.model import Dictionary
+
+
+# Map: normalised generator name <-> generator, e.g. termsetindex | termset_index.
+_GENERATORS = {i.name.lower(): i for i in TargetGenerator}
+
+
+@dataclasses.dataclass(frozen=True)
+class Artifact():
+    """A single rendered code block.
+
+    """
+    # Content of rendered code block.
+    content: str
+
+    # Hash of content, used as HTTP entity tag.
+    etag: str
+
+    # Path, relative to an output directory, to which code block would be written.
+    path: str
+
+
+class Service():
+    """Renders individual artifacts upon request & retains them in a bounded LRU cache.
+
+    The dictionary & compiled templates are held in memory.  Sources are re-checked at
+    most once per interval & artifacts affected by a change are evicted.  Safe for use
+    from concurrent request handling threads.
+
+    """
+    def __init__(
+        self,
+        path_to_java_impl: pathlib.Path,
+        path_to_dictionary: typing.Optional[pathlib.Path] = None,
+        maxsize: int = 1024,
+        interval: float = 0.5
+    ):
+        """Instance constructor.
+
+        :param path_to_java_impl: Path to actus-core Java library from which funcs are derived.
+        :param path_to_dictionary: Path to a dictionary file, if omitted the bundled one is used.
+        :param maxsize: Maximum number of rendered artifacts retained in memory.
+        :param interval: Minimum seconds between checks for source changes.
+
+        """
+        assert maxsize > 0
+
+        self.dictionary: typing.Optional[Dictionary] = None
+        self.error: typing.Optional[str] = None
+        self.hits = 0
+        self.interval = interval
+        self.maxsize = maxsize
+        self.misses = 0
+        self.path_to_dictionary = get_path(path_to_dictionary)
+        self.path_to_java_impl = path_to_java_impl
+        self._cache: typing.OrderedDict[tuple, Artifact] = collections.OrderedDict()
+        self._checked_at = 0.0
+        self._entities: typing.Dict[tuple, typing.Dict[str, typing.Any]] = {}
+        self._fingerprints: typing.Dict[str, typing.Any] = {}
+        self._generation = 0
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        """Instance iterator length."""
+        return len(self._cache)
+
+    def __str__(self) -> str:
+        """Instance string representation."""
+        return f"generation-service|{len(self)}/{self.maxsize}|{self.hits}|{self.misses}"
+
+    def get(
+        self,
+        lang: TargetLanguage,
+        typeof: TargetGenerator,
+        entity_id: typing.Optional[str] = None
+    ) -> Artifact:
+        """Returns a rendered artifact.
+
+        :param lang: Target programming language.
+        :param typeof: Target generator type.
+        :param entity_id: Entity identifier, (see generator.get_entity_id), omitted for
+                          generators emitting a single dictionary level code block.
+        :returns: A rendered artifact.
+
+        """
+        self.refresh()
+
+        key = (lang, typeof, (entity_id or "").lower())
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return self._cache[key]
+            self.misses += 1
+            generation = self._generation
+            dictionary = self.dictionary
+            entities = self._get_entities(lang, typeof)
+
+        if key[2] not in entities:
+            raise LookupError(f"Unknown entity: {lang.name}/{typeof.name}/{entity_id}")
+
+        ctx = generator.GeneratorContext(lang, typeof, dictionary, self.path_to_java_impl)
+        entity = entities[key[2]]
+        content = generator.render(ctx, entity)
+        artifact = Artifact(
+            content=content,
+            etag=hashlib.sha256(content.encode("utf-8")).hexdigest(),
+            path=writer.get_path_to_code_dest(pathlib.Path(), ctx, entity).as_posix()
+        )
+
+        with self._lock:
+            # Artifacts rendered from since invalidated sources are not retained.
+            if generation == self._generation:
+                self._cache[key] = artifact
+                if len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+
+        return artifact
+
+    def get_entity_ids(self, lang: TargetLanguage, typeof: TargetGenerator) -> typing.List[str]:
+        """Returns identifiers of entities for which a generator emits a code block.
+
+        :param lang: Target programming language.
+        :param typeof: Target generator type.
+        :returns: Ordered entity identifiers, empty if generator is dictionary level.
+
+        """
+        self.refresh()
+        with self._lock:
+            dictionary = self.dictionary
+            entities = self._get_entities(lang, typeof)
+
+        ctx = generator.GeneratorContext(lang, typeof, dictionary, self.path_to_java_impl)
+
+        return [
+            generator.get_entity_id(ctx, i)
+            for i in entities.values() if not isinstance(i, Dictionary)
+        ]
+
+    def refresh(self, force: bool = False) -> typing.List[str]:
+        """Evicts artifacts affected by source changes since the previous check.
+
+        If the changed dictionary cannot be loaded the previous generation continues to be
+        served, the error is retained for reporting & the refresh is retried upon next check.
+
+        :param force: Flag indicating whether the check interval is to be ignored.
+        :returns: Changed sources.
+
+        """
+        with self._lock:
+            now = time.monotonic()
+            is_recent = now - self._checked_at < self.interval
+            if not force and self.dictionary is not None and is_recent:
+                return []
+            self._checked_at = now
+
+            fingerprints = watcher.get_fingerprints(
+                self.path_to_dictionary,
+                self.path_to_java_impl
+            )
+            changes = watcher.get_changes(self._fingerprints, fingerprints)
+            if not changes:
+                return []
+
+            # N.B. upon failure, (e.g. a half written dictionary), the previous generation
+            # is served & fingerprints are not retained, thus the refresh is retried.
+            if self.dictionary is None or watcher.CHANGE_DICTIONARY in changes:
+                try:
+                    dictionary = get_dictionary(path=self.path_to_dictionary)
+                except Exception as err:
+                    self.error = f"{type(err).__name__}: {err}"
+                    if self.dictionary is None:
+                        raise
+                    return []
+                self.dictionary = dictionary
+            self.error = None
+            self._fingerprints = fingerprints
+            self._generation += 1
+            for key in [i for i in self._cache if watcher.is_affected(i[0], i[1], changes)]:
+                del self._cache[key]
+            for key in [i for i in self._entities if watcher.is_affected(i[0], i[1], changes)]:
+                del self._entities[key]
+
+            return changes
+
+    def _get_entities(self, lang: TargetLanguage, typeof: TargetGenerator) -> dict:
+        """Returns map: lower cased entity identifier <-> entity, (caller holds lock)."""
+        if (lang, typeof) not in self._entities:
+            if typeof not in generator.get_generators(lang):
+                raise LookupError(f"Unsupported generator: {lang.name}/{typeof.name}")
+            ctx = generator.GeneratorContext(
+                lang, typeof, self.dictionary, self.path_to_java_impl
+            )
+            self._entities[(lang, typeof)] = {
+                (generator.get_entity_id(ctx, i) or "").lower(): i
+                for i in generator.get_entities(ctx)
+            }
+
+        return self._entities[(lang, typeof)]
+
+
+class _RequestHandler(http.server.BaseHTTPRequestHandler):
+    """Maps GET /{lang}/{generator}[/{entity-id}] to a rendered artifact.
+
+    """
+    # Set protocol so that clients may reuse connections.
+    protocol_version = "HTTP/1.1"
+
+    def address_string(self) -> str:
+        """Returns client address, (unix socket clients have none)."""
+        return self.client_address[0] if self.client_address else "unix"
+
+    def do_GET(self):
+        """Handles a GET request."""
+        service: Service = self.server.service
+        path = urllib.parse.urlsplit(self.path).path
+        parts = [urllib.parse.unquote(i) for i in path.split("/") if i]
+
+        if parts == ["health"]:
+            self._send_json({
+                "cached": len(service),
+                "error": service.error,
+                "hits": service.hits,
+                "maxsize": service.maxsize,
+                "misses": service.misses,
+            })
+            return
+
+        if len(parts) not in (2, 3):
+            self._send_error(404, "Expected: /{lang}/{generator}[/{entity-id}]")
+            return
+
+        try:
+            lang = TargetLanguage[parts[0].lower()]
+            typeof = _GENERATORS[parts[1].replace("_", "").replace("-", "").lower()]
+        except KeyError:
+            self._send_error(404, f"Unknown language or generator: {parts[0]}/{parts[1]}")
+            return
+
+        try:
+            entity_ids = service.get_entity_ids(lang, typeof)
+            if len(parts) == 2 and entity_ids:
+                self._send_json(entity_ids)
+                return
+            artifact = service.get(lang, typeof, parts[2] if len(parts) == 3 else None)
+        except LookupError as err:
+            self._send_error(404, str(err))
+            return
+        except Exception as err:
+            self.log_error("generation failed: %s: %s", type(err).__name__, err)
+            self._send_error(500, f"Generation failed: {type(err).__name__}: {err}")
+            return
+
+        if self.headers.get("If-None-Match") == f'"{artifact.etag}"':
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        self._send(200, artifact.content, "text/plain; charset=utf-8", {
+            "ETag": f'"{artifact.etag}"',
+            "X-Actusmp-Path": artifact.path,
+        })
+
+    def log_message(self, format: str, *args):
+        """Logs a request, unless the server is quiet."""
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, body: str, content_type: str, headers: dict = None):
+        """Sends a response."""
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_error(self, status: int, message: str):
+        """Sends an error response."""
+        self._send(status, f"{message}\n", "text/plain; charset=utf-8")
+
+    def _send_json(self, obj: typing.Any):
+        """Sends a JSON response."""
+        self._send(200, json.dumps(obj, indent=1), "application/json")
+
+
+class _HTTPServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server bound to a generation service.
+
+    """
+    daemon_threads = True
+
+
+class _UnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+    """Threaded HTTP server bound to a generation service & listening on a unix socket.
+
+    """
+    daemon_threads = True
+
+
+def create_server(
+    service: Service,
+    host: str = "127.0.0.1",
+    port: int = 8737,
+    socket_path: typing.Optional[pathlib.Path] = None,
+    quiet: bool = False
+) -> socketserver.BaseServer:
+    """Returns a server exposing a generation service over HTTP.
+
+    Requests: GET /{lang}/{generator}/{entity-id}, e.g. /rust/termset/PAM, returns an
+    artifact; GET /{lang}/{generator} returns either a dictionary level artifact, e.g.
+    /python/enum_index, or a JSON list of entity identifiers; GET /health returns stats.
+
+    :param service: Generation service.
+    :param host: Host to which server binds, defaults to loopback.
+    :param port: Port to which server binds.
+    :param socket_path: Path to a unix socket, if passed host & port are ignored.
+    :param quiet: Flag indicating whether request logging is suppressed.
+    :returns: A server, callers invoke serve_forever & server_close.
+
+    """
+    if socket_path is not None:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        server = _UnixHTTPServer(str(socket_path), _RequestHandler)
+    else:
+        server = _HTTPServer((host, port), _RequestHandler)
+    server.quiet = quiet
+    server.service = service
+
+    return server
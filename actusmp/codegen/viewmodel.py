@@ -0,0 +1,209 @@
+import dataclasses
+import typing
+
+from actusmp.codegen import convertor
+from actusmp.model import Dictionary
+from actusmp.model import Enum
+from actusmp.model import EnumMember
+from actusmp.model import State
+from actusmp.model import Term
+from actusmp.utils import memo
+
+
+@dataclasses.dataclass(frozen=True)
+class FieldView():
+    """Derived facts of a term or state field rendered by templates.
+
+    N.B. Defaults are held in the form in which templates render them.
+
+    """
+    __slots__ = (
+        "entity",
+        "camel",
+        "pascal",
+        "snake",
+        "py_type",
+        "py_default",
+        "py_column_kind",
+        "py_column_dtype",
+        "rs_type",
+        "rs_default",
+        "ts_type",
+        "ts_default",
+        "ts_optional_flag",
+    )
+
+    # Associated term or state field.
+    entity: typing.Union[Term, State]
+
+    # Camel case name, e.g. ContractRole.
+    camel: str
+
+    # Pascal case name, e.g. contractRole.
+    pascal: str
+
+    # Underscore case name, e.g. contract_role.
+    snake: str
+
+    # Python type declaration, e.g. typing.List[float].
+    py_type: str
+
+    # Python default value.
+    py_default: typing.Optional[str]
+
+    # NumPy column kind, e.g. real | timestamp | enum | cycle | period | object.
+    py_column_kind: str
+
+    # NumPy column dtype declaration, e.g. np.dtype(np.float64).
+    py_column_dtype: str
+
+    # Rust type declaration, e.g. Vec<f64>.
+    rs_type: str
+
+    # Rust default value.
+    rs_default: typing.Optional[str]
+
+    # Typescript type declaration, e.g. Array<number>.
+    ts_type: str
+
+    # Typescript default value.
+    ts_default: typing.Optional[str]
+
+    # Typescript optionality flag, i.e. '?' or ''.
+    ts_optional_flag: str
+
+    @staticmethod
+    def create(names: convertor.NameTable, entity: typing.Union[Term, State]) -> "FieldView":
+        """Factory: returns view over a term or state field."""
+        mangled = names.get(entity.identifier)
+        if isinstance(entity, Term):
+            py_default = str(convertor.to_py_default(entity))
+            rs_default = str(convertor.to_rs_default(entity))
+            ts_default = str(convertor.to_ts_default(entity))
+            ts_optional_flag = convertor.to_ts_optional_flag(entity)
+        else:
+            py_default = rs_default = ts_default = None
+            ts_optional_flag = ""
+        py_column_kind, py_column_dtype = convertor.to_py_column(entity)
+
+        return FieldView(
+            entity=entity,
+            camel=mangled.camel,
+            pascal=mangled.pascal,
+            snake=mangled.snake,
+            py_type=convertor.to_py_type(entity),
+            py_default=py_default,
+            py_column_kind=py_column_kind,
+            py_column_dtype=py_column_dtype,
+            rs_type=convertor.to_rs_type(entity),
+            rs_default=rs_default,
+            ts_type=convertor.to_ts_type(entity),
+            ts_default=ts_default,
+            ts_optional_flag=ts_optional_flag,
+        )
+
+
+@dataclasses.dataclass(frozen=True)
+class EnumMemberView():
+    """Derived facts of an enumeration member rendered by templates.
+
+    """
+    __slots__ = ("member", "symbol")
+
+    # Associated enumeration member.
+    member: EnumMember
+
+    # Language safe member name, e.g. _30E360.
+    symbol: str
+
+
+@dataclasses.dataclass(frozen=True)
+class EnumView():
+    """Derived facts of an enumeration rendered by templates.
+
+    """
+    __slots__ = ("entity", "camel", "pascal", "snake", "members")
+
+    # Associated enumeration, or enumerated term.
+    entity: typing.Union[Enum, Term]
+
+    # Camel case name, e.g. ContractRole.
+    camel: str
+
+    # Pascal case name, e.g. contractRole.
+    pascal: str
+
+    # Underscore case name, e.g. contract_role.
+    snake: str
+
+    # Views over members in declaration order.
+    members: typing.Tuple[EnumMemberView, ...]
+
+    @staticmethod
+    def create(names: convertor.NameTable, entity: typing.Union[Enum, Term]) -> "EnumView":
+        """Factory: returns view over an enumeration."""
+        mangled = names.get(entity.identifier)
+
+        return EnumView(
+            entity=entity,
+            camel=mangled.camel,
+            pascal=mangled.pascal,
+            snake=mangled.snake,
+            members=tuple(EnumMemberView(i, names.get_member_name(i)) for i in entity.members),
+        )
+
+
+class ViewMap(dict):
+    """Map: domain entity <-> view, views of unmapped entities are created upon demand.
+
+    """
+    def __init__(self, factory: typing.Callable[[typing.Any], typing.Any]):
+        """Instance constructor.
+
+        :param factory: Function mapping a domain entity to its view.
+
+        """
+        super().__init__()
+        self.factory = factory
+
+    def __missing__(self, entity: typing.Any) -> typing.Any:
+        """Creates, maps & returns view of an unmapped entity."""
+        return self.setdefault(entity, self.factory(entity))
+
+
+class ViewModel():
+    """Language neutral set of views over a dictionary's fields & enumerations.
+
+    """
+    def __init__(self, names: convertor.NameTable):
+        """Instance constructor.
+
+        :param names: Table of precomputed mangled names.
+
+        """
+        self.names = names
+        self.enums = ViewMap(lambda i: EnumView.create(names, i))
+        self.fields = ViewMap(lambda i: FieldView.create(names, i))
+
+    def __str__(self) -> str:
+        """Instance string representation."""
+        return f"view-model|{len(self.fields)}|{len(self.enums)}"
+
+
+@memo.per_instance
+def get_view_model(dictionary: Dictionary) -> ViewModel:
+    """Returns view model of a dictionary, building it upon first request.
+
+    :param dictionary: ACTUS dictionary wrapper.
+    :returns: View model shared by all templates.
+
+    """
+    view_model = ViewModel(convertor.get_name_table(dictionary))
+    for term in dictionary.term_set:
+        view_model.fields[term]
+    for state in dictionary.state_set:
+        view_model.fields[state]
+    for enum in dictionary.enum_set:
+        view_model.enums[enum]
+
+    return view_model
@@ -0,0 +1,251 @@
+import os
+import pathlib
+import sys
+import time
+import typing
+
+from actusmp.codegen import generator
+from actusmp.codegen import writer
+from actusmp.codegen.enums import TargetGenerator
+from actusmp.codegen.enums import TargetLanguage
+from actusmp.codegen.manifest import WriteSummary
+from actusmp.dictionary import get_dictionary
+from actusmp.dictionary.accessor import get_path
+from actusmp.model import Dictionary
+from actusmp.utils import fsys
+from actusmp.utils import funcindex
+
+
+# Change key: dictionary file.
+CHANGE_DICTIONARY = "dictionary"
+
+# Change key: actus-core functions tree.
+CHANGE_CORE = "core"
+
+# Watch callback: invoked with (changes, summary, elapsed seconds).
+Callback = typing.Callable[[typing.List[str], WriteSummary, float], None]
+
+# Watch error callback: invoked with the error raised by a failed regeneration.
+ErrorCallback = typing.Callable[[Exception], None]
+
+# Generators whose output derives from actus-core functions.
+_CORE_GENERATORS = (TargetGenerator.FuncStubPOF, TargetGenerator.FuncStubSTF)
+
+
+class Pipeline():
+    """A warm generation pipeline that re-renders only output affected by source changes.
+
+    The dictionary, compiled templates, function index & every rendered code block are
+    retained in memory between runs.  Upon a change only the affected (language x
+    generator) pairs are re-rendered, & within those, code blocks whose source entity
+    is unchanged are reused.
+
+    """
+    def __init__(
+        self,
+        langs: typing.Sequence[TargetLanguage],
+        dest: pathlib.Path,
+        path_to_java_impl: pathlib.Path,
+        path_to_dictionary: typing.Optional[pathlib.Path] = None,
+        prune: bool = False
+    ):
+        """Instance constructor.
+
+        :param langs: Target progamming languages.
+        :param dest: Path to directory to which code will be emitted.
+        :param path_to_java_impl: Path to actus-core Java library from which funcs are derived.
+        :param path_to_dictionary: Path to a dictionary file, if omitted the bundled one is used.
+        :param prune: Flag indicating whether stale files are to be deleted.
+
+        """
+        self.dests = writer.get_dests(langs, dest)
+        self.dictionary: typing.Optional[Dictionary] = None
+        self.langs = langs
+        self.path_to_dictionary = get_path(path_to_dictionary)
+        self.path_to_java_impl = path_to_java_impl
+        self.prune = prune
+        self._fingerprints: typing.Dict[str, typing.Any] = {}
+        self._outputs: typing.Dict[
+            typing.Tuple[TargetLanguage, TargetGenerator],
+            typing.List[typing.Tuple[typing.Any, pathlib.Path, str]]
+        ] = {}
+
+    def __str__(self) -> str:
+        """Instance string representation."""
+        return f"pipeline|{','.join(i.name for i in self.langs)}|{len(self._outputs)}"
+
+    def poll(self) -> typing.Optional[typing.Tuple[typing.List[str], WriteSummary]]:
+        """Detects source changes since previous poll & regenerates affected output.
+
+        Fingerprints are retained only once regeneration succeeds, thus a failed run, (e.g.
+        a half saved dictionary or a template syntax error), is retried upon next poll.
+
+        :returns: 2 member tuple: (changed sources, write summary), or None if unchanged.
+
+        """
+        fingerprints = get_fingerprints(self.path_to_dictionary, self.path_to_java_impl)
+        changes = get_changes(self._fingerprints, fingerprints)
+        if not changes:
+            return None
+
+        summary = self.run(changes)
+        self._fingerprints = fingerprints
+
+        return changes, summary
+
+    def run(self, changes: typing.Optional[typing.Sequence[str]] = None) -> WriteSummary:
+        """Regenerates output affected by a set of source changes.
+
+        :param changes: Changed sources, i.e. change keys or template file names.  If
+                        omitted, or upon first run, all output is regenerated.
+        :returns: Summary of written, skipped & stale files.
+
+        """
+        changes = set(changes or [])
+        is_full = self.dictionary is None or not changes
+        if is_full or CHANGE_DICTIONARY in changes:
+            self.dictionary = get_dictionary(path=self.path_to_dictionary)
+
+        for lang in self.langs:
+            for typeof in generator.get_generators(lang):
+                is_template_changed = generator.get_template_name(lang, typeof) in changes
+                if is_full or is_affected(lang, typeof, changes):
+                    self._render(lang, typeof, reuse=not is_full and not is_template_changed)
+
+        code_blocks = (
+            (lang, code_dest, code_block)
+            for (lang, _), outputs in self._outputs.items()
+            for _, code_dest, code_block in outputs
+        )
+
+        return writer.write_code_blocks(code_blocks, self.dests, self.prune, None)
+
+    def _render(self, lang: TargetLanguage, typeof: TargetGenerator, reuse: bool):
+        """Renders a generator's output, reusing code blocks of unchanged entities."""
+        ctx = generator.GeneratorContext(lang, typeof, self.dictionary, self.path_to_java_impl)
+        previous = {i[1]: i for i in self._outputs.get((lang, typeof), [])} if reuse else {}
+        tmpl = None
+
+        outputs = []
+        for entity in generator.get_entities(ctx):
+            code_dest = writer.get_path_to_code_dest(self.dests[lang], ctx, entity)
+            output = previous.get(code_dest)
+            if output is None or isinstance(entity, Dictionary) or output[0] != entity:
+                tmpl = tmpl or generator.get_template(ctx)
+                output = (entity, code_dest, generator.render(ctx, entity, tmpl))
+            outputs.append(output)
+
+        self._outputs[(lang, typeof)] = outputs
+
+
+def watch(
+    pipeline: Pipeline,
+    interval: float = 0.5,
+    callback: typing.Optional[Callback] = None,
+    on_error: typing.Optional[ErrorCallback] = None
+):
+    """Polls a pipeline's sources & regenerates affected output until interrupted.
+
+    A failed regeneration is reported, (once until it changes or succeeds), & retried upon
+    each subsequent poll, thus watching survives transient errors in edited sources.
+
+    N.B. Polling is used, (rather than inotify & co), as it is portable & dependency free.
+
+    :param pipeline: Warm generation pipeline.
+    :param interval: Seconds between polls.
+    :param callback: Invoked after each regeneration with (changes, summary, elapsed seconds).
+    :param on_error: Invoked with the error of a failed regeneration, defaults to stderr.
+
+    """
+    last_error = None
+    while True:
+        started_at = time.perf_counter()
+        try:
+            result = pipeline.poll()
+        except Exception as err:
+            error = f"{type(err).__name__}: {err}"
+            if error != last_error:
+                (on_error or _print_error)(err)
+            last_error = error
+        else:
+            last_error = None
+            if result is not None and callback is not None:
+                callback(result[0], result[1], time.perf_counter() - started_at)
+        time.sleep(interval)
+
+
+def get_changes(previous: dict, current: dict) -> typing.List[str]:
+    """Returns sources whose fingerprints differ between two snapshots.
+
+    :param previous: Previous map: source <-> fingerprint.
+    :param current: Current map: source <-> fingerprint.
+    :returns: Ordered set of changed sources.
+
+    """
+    return sorted(
+        k for k in set(previous) | set(current) if previous.get(k) != current.get(k)
+    )
+
+
+def get_fingerprints(
+    path_to_dictionary: pathlib.Path,
+    path_to_java_impl: pathlib.Path
+) -> typing.Dict[str, typing.Any]:
+    """Returns map: source <-> stat based fingerprint, sources being the dictionary file,
+    the actus-core functions tree & each template file.
+
+    :param path_to_dictionary: Path to a dictionary file.
+    :param path_to_java_impl: Path to actus-core Java library.
+    :returns: Map of fingerprints keyed by change key or template file name.
+
+    """
+    fingerprints = {
+        CHANGE_CORE: funcindex.get_fingerprint(path_to_java_impl),
+        CHANGE_DICTIONARY: _get_stat(path_to_dictionary),
+    }
+    with os.scandir(fsys.TEMPLATES_DIR) as entries:
+        for entry in entries:
+            fingerprints[entry.name] = _get_stat(entry.path)
+
+    return fingerprints
+
+
+def is_affected(
+    lang: TargetLanguage,
+    typeof: TargetGenerator,
+    changes: typing.Collection[str]
+) -> bool:
+    """Predicate: returns true if a generator's output is affected by a set of source changes.
+
+    :param lang: Target programming language.
+    :param typeof: Target generator type.
+    :param changes: Changed sources, i.e. change keys or template file names.
+    :returns: True if generator output must be re-rendered.
+
+    """
+    if CHANGE_DICTIONARY in changes:
+        return True
+    if CHANGE_CORE in changes and typeof in _CORE_GENERATORS:
+        return True
+
+    return generator.get_template_name(lang, typeof) in changes
+
+
+def _print_error(err: Exception):
+    """Reports a failed regeneration to stderr.
+
+    """
+    print(f"ERROR: regeneration failed, retrying upon next poll :: {type(err).__name__}: {err}",
+          file=sys.stderr)
+
+
+def _get_stat(fpath: typing.Union[str, pathlib.Path]) -> typing.Optional[typing.Tuple[int, int]]:
+    """Returns (mtime, size) of a file, or None if it does not exist.
+
+    """
+    try:
+        stat = os.stat(fpath)
+    except OSError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
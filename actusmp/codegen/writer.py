@@ -1,36 +1,166 @@
+import concurrent.futures
+import functools
+import os
 import pathlib
+import typing
 
-from actusmp.codegen import convertor
 from actusmp.codegen import generator
 from actusmp.codegen.enums import TargetGenerator
 from actusmp.codegen.enums import TargetLanguage
+from actusmp.codegen.manifest import Manifest
+from actusmp.codegen.manifest import WriteSummary
 from actusmp.dictionary import get_dictionary
-from actusmp.utils import fsys
+from actusmp.model import Dictionary
+from actusmp.utils import profiler
+from actusmp.utils import sinks
 
+if typing.TYPE_CHECKING:
+    import jinja2
 
-def write(lang: TargetLanguage, dest: pathlib.Path, path_to_java_impl: pathlib.Path):
+
+# Worker process state: dictionary plus map: target language <-> output directory.
+# N.B. set only within pool worker processes, in-process & thread renders are passed state.
+_WORKER_STATE: dict = {}
+
+
+@profiler.timed("codegen.write")
+def write(
+    lang: TargetLanguage,
+    dest: pathlib.Path,
+    path_to_java_impl: pathlib.Path,
+    dictionary: typing.Optional[Dictionary] = None,
+    prune: bool = False,
+    sink: typing.Optional[sinks.Sink] = None
+) -> WriteSummary:
     """Writes to file system a set of code blocks to initialise an upstream library.
 
+    Files whose content is unchanged since the previous run are not rewritten, thus
+    downstream incremental builds only observe real changes.
+
     :param lang: Target progamming language.
     :param dest: Path to directory to which code will be emitted.
     :param path_to_java_impl: Path to actus-code Java library from which funcs will be derived.
+    :param dictionary: A previously loaded dictionary, if omitted the bundled one is loaded.
+    :param prune: Flag indicating whether previously generated files no longer emitted
+                  by any generator are to be deleted.
+    :param sink: Output sink, defaults to a batched file system sink.  A sink passed by
+                 the caller is flushed but not closed.
+    :returns: Summary of written, skipped & stale files.
 
     """
     assert lang in TargetLanguage
     assert dest.exists and dest.is_dir
     assert path_to_java_impl.exists() and path_to_java_impl.is_dir()
 
-    dictionary = get_dictionary()
-    for typeof in TargetGenerator:
-        ctx = generator.GeneratorContext(lang, typeof, dictionary, path_to_java_impl)
-        for code_block, entity in generator.generate(ctx):
-            code_dest = _get_path_to_code_dest(dest, ctx, entity)
-            fsys.write(code_dest, code_block)
+    def _yield_code_blocks():
+        for typeof in generator.get_generators(lang):
+            ctx = generator.GeneratorContext(lang, typeof, dictionary, path_to_java_impl)
+            tmpl = generator.get_template(ctx)
+            for entity in generator.get_entities(ctx):
+                code_dest = get_path_to_code_dest(dest, ctx, entity)
+                yield lang, code_dest, _render(ctx, entity, tmpl)
+
+    dictionary = dictionary or get_dictionary()
+
+    return write_code_blocks(_yield_code_blocks(), {lang: dest}, prune, sink)
+
+
+@profiler.timed("codegen.write_many")
+def write_many(
+    langs: typing.Sequence[TargetLanguage],
+    dest: pathlib.Path,
+    path_to_java_impl: pathlib.Path,
+    jobs: typing.Optional[int] = None,
+    use_threads: bool = False,
+    prune: bool = False,
+    sink: typing.Optional[sinks.Sink] = None,
+    dictionary: typing.Optional[Dictionary] = None
+) -> WriteSummary:
+    """Writes to file system code blocks for several languages using a pool of workers.
+
+    The dictionary is loaded once & the (language x generator x entity) work set is fanned
+    out to the pool.  Each work item renders a single file which is passed back, in
+    work set order, to the sink, thus output is identical to that of a serial run.
+    When several languages are targeted, each is written to a sub-directory of dest
+    named after the language.
+
+    :param langs: Target progamming languages.
+    :param dest: Path to directory to which code will be emitted.
+    :param path_to_java_impl: Path to actus-code Java library from which funcs will be derived.
+    :param jobs: Number of workers, defaults to number of CPUs.  If 1 work is done in-process.
+    :param use_threads: Flag indicating whether a thread pool is used rather than processes.
+    :param prune: Flag indicating whether previously generated files no longer emitted
+                  by any generator are to be deleted.
+    :param sink: Output sink, defaults to a batched file system sink.  A sink passed by
+                 the caller is flushed but not closed.
+    :param dictionary: A previously loaded dictionary, if omitted the bundled one is loaded.
+    :returns: Summary of written, skipped & stale files.
+
+    """
+    assert len(langs) > 0 and all(i in TargetLanguage for i in langs)
+    assert dest.exists and dest.is_dir
+    assert path_to_java_impl.exists() and path_to_java_impl.is_dir()
+
+    dictionary = dictionary or get_dictionary()
+    dests = get_dests(langs, dest)
+
+    # Set work items: (language, generator, entity) - entity None implies dictionary.
+    items = []
+    for lang in langs:
+        for typeof in generator.get_generators(lang):
+            ctx = generator.GeneratorContext(lang, typeof, dictionary, path_to_java_impl)
+            for entity in generator.get_entities(ctx):
+                items.append((lang, typeof, None if entity is dictionary else entity))
 
+    jobs = jobs or os.cpu_count() or 1
+    state = _get_worker_state(dictionary, dests, path_to_java_impl)
+    if jobs == 1:
+        code_blocks = map(functools.partial(_render_item, state=state, stream=True), items)
+        return write_code_blocks(code_blocks, dests, prune, sink)
 
-def _get_path_to_code_dest(dest: pathlib.Path, ctx: generator.GeneratorContext, entity):
+    if use_threads:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+            code_blocks = pool.map(functools.partial(_render_item, state=state), items)
+            return write_code_blocks(code_blocks, dests, prune, sink)
+
+    # N.B. when profiling, workers trace renders & pass their spans back with each item.
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(state, profiler.get_origin())
+    ) as pool:
+        chunksize = max(1, len(items) // (jobs * 4))
+        if profiler.is_enabled():
+            traced = pool.map(_render_item_traced, items, chunksize=chunksize)
+            code_blocks = _merge_traces(traced)
+        else:
+            code_blocks = pool.map(_render_item, items, chunksize=chunksize)
+
+        return write_code_blocks(code_blocks, dests, prune, sink)
+
+
+def get_dests(
+    langs: typing.Sequence[TargetLanguage],
+    dest: pathlib.Path
+) -> typing.Dict[TargetLanguage, pathlib.Path]:
+    """Returns map: target language <-> output directory.
+
+    :param langs: Target progamming languages.
+    :param dest: Path to directory to which code will be emitted.
+    :returns: Map of output directories, if several languages each is a sub-directory of dest.
+
+    """
+    return {i: dest / i.name if len(langs) > 1 else dest for i in langs}
+
+
+def get_path_to_code_dest(dest: pathlib.Path, ctx: generator.GeneratorContext, entity):
     """Returns file system location to which code block will be written.
 
+    :param dest: Path to directory to which code will be emitted.
+    :param ctx: Generator context.
+    :param entity: Entity from which code block is rendered.
+    :returns: Path to code block's output file.
+
     """
     if ctx.typeof in (TargetGenerator.FuncStubPOF, TargetGenerator.FuncStubSTF):
         return _get_path_to_code_dest_2(dest, ctx, entity)
@@ -38,13 +168,166 @@ def _get_path_to_code_dest(dest: pathlib.Path, ctx: generator.GeneratorContext,
         return _get_path_to_code_dest_1(dest, ctx, entity)
 
 
+def write_code_blocks(
+    code_blocks: typing.Iterable[
+        typing.Tuple[TargetLanguage, pathlib.Path, typing.Union[str, typing.Iterator[str]]]
+    ],
+    dests: typing.Dict[TargetLanguage, pathlib.Path],
+    prune: bool,
+    sink: typing.Optional[sinks.Sink]
+) -> WriteSummary:
+    """Writes a sequence of rendered code blocks, (strings or chunk streams), to a sink.
+
+    A content-hash manifest is maintained only when writing to the file system, other
+    sinks receive every code block.
+
+    :param code_blocks: Iterator over (target language, output file, code block).
+    :param dests: Map: target language <-> output directory.
+    :param prune: Flag indicating whether stale files are to be deleted.
+    :param sink: Sink to which code blocks are written, defaults to file system.
+    :returns: Summary of written, skipped & stale files.
+
+    """
+    owns_sink = sink is None
+    if owns_sink:
+        sink = sinks.FileSystemSink()
+    if isinstance(sink, sinks.FileSystemSink):
+        manifests = {k: Manifest.load(v) for k, v in dests.items()}
+    else:
+        manifests = {}
+
+    results = {i: [] for i in dests}
+    try:
+        for lang, code_dest, code_block in code_blocks:
+            if isinstance(code_block, str):
+                if lang in manifests:
+                    entry, is_written = manifests[lang].write(code_dest, code_block, sink)
+                else:
+                    sink.write(code_dest, code_block)
+                    entry, is_written = None, True
+            elif lang in manifests:
+                entry, is_written = manifests[lang].write_chunks(code_dest, code_block, sink)
+            else:
+                entry, is_written = None, sink.write_chunks(code_dest, code_block)
+            results[lang].append((code_dest, entry, is_written))
+    finally:
+        with profiler.span("io.flush"):
+            if owns_sink:
+                sink.close()
+            else:
+                sink.flush()
+
+    summary = WriteSummary()
+    for lang, lang_results in results.items():
+        if lang in manifests:
+            stale = manifests[lang].commit({i[0]: i[1] for i in lang_results}, prune)
+        else:
+            stale = []
+        summary.extend(WriteSummary(
+            written=[i[0] for i in lang_results if i[2]],
+            skipped=[i[0] for i in lang_results if not i[2]],
+            stale=stale,
+            pruned=prune
+        ))
+
+    return summary
+
+
+def _get_worker_state(
+    dictionary: Dictionary,
+    dests: typing.Dict[TargetLanguage, pathlib.Path],
+    path_to_java_impl: pathlib.Path
+) -> dict:
+    """Returns state shared by the work items of a single write_many call.
+
+    """
+    return {
+        "dictionary": dictionary,
+        "dests": dests,
+        "path_to_java_impl": path_to_java_impl,
+    }
+
+
+def _init_worker(state: dict, profile_origin: typing.Optional[int] = None):
+    """Initialises state shared by work items processed within a worker process.
+
+    N.B. a forked worker inherits a copy of the parent's profile, which is replaced so that
+    only the worker's own spans are passed back.
+
+    """
+    _WORKER_STATE.update(state)
+    if profile_origin is None:
+        profiler.stop()
+    else:
+        profiler.start(profile_origin)
+
+
+def _render(
+    ctx: generator.GeneratorContext,
+    entity: typing.Any,
+    tmpl: typing.Optional["jinja2.Template"] = None
+) -> typing.Union[str, typing.Iterator[str]]:
+    """Renders a single entity, dictionary level code blocks, (i.e. indexes), are streamed.
+
+    """
+    if isinstance(entity, Dictionary):
+        return generator.render_stream(ctx, entity, tmpl)
+
+    return generator.render(ctx, entity, tmpl)
+
+
+def _merge_traces(
+    traced: typing.Iterable[typing.Tuple[TargetLanguage, pathlib.Path, str, profiler.Trace]]
+) -> typing.Iterator[typing.Tuple[TargetLanguage, pathlib.Path, str]]:
+    """Yields rendered work items, merging spans traced by workers into the active profile.
+
+    """
+    for lang, code_dest, code_block, trace in traced:
+        profiler.merge(trace)
+        yield lang, code_dest, code_block
+
+
+def _render_item(
+    item: typing.Tuple[TargetLanguage, TargetGenerator, typing.Any],
+    state: typing.Optional[dict] = None,
+    stream: bool = False
+) -> typing.Tuple[TargetLanguage, pathlib.Path, typing.Union[str, typing.Iterator[str]]]:
+    """Renders a single work item, streamed if in-process as chunks cannot be pickled.
+
+    """
+    state = _WORKER_STATE if state is None else state
+    lang, typeof, entity = item
+    dictionary = state["dictionary"]
+    entity = dictionary if entity is None else entity
+
+    path_to_java_impl = state["path_to_java_impl"]
+    ctx = generator.GeneratorContext(lang, typeof, dictionary, path_to_java_impl)
+    code_dest = get_path_to_code_dest(state["dests"][lang], ctx, entity)
+
+    if stream:
+        return lang, code_dest, _render(ctx, entity)
+
+    return lang, code_dest, generator.render(ctx, entity)
+
+
+def _render_item_traced(
+    item: typing.Tuple[TargetLanguage, TargetGenerator, typing.Any]
+) -> typing.Tuple[TargetLanguage, pathlib.Path, str, typing.Optional[profiler.Trace]]:
+    """Renders a single work item within a profiled worker process, returning its spans.
+
+    """
+    return _render_item(item) + (profiler.drain(),)
+
+
 def _get_path_to_code_dest_1(dest: pathlib.Path, ctx: generator.GeneratorContext, entity):
     """Returns file system location to which code block will be written.
 
     """
     if ctx.lang == TargetLanguage.python:
-        if ctx.typeof == TargetGenerator.Enum:
-            fname = f"{convertor.to_underscore_case(entity.identifier)}.py"
+        if ctx.typeof == TargetGenerator.BatchIndex:
+            return dest / "types" / "batches" / "__init__.py"
+        elif ctx.typeof == TargetGenerator.Enum:
+            fname = f"{ctx.names.to_underscore_case(entity.identifier)}.py"
             return dest / "types" / "enums" / fname
         elif ctx.typeof == TargetGenerator.EnumIndex:
             return dest / "types" / "enums" / "__init__.py"
@@ -56,15 +339,25 @@ def _get_path_to_code_dest_1(dest: pathlib.Path, ctx: generator.GeneratorContext
             return dest / "algos" / f"{entity.type_info.acronym.lower()}" / "main.py"
         elif ctx.typeof == TargetGenerator.StateSpace:
             return dest / "types" / "core" / "states.py"
+        elif ctx.typeof == TargetGenerator.StateSpaceBatch:
+            return dest / "types" / "batches" / "states.py"
         elif ctx.typeof == TargetGenerator.Termset:
-            fname = f"{convertor.to_underscore_case(entity.type_info.acronym.lower())}.py"
+            fname = f"{ctx.names.to_underscore_case(entity.type_info.acronym.lower())}.py"
             return dest / "types" / "terms" / fname
+        elif ctx.typeof == TargetGenerator.TermsetBatch:
+            fname = f"{ctx.names.to_underscore_case(entity.type_info.acronym.lower())}.py"
+            return dest / "types" / "batches" / fname
+        elif ctx.typeof == TargetGenerator.TermsetDecoder:
+            fname = f"{ctx.names.to_underscore_case(entity.type_info.acronym.lower())}.py"
+            return dest / "types" / "decoders" / fname
+        elif ctx.typeof == TargetGenerator.TermsetDecoderIndex:
+            return dest / "types" / "decoders" / "__init__.py"
         elif ctx.typeof == TargetGenerator.TermsetIndex:
             return dest / "types" / "terms" / "__init__.py"
 
     elif ctx.lang == TargetLanguage.rust:
         if ctx.typeof == TargetGenerator.Enum:
-            fname = f"{convertor.to_underscore_case(entity.identifier)}.rs"
+            fname = f"{ctx.names.to_underscore_case(entity.identifier)}.rs"
             return dest / "types" / "enums" / fname
         elif ctx.typeof == TargetGenerator.EnumIndex:
             return dest / "types" / "enums" / "mod.rs"
@@ -77,14 +370,14 @@ def _get_path_to_code_dest_1(dest: pathlib.Path, ctx: generator.GeneratorContext
         elif ctx.typeof == TargetGenerator.StateSpace:
             return dest / "types" / "core" / "states.rs"
         elif ctx.typeof == TargetGenerator.Termset:
-            fname = f"{convertor.to_underscore_case(entity.type_info.acronym.lower())}.rs"
+            fname = f"{ctx.names.to_underscore_case(entity.type_info.acronym.lower())}.rs"
             return dest / "types" / "terms" / fname
         elif ctx.typeof == TargetGenerator.TermsetIndex:
             return dest / "types" / "terms" / "mod.rs"
 
     elif ctx.lang == TargetLanguage.typescript:
         if ctx.typeof == TargetGenerator.Enum:
-            return dest / "types" / "enums" / f"{convertor.to_pascal_case(entity.identifier)}.ts"
+            return dest / "types" / "enums" / f"{ctx.names.to_pascal_case(entity.identifier)}.ts"
         elif ctx.typeof == TargetGenerator.EnumIndex:
             return dest / "types" / "enums" / "index.ts"
         elif ctx.typeof == TargetGenerator.FuncIndex:
@@ -96,7 +389,7 @@ def _get_path_to_code_dest_1(dest: pathlib.Path, ctx: generator.GeneratorContext
         elif ctx.typeof == TargetGenerator.StateSpace:
             return dest / "types" / "core" / "states.ts"
         elif ctx.typeof == TargetGenerator.Termset:
-            fname = f"{convertor.to_pascal_case(entity.type_info.acronym.lower())}.ts"
+            fname = f"{ctx.names.to_pascal_case(entity.type_info.acronym.lower())}.ts"
             return dest / "types" / "terms" / fname
         elif ctx.typeof == TargetGenerator.TermsetIndex:
             return dest / "types" / "terms" / "index.ts"
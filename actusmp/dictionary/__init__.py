@@ -1 +1,2 @@
 from actusmp.dictionary.factory import get_dictionary
+from actusmp.dictionary.registry import Registry
@@ -5,6 +5,8 @@ import pathlib
 import typing
 
 from actusmp.dictionary.parser import parse
+from actusmp.dictionary.parser import strip_descriptions
+from actusmp.utils import profiler
 
 
 # Path to actus-dictionary.json file.
@@ -15,9 +17,21 @@ class Accessor():
     """Encapsulates access to actus-dictionary.json.
 
     """
-    def __init__(self):
-        with open(_FILE, "r") as fstream:
-            self._obj: dict = parse(json.loads(fstream.read()))
+    def __init__(self, content: typing.Optional[bytes] = None, slim: bool = False):
+        """Instance constructor.
+
+        :param content: Raw dictionary content, if omitted the bundled file is read.
+        :param slim: Flag indicating whether long text descriptions are to be dropped.
+
+        """
+        with profiler.span("dictionary.accessor"):
+            if content is None:
+                content = read_content()
+            with profiler.span("dictionary.json_load", size=len(content)):
+                obj = json.loads(content)
+            self._obj: dict = parse(obj)
+            if slim:
+                strip_descriptions(self._obj)
 
     @property
     def applicability(self) -> typing.List[dict]:
@@ -66,3 +80,24 @@ class Accessor():
     @property
     def version_date(self) -> datetime.datetime:
         return datetime.datetime.fromisoformat(self._obj["version"]["Date"])
+
+
+def get_path(fpath: typing.Optional[pathlib.Path] = None) -> pathlib.Path:
+    """Returns path to an actus-dictionary.json file.
+
+    :param fpath: Path to a dictionary file, if omitted the bundled file path is returned.
+    :returns: Path to a dictionary file.
+
+    """
+    return pathlib.Path(fpath) if fpath else _FILE
+
+
+def read_content(fpath: typing.Optional[pathlib.Path] = None) -> bytes:
+    """Returns raw content of an actus-dictionary.json file.
+
+    :param fpath: Path to a dictionary file, if omitted the bundled file is read.
+    :returns: Raw file content.
+
+    """
+    with open(get_path(fpath), "rb") as fstream:
+        return fstream.read()
@@ -0,0 +1,97 @@
+import hashlib
+import os
+import pathlib
+import pickle
+import tempfile
+import typing
+
+import actusmp
+from actusmp.model import Dictionary
+from actusmp.utils import fsys
+from actusmp.utils import profiler
+
+
+# Snapshot layout version - bump whenever the meta-model's pickled shape changes.
+_SNAPSHOT_FORMAT = 2
+
+# Snapshot file name prefix.
+_SNAPSHOT_PREFIX = "dictionary-"
+
+# Snapshot file name suffix.
+_SNAPSHOT_SUFFIX = ".pickle"
+
+
+def is_enabled() -> bool:
+    """Returns flag indicating whether dictionary snapshots are enabled.
+
+    """
+    return fsys.is_cache_enabled()
+
+
+def get_key(content: bytes, slim: bool = False) -> str:
+    """Returns snapshot key derived from dictionary content & library version.
+
+    :param content: Raw content of an actus-dictionary.json file.
+    :param slim: Flag indicating whether snapshot is of a slim dictionary load.
+    :returns: Hex digest uniquely identifying a snapshot.
+
+    """
+    hasher = hashlib.sha256(content)
+    hasher.update(f"|{actusmp.__version__}|{_SNAPSHOT_FORMAT}|{slim}".encode("utf-8"))
+
+    return hasher.hexdigest()
+
+
+@profiler.timed("dictionary.snapshot_read")
+def read(key: str) -> typing.Optional[Dictionary]:
+    """Returns a previously written dictionary snapshot.
+
+    :param key: Snapshot key.
+    :returns: A dictionary if a valid snapshot exists, else None.
+
+    """
+    fpath = _get_path(key)
+    try:
+        with open(fpath, "rb") as fstream:
+            obj = pickle.load(fstream)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, AttributeError, ImportError, pickle.UnpicklingError):
+        # Unreadable or incompatible snapshots are simply rebuilt.
+        return None
+
+    return obj if isinstance(obj, Dictionary) else None
+
+
+@profiler.timed("dictionary.snapshot_write")
+def write(key: str, dictionary: Dictionary):
+    """Atomically writes a dictionary snapshot.
+
+    The snapshot is written to a temporary file within the cache directory and then
+    renamed into place, so concurrent readers & writers never observe a partial file.
+
+    :param key: Snapshot key.
+    :param dictionary: A fully built dictionary.
+
+    """
+    fpath = _get_path(key)
+    fpath_tmp = None
+    try:
+        fpath.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=fpath.parent, prefix=f".{fpath.name}.", delete=False
+        ) as fstream:
+            fpath_tmp = fstream.name
+            pickle.dump(dictionary, fstream, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(fpath_tmp, fpath)
+    except OSError:
+        # A read-only or full cache directory must not break dictionary loading.
+        if fpath_tmp is not None and os.path.exists(fpath_tmp):
+            os.unlink(fpath_tmp)
+
+
+def _get_path(key: str) -> pathlib.Path:
+    """Returns path to a snapshot file.
+
+    """
+    return fsys.get_cache_dir() / f"{_SNAPSHOT_PREFIX}{key}{_SNAPSHOT_SUFFIX}"
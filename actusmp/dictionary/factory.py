@@ -1,6 +1,10 @@
+import functools
+import pathlib
 import typing
 
+from actusmp.dictionary import cache
 from actusmp.dictionary.accessor import Accessor
+from actusmp.dictionary.accessor import read_content
 from actusmp.model import ApplicableTermInfoSet
 from actusmp.model import ApplicableTermInfo
 from actusmp.model import Contract
@@ -8,6 +12,7 @@ from actusmp.model import ContractSet
 from actusmp.model import Dictionary
 from actusmp.model import Enum
 from actusmp.model import EnumMember
+from actusmp.model import LazyDictionary
 from actusmp.model import ContractTypeInfo
 from actusmp.model import ContractTypePublicationStatus
 from actusmp.model import ScalarType
@@ -16,32 +21,100 @@ from actusmp.model import StateSet
 from actusmp.model import Taxonomy
 from actusmp.model import Term
 from actusmp.model import TermSet
+from actusmp.utils import profiler
 
 
-def get_dictionary() -> Dictionary:
+def get_dictionary(
+    use_cache: bool = True,
+    lazy: bool = False,
+    slim: bool = False,
+    path: typing.Optional[pathlib.Path] = None
+) -> Dictionary:
     """Maps actus-dictionary.json file -> meta model.
 
+    When caching is enabled a binary snapshot of the built dictionary is keyed by a
+    hash of the json content, thus subsequent loads skip decoding, parsing & mapping.
+
+    When lazy, and no snapshot is available, each dictionary section is built upon
+    first access, thus callers pay only for those sections they actually use.
+
+    :param use_cache: Flag indicating whether a dictionary snapshot may be used.
+    :param lazy: Flag indicating whether dictionary sections are to be built on demand.
+    :param slim: Flag indicating whether long text descriptions are to be dropped.
+    :param path: Path to a dictionary file, if omitted the bundled file is loaded.
+    :returns: Dictionary meta model.
+
     """
-    accessor = Accessor()
-    applicability = _get_applicability(accessor)
-    taxonomy = _get_taxonomy(accessor)
-    term_set = _get_term_set(accessor)
-
-    return Dictionary(
-        applicability=applicability,
-        contract_event_type=_get_enum(accessor.contract_event_type),
-        contract_performance=_get_enum(accessor.contract_performance),
-        contract_role=_get_enum(accessor.contract_role),
-        contract_reference_role=_get_enum(accessor.contract_reference_role),
-        contract_reference_type=_get_enum(accessor.contract_reference_type),
-        contract_type=_get_enum(accessor.contract_type),
-        contract_set=_get_contract_set(applicability, taxonomy, term_set),
-        state_set=_get_state_set(accessor),
-        taxonomy=taxonomy,
-        term_set=term_set,
-        version=accessor.version,
-        version_date=accessor.version_date
-        )
+    return get_dictionary_from_content(read_content(path), use_cache, lazy, slim)
+
+
+@profiler.timed("dictionary.get_dictionary")
+def get_dictionary_from_content(
+    content: bytes,
+    use_cache: bool = True,
+    lazy: bool = False,
+    slim: bool = False
+) -> Dictionary:
+    """Maps raw actus-dictionary.json content -> meta model.
+
+    :param content: Raw content of an actus-dictionary.json file.
+    :param use_cache: Flag indicating whether a dictionary snapshot may be used.
+    :param lazy: Flag indicating whether dictionary sections are to be built on demand.
+    :param slim: Flag indicating whether long text descriptions are to be dropped.
+    :returns: Dictionary meta model.
+
+    """
+    use_cache = use_cache and cache.is_enabled()
+
+    key = cache.get_key(content, slim) if use_cache else None
+    dictionary = cache.read(key) if use_cache else None
+    if dictionary is not None:
+        profiler.count("dictionary.snapshot_hits")
+        return dictionary
+
+    dictionary = LazyDictionary(_get_sections(content, slim))
+    if lazy:
+        return dictionary
+
+    dictionary = dictionary.materialize()
+    if use_cache:
+        cache.write(key, dictionary)
+
+    return dictionary
+
+
+def _get_sections(content: bytes, slim: bool) -> typing.Dict[str, typing.Callable]:
+    """Returns map: dictionary attribute name <-> memoized section factory.
+
+    """
+    def _memoize(func: typing.Callable) -> typing.Callable:
+        return functools.lru_cache(maxsize=None)(func)
+
+    def _timed(name: str, func: typing.Callable) -> typing.Callable:
+        return profiler.timed(f"dictionary.build.{name}")(func)
+
+    accessor = _memoize(lambda: Accessor(content, slim))
+    applicability = _memoize(_timed("applicability", lambda: _get_applicability(accessor())))
+    taxonomy = _memoize(_timed("taxonomy", lambda: _get_taxonomy(accessor())))
+    term_set = _memoize(_timed("term_set", lambda: _get_term_set(accessor())))
+
+    return {
+        "applicability": applicability,
+        "contract_event_type": lambda: _get_enum(accessor().contract_event_type),
+        "contract_performance": lambda: _get_enum(accessor().contract_performance),
+        "contract_role": lambda: _get_enum(accessor().contract_role),
+        "contract_reference_role": lambda: _get_enum(accessor().contract_reference_role),
+        "contract_reference_type": lambda: _get_enum(accessor().contract_reference_type),
+        "contract_type": lambda: _get_enum(accessor().contract_type),
+        "contract_set": _timed(
+            "contract_set", lambda: _get_contract_set(applicability(), taxonomy(), term_set())
+        ),
+        "state_set": _timed("state_set", lambda: _get_state_set(accessor())),
+        "taxonomy": taxonomy,
+        "term_set": term_set,
+        "version": lambda: accessor().version,
+        "version_date": lambda: accessor().version_date,
+    }
 
 
 def _get_applicability(accessor: Accessor) -> ApplicableTermInfoSet:
@@ -72,12 +145,12 @@ def _get_contract_set(
     """Decodes set of derived contract declarations.
 
     """
+    index = applicability.get_index()
+
     def _map_termset(type_info: ContractTypeInfo) -> TermSet:
-        contract_termset = []
-        for applicable_term_info in applicability.get_applicable_termset(type_info):
-            contract_termset.append(term_set.get_term(applicable_term_info.term_id))
+        infos = index.get(type_info.identifier, [])
 
-        return TermSet(contract_termset)
+        return TermSet([term_set.get_term(i.term_id) for i in infos])
 
     def _map_contract(type_info: ContractTypeInfo) -> Contract:
         return Contract(
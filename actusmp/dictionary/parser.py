@@ -1,4 +1,9 @@
+import typing
 
+from actusmp.utils import profiler
+
+
+@profiler.timed("dictionary.parse")
 def parse(obj: dict):
     """Parses ACTUS dictionary so as to simplify upstream processing consistency.
 
@@ -11,6 +16,21 @@ def parse(obj: dict):
     return obj
 
 
+def strip_descriptions(obj: typing.Union[dict, list]):
+    """Blanks long text descriptions so as to reduce memory footprint of a slim load.
+
+    """
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if key == "description" and isinstance(value, str):
+                obj[key] = ""
+            else:
+                strip_descriptions(value)
+    elif isinstance(obj, list):
+        for value in obj:
+            strip_descriptions(value)
+
+
 def _parse_contract_reference_enums(obj: dict):
     """Parses contract reference enum declarations.
 
@@ -26,21 +46,17 @@ def _parse_contract_types(obj: dict):
     # Collection of unsupported contract types.
     unsupported = []
 
+    # Set of contract types defined in terms.
+    defined = {i["acronym"] for i in obj["terms"]["contractType"]["allowedValues"]}
+
     # Iterate taxonomy and cache unsupported.
     for taxonomy_item in obj["taxonomy"].values():
         # Exclude ill-defined.
         if taxonomy_item["acronym"] == "EXOTi":
             continue
 
-        # Determine whether in taxonomy but not in terms.
-        is_defined = False
-        for contract_type in obj["terms"]["contractType"]["allowedValues"]:
-            if taxonomy_item["acronym"] == contract_type["acronym"]:
-                is_defined = True
-                break
-
-        # If not defined in terms then add to collection.
-        if not is_defined:
+        # If in taxonomy but not defined in terms then add to collection.
+        if taxonomy_item["acronym"] not in defined:
             unsupported.append(taxonomy_item)
 
     # Extend contract type enum but set option to a negative number.
@@ -0,0 +1,169 @@
+import collections
+import pathlib
+import threading
+import typing
+
+from actusmp.dictionary import cache
+from actusmp.dictionary.accessor import read_content
+from actusmp.dictionary.factory import get_dictionary_from_content
+from actusmp.model import Dictionary
+from actusmp.model import Entity
+
+
+# Dictionary attributes holding enumerations.
+_ENUM_ATTRS = (
+    "contract_event_type",
+    "contract_performance",
+    "contract_role",
+    "contract_reference_role",
+    "contract_reference_type",
+    "contract_type",
+)
+
+
+class Registry():
+    """A set of dictionary versions loaded on demand & retained in a bounded LRU cache.
+
+    Identical frozen entities, (e.g. an enum unchanged between versions), are shared
+    across all retained dictionaries so that serving several versions from a single
+    process does not duplicate memory.
+
+    """
+    def __init__(self, maxsize: int = 4, slim: bool = False):
+        """Instance constructor.
+
+        :param maxsize: Maximum number of parsed dictionaries retained in memory.
+        :param slim: Flag indicating whether long text descriptions are to be dropped.
+
+        """
+        assert maxsize > 0
+
+        self.maxsize = maxsize
+        self.slim = slim
+        self._cache: typing.OrderedDict[str, Dictionary] = collections.OrderedDict()
+        self._lock = threading.RLock()
+        self._paths: typing.Dict[str, pathlib.Path] = {}
+        self._pool: dict = {}
+
+    def __contains__(self, version_id: str) -> bool:
+        """Predicate: returns true if a version identifier has been registered."""
+        return version_id in self._paths
+
+    def __len__(self) -> int:
+        """Instance iterator length."""
+        return len(self._cache)
+
+    def __str__(self) -> str:
+        """Instance string representation."""
+        return f"dictionary-registry|{len(self._paths)}|{len(self)}/{self.maxsize}"
+
+    def clear(self):
+        """Evicts all retained dictionaries."""
+        with self._lock:
+            self._cache.clear()
+            self._pool.clear()
+
+    def get(
+        self,
+        version_id: typing.Optional[typing.Union[str, pathlib.Path]] = None
+    ) -> Dictionary:
+        """Returns a dictionary matched either by registered version identifier or by path.
+
+        The source file is re-hashed upon each call, thus edits to a registered file
+        are picked up automatically whilst unchanged files are served from memory.
+
+        :param version_id: A registered version identifier or a path to a dictionary file.
+                           If omitted the bundled dictionary is returned.
+        :returns: Dictionary meta model.
+
+        """
+        content = read_content(self.get_path(version_id))
+        key = cache.get_key(content, self.slim)
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+            dictionary = get_dictionary_from_content(content, slim=self.slim)
+            self._share(dictionary)
+            self._cache[key] = dictionary
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+                self._rebuild_pool()
+
+            return dictionary
+
+    def get_path(
+        self,
+        version_id: typing.Optional[typing.Union[str, pathlib.Path]] = None
+    ) -> typing.Optional[pathlib.Path]:
+        """Returns path to a dictionary file.
+
+        :param version_id: A registered version identifier or a path to a dictionary file.
+        :returns: Path to a dictionary file, None implies the bundled file.
+
+        """
+        if version_id is None:
+            return None
+        if isinstance(version_id, str) and version_id in self._paths:
+            return self._paths[version_id]
+
+        path = pathlib.Path(version_id)
+        if not path.is_file():
+            raise ValueError(f"Unregistered dictionary version: {version_id}")
+
+        return path
+
+    def register(self, version_id: str, path: pathlib.Path):
+        """Registers a dictionary file against a version identifier.
+
+        :param version_id: Identifier of a dictionary version, e.g. '1.3' or 'acme-1.3'.
+        :param path: Path to associated dictionary file.
+
+        """
+        assert path.exists() and path.is_file()
+
+        with self._lock:
+            self._paths[version_id] = path
+
+    def _rebuild_pool(self):
+        """Rebuilds pool of shared entities from set of retained dictionaries."""
+        self._pool = {}
+        for dictionary in self._cache.values():
+            self._share(dictionary)
+
+    def _share(self, dictionary: Dictionary):
+        """Replaces a dictionary's frozen entities with previously pooled equivalents."""
+        def _share_entity(entity):
+            return self._pool.setdefault(entity, entity)
+
+        def _share_values(values: list):
+            for idx, value in enumerate(values):
+                if isinstance(value, Entity):
+                    values[idx] = _share_entity(value)
+
+        def _share_items(collection: object, attr: str):
+            items = getattr(collection, attr)
+            for idx, item in enumerate(items):
+                if hasattr(item, "allowed_values"):
+                    _share_values(item.allowed_values)
+                items[idx] = _share_entity(item)
+            collection._sorted = None
+
+        for attr in _ENUM_ATTRS:
+            enum = getattr(dictionary, attr)
+            _share_values(enum.members)
+            object.__setattr__(enum, "_sorted", None)
+            setattr(dictionary, attr, _share_entity(enum))
+
+        _share_items(dictionary.applicability, "_items")
+        _share_items(dictionary.state_set, "_states")
+        _share_items(dictionary.taxonomy, "_items")
+        _share_items(dictionary.term_set, "_terms")
+        for contract in dictionary.contract_set:
+            contract.type_info = _share_entity(contract.type_info)
+            _share_items(contract.term_set, "_terms")
+
+        # Pooled entities replace equal ones so cached indexes are rebuilt on next use.
+        dictionary.applicability._index = None
@@ -0,0 +1,192 @@
+import copy
+import json
+import pathlib
+import random
+import typing
+
+from actusmp.dictionary.accessor import read_content
+
+
+# Term scalar types assigned, in rotation, to synthetic terms.
+_TERM_TYPES = (
+    "Real",
+    "Timestamp",
+    "Enum",
+    "Varchar",
+    "Real",
+    "Cycle",
+    "Period",
+    "Timestamp[]",
+    "Real[]",
+)
+
+# Allowed value declarations of non enum synthetic terms.
+_TERM_ALLOWED_VALUES = {
+    "Cycle": ["[ISO8601 Duration]L[s={0,1}]"],
+    "Period": ["ISO8601 Duration"],
+    "Timestamp": ["ISO8601 Datetime"],
+}
+
+# Applicability instructions assigned, at random, to synthetic applicability rows.
+_TERM_INSTRUCTIONS = ("NN", "x", "x(,,1)", "NN(,,1)", "x(9,1,)")
+
+# Number of members of each synthetic enum term.
+_ENUM_MEMBER_COUNT = 3
+
+
+def get_content(
+    contract_count: int,
+    term_count: int,
+    row_count: int,
+    seed: int = 0
+) -> bytes:
+    """Returns raw content of an ACTUS shaped dictionary scaled to a given size.
+
+    The bundled dictionary is extended with synthetic contract types, terms & applicability
+    rows, thus the output is loadable by Accessor & get_dictionary & renders through every
+    generator.  Sizes smaller than those of the bundled dictionary are raised to them.
+
+    :param contract_count: Number of contract types, (i.e. taxonomy entries).
+    :param term_count: Number of terms.
+    :param row_count: Number of applicability rows, i.e. (contract type, term) pairs.
+    :param seed: Random seed, the same inputs always yield the same content.
+    :returns: Raw dictionary content.
+
+    """
+    obj = json.loads(read_content())
+    rng = random.Random(seed)
+
+    _add_contract_types(obj, contract_count)
+    _add_terms(obj, term_count)
+    _add_applicability(obj, row_count, rng)
+
+    return json.dumps(obj, indent=1).encode("utf-8")
+
+
+def get_size(content: bytes) -> typing.Tuple[int, int, int]:
+    """Returns size of a dictionary.
+
+    :param content: Raw dictionary content.
+    :returns: 3 member tuple: (contract type count, term count, applicability row count).
+
+    """
+    obj = json.loads(content)
+
+    return (
+        len(obj["taxonomy"]),
+        len(obj["terms"]),
+        sum(len([j for j in i if j != "contract"]) for i in obj["applicability"].values()),
+    )
+
+
+def write(
+    fpath: pathlib.Path,
+    contract_count: int,
+    term_count: int,
+    row_count: int,
+    seed: int = 0
+):
+    """Writes an ACTUS shaped dictionary scaled to a given size.
+
+    :param fpath: Path to target dictionary file.
+    :param contract_count: Number of contract types, (i.e. taxonomy entries).
+    :param term_count: Number of terms.
+    :param row_count: Number of applicability rows, i.e. (contract type, term) pairs.
+    :param seed: Random seed, the same inputs always yield the same content.
+
+    """
+    fpath.parent.mkdir(parents=True, exist_ok=True)
+    with open(fpath, "wb") as fstream:
+        fstream.write(get_content(contract_count, term_count, row_count, seed))
+
+
+def _add_applicability(obj: dict, row_count: int, rng: random.Random):
+    """Extends applicability rows, synthetic contract types first, to a target count.
+
+    """
+    applicability: dict = obj["applicability"]
+    term_ids = sorted(obj["terms"])
+    for contract_id in [i["identifier"] for i in obj["taxonomy"].values()]:
+        if contract_id not in applicability and contract_id.startswith("synthetic"):
+            applicability[contract_id] = {"contract": contract_id, "contractID": "NN"}
+
+    candidates = [
+        (contract_id, term_id)
+        for contract_id in sorted(applicability, key=lambda i: not i.startswith("synthetic"))
+        for term_id in term_ids
+        if term_id not in applicability[contract_id]
+    ]
+    row_count_current = sum(len(i) - 1 for i in applicability.values())
+    extra = max(0, min(row_count - row_count_current, len(candidates)))
+
+    # Sample from synthetic contracts preferentially, then from bundled contracts.
+    synthetic = [i for i in candidates if i[0].startswith("synthetic")]
+    bundled = [i for i in candidates if not i[0].startswith("synthetic")]
+    rows = rng.sample(synthetic, min(extra, len(synthetic)))
+    rows += rng.sample(bundled, extra - len(rows))
+    for contract_id, term_id in sorted(rows):
+        applicability[contract_id][term_id] = rng.choice(_TERM_INSTRUCTIONS)
+
+
+def _add_contract_types(obj: dict, contract_count: int):
+    """Extends taxonomy & contract type enum with synthetic contract types.
+
+    """
+    taxonomy: dict = obj["taxonomy"]
+    contract_types: list = obj["terms"]["contractType"]["allowedValues"]
+    option = max(int(i["option"]) for i in contract_types) + 1
+    for idx in range(len(taxonomy), contract_count):
+        identifier = f"syntheticContract{idx}"
+        acronym = f"SYN{idx}"
+        taxonomy[identifier] = {
+            "identifier": identifier,
+            "name": f"Synthetic Contract {idx}",
+            "acronym": acronym,
+            "family": "Basic",
+            "class": "Fixed Income",
+            "description": f"Synthetic contract type {idx} used for scaling tests.",
+            "coverage": "Scaling tests.",
+            "status": "Released",
+        }
+        contract_types.append({
+            "option": str(option),
+            "identifier": identifier,
+            "name": f"Synthetic Contract {idx}",
+            "acronym": acronym,
+            "description": f"Synthetic contract type {idx}.",
+        })
+        option += 1
+
+
+def _add_terms(obj: dict, term_count: int):
+    """Extends term set with synthetic terms of rotating scalar types.
+
+    """
+    terms: dict = obj["terms"]
+    for idx in range(len(terms), term_count):
+        identifier = f"syntheticTerm{idx}"
+        acronym = f"SYT{idx}"
+        scalar_type = _TERM_TYPES[idx % len(_TERM_TYPES)]
+        allowed_values = _TERM_ALLOWED_VALUES.get(scalar_type.rstrip("[]"), [])
+        term = {
+            "identifier": identifier,
+            "group": f"Synthetic Group {idx % 8}",
+            "name": f"Synthetic Term {idx}",
+            "acronym": acronym,
+            "type": scalar_type,
+            "allowedValues": copy.deepcopy(allowed_values),
+            "default": "",
+            "description": f"Synthetic {scalar_type} term {idx} used for scaling tests.",
+        }
+        if scalar_type == "Enum":
+            term["allowedValues"] = [{
+                "option": str(i),
+                "identifier": f"syntheticMember{i}",
+                "name": f"Synthetic Member {i}",
+                "acronym": f"S{idx}M{i}",
+                "description": f"Synthetic member {i}.",
+            } for i in range(_ENUM_MEMBER_COUNT)]
+            term["default"] = f"S{idx}M0"
+        elif scalar_type == "Real":
+            term["default"] = "0.0"
+        terms[identifier] = term
@@ -3,11 +3,13 @@ from actusmp.model.applicability import ApplicableTermInfo
 from actusmp.model.contract import Contract
 from actusmp.model.contract import ContractSet
 from actusmp.model.dictionary import Dictionary
+from actusmp.model.dictionary import LazyDictionary
 from actusmp.model.entity import Entity
 from actusmp.model.entity import IterableEntity
 from actusmp.model.enum_ import Enum
 from actusmp.model.enum_ import EnumMember
 from actusmp.model.funcs import FunctionType
+from actusmp.model.index import DictionaryIndex
 from actusmp.model.scalar_type import ScalarType
 from actusmp.model.state import State
 from actusmp.model.state import StateSet
@@ -1,14 +1,17 @@
 import dataclasses
 import typing
 
+from actusmp.model.entity import intern
 from actusmp.model.taxonomy import ContractTypeInfo
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class ApplicableTermInfo():
     """Information related to an term applicable to a contract.
 
     """
+    __slots__ = ("contract_type_id", "term_id", "term_instruction")
+
     # Identifier of associated contract type.
     contract_type_id: str
 
@@ -18,6 +21,21 @@ class ApplicableTermInfo():
     # Upstream processing information associated with term.
     term_instruction: str
 
+    def __post_init__(self):
+        """Interns repeated strings."""
+        for attr in self.__slots__:
+            object.__setattr__(self, attr, intern(getattr(self, attr)))
+
+    def __getstate__(self) -> dict:
+        """Instance state when pickling."""
+        return {i: getattr(self, i) for i in self.__slots__}
+
+    def __setstate__(self, state: dict):
+        """Restores instance state when unpickling."""
+        for attr, value in state.items():
+            object.__setattr__(self, attr, value)
+        self.__post_init__()
+
     def __str__(self) -> str:
         """Instance string representation."""
         return f"applicable-term-info|{self.contract_type_id}|{self.term_id}"
@@ -36,9 +54,24 @@ class ApplicableTermInfoSet():
     # Collection of associated applicable contract terms.
     _items: typing.List[ApplicableTermInfo]
 
+    # Cached collection of items ordered by sort key.
+    _sorted: typing.List[ApplicableTermInfo] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+        )
+
+    # Cached map: contract type identifier <-> applicable term information ordered by term.
+    _index: typing.Dict[str, typing.List[ApplicableTermInfo]] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+        )
+
+    # Size of collection when index was last built.
+    _index_size: int = dataclasses.field(
+        default=0, init=False, repr=False, compare=False
+        )
+
     def __iter__(self) -> typing.Iterator[ApplicableTermInfo]:
         """Instance iterator."""
-        return iter(sorted(self._items, key=lambda i: i.sort_key))
+        return iter(self._get_sorted())
 
     def __len__(self) -> int:
         """Instance iterator length."""
@@ -48,13 +81,43 @@ class ApplicableTermInfoSet():
         """Instance string representation."""
         return f"applicable-term-info-set|{len(self)}"
 
-    def get_applicable_termset(self, type_info: ContractTypeInfo) -> typing.Generator:
+    def add(self, info: ApplicableTermInfo):
+        """Appends an item to the collection & invalidates cached views."""
+        self._items.append(info)
+        self._sorted = None
+        self._index = None
+
+    def get_applicable_termset(self, type_info: ContractTypeInfo) -> typing.Iterator:
         """Returns set of applicable term information filtered by contract type.
 
         :param type_info: Type information associated with a contract.
         :returns: Sequence of applicable terms.
 
         """
-        for info in self:
-            if info.contract_type_id == type_info.identifier:
-                yield info
+        return iter(self.get_index().get(type_info.identifier, []))
+
+    def get_index(self) -> typing.Dict[str, typing.List[ApplicableTermInfo]]:
+        """Returns map of contract type identifier to applicable term information.
+
+        The index is built in a single pass over the collection, with each group ordered
+        by term identifier, and is rebuilt only when the collection changes.
+
+        :returns: Applicable term information grouped by contract type.
+
+        """
+        if self._index is None or self._index_size != len(self._items):
+            self._index = {}
+            for info in self._items:
+                self._index.setdefault(info.contract_type_id, []).append(info)
+            for infos in self._index.values():
+                infos.sort(key=lambda i: i.term_id)
+            self._index_size = len(self._items)
+
+        return self._index
+
+    def _get_sorted(self) -> typing.List[ApplicableTermInfo]:
+        """Returns cached ordered view over collection, rebuilding it when stale."""
+        if self._sorted is None or len(self._sorted) != len(self._items):
+            self._sorted = sorted(self._items, key=lambda i: i.sort_key)
+
+        return self._sorted
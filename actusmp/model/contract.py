@@ -18,6 +18,16 @@ class Contract():
     # Associated type information such as acronym, identifier ...etc.
     type_info: ContractTypeInfo
 
+    # Cached set of scalar types of associated terms.
+    _scalar_types: typing.FrozenSet[ScalarType] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+        )
+
+    # Number of associated terms when scalar types were cached.
+    _scalar_types_size: int = dataclasses.field(
+        default=0, init=False, repr=False, compare=False
+        )
+
     def __hash__(self) -> int:
         """Instance hash representation."""
         return hash(f"contract|{self.acronym}|{self.identifier}")
@@ -43,10 +53,11 @@ class Contract():
         :returns: True if matched else False.
 
         """
-        for term in self.term_set:
-            if term.scalar_type == scalar_type:
-                return True
-        return False
+        if self._scalar_types is None or self._scalar_types_size != len(self.term_set):
+            self._scalar_types = frozenset(i.scalar_type for i in self.term_set)
+            self._scalar_types_size = len(self.term_set)
+
+        return scalar_type in self._scalar_types
 
 
 @dataclasses.dataclass
@@ -57,9 +68,19 @@ class ContractSet():
     # Collection of associated contracts.
     _items: typing.List[Contract]
 
+    # Cached collection of contracts ordered by acronym.
+    _sorted: typing.List[Contract] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+        )
+
+    # Cached map: contract identifier <-> contract.
+    _index: typing.Dict[str, Contract] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+        )
+
     def __iter__(self) -> typing.Iterator[Contract]:
         """Instance iterator."""
-        return iter(sorted(self._items, key=lambda i: i.type_info.acronym))
+        return iter(self._get_sorted())
 
     def __len__(self) -> int:
         """Instance iterator length."""
@@ -69,6 +90,11 @@ class ContractSet():
         """Instance string representation."""
         return f"contract-set|{len(self)}"
 
+    def add(self, contract: Contract):
+        """Appends a contract to the collection & invalidates cached views."""
+        self._items.append(contract)
+        self._sorted = None
+
     def get_contract(self, contract_id: str) -> typing.Optional[Contract]:
         """Returns first contract within associated collection with matching identifier.
 
@@ -76,6 +102,16 @@ class ContractSet():
         :returns: A contract matched by it's id.
 
         """
-        for item in self:
-            if item.identifier == contract_id:
-                return item
+        self._get_sorted()
+
+        return self._index.get(contract_id)
+
+    def _get_sorted(self) -> typing.List[Contract]:
+        """Returns cached ordered view over collection, rebuilding it when stale."""
+        if self._sorted is None or len(self._sorted) != len(self._items):
+            self._sorted = sorted(self._items, key=lambda i: i.type_info.acronym)
+            self._index = {}
+            for item in self._sorted:
+                self._index.setdefault(item.identifier, item)
+
+        return self._sorted
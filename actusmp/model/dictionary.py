@@ -5,6 +5,8 @@ import typing
 from actusmp.model.applicability import ApplicableTermInfoSet
 from actusmp.model.contract import ContractSet
 from actusmp.model.enum_ import Enum
+from actusmp.model.index import DictionaryIndex
+from actusmp.model.index import get_index
 from actusmp.model.state import StateSet
 from actusmp.model.taxonomy import Taxonomy
 from actusmp.model.term import TermSet
@@ -58,6 +60,11 @@ class Dictionary():
         """Instance string representation."""
         return f"{self.version}|{self.version_date}"
 
+    @property
+    def index(self) -> DictionaryIndex:
+        """Inverted indexes & applicability bitsets, built upon first access."""
+        return get_index(self)
+
     @property
     def enum_set(self) -> typing.Generator:
         """Set of enumerations defined within dictionary."""
@@ -71,3 +78,32 @@ class Dictionary():
 
         for target in sorted(targets, key=lambda i: i.identifier):
             yield target
+
+
+class LazyDictionary(Dictionary):
+    """A dictionary whose sections are built upon first access & then memoized.
+
+    """
+    def __init__(self, sections: typing.Dict[str, typing.Callable[[], typing.Any]]):
+        """Instance constructor.
+
+        :param sections: Map: dictionary attribute name <-> section factory.
+
+        """
+        self._sections = sections
+
+    def __getattr__(self, name: str) -> typing.Any:
+        """Builds & memoizes a section not yet accessed."""
+        try:
+            factory = self.__dict__["_sections"][name]
+        except KeyError:
+            raise AttributeError(name)
+
+        value = factory()
+        setattr(self, name, value)
+
+        return value
+
+    def materialize(self) -> Dictionary:
+        """Returns an eagerly built dictionary holding the same sections."""
+        return Dictionary(**{i.name: getattr(self, i.name) for i in dataclasses.fields(self)})
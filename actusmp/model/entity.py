@@ -1,12 +1,28 @@
 import dataclasses
+import sys
 import typing
 
 
-@dataclasses.dataclass
+def intern(value: typing.Optional[str]) -> typing.Optional[str]:
+    """Returns interned form of a string so that repeated values share storage.
+
+    :param value: A string or None.
+    :returns: Interned string or None.
+
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclasses.dataclass(frozen=True)
 class Entity():
     """A uniquely identifable entity within the type system.
 
     """
+    __slots__ = ("acronym", "description", "identifier", "name", "_hash")
+
+    # Names of string attributes interned upon instantiation.
+    _INTERNED = ("acronym", "identifier", "name")
+
     # A short identifier, e.g. 'SCF'.
     acronym: str
 
@@ -19,9 +35,25 @@ class Entity():
     # A formal name within enumeration scope.
     name: str
 
-    def __hash__(self):
+    def __post_init__(self):
+        """Interns repeated strings & computes instance hash once."""
+        for attr in self._INTERNED:
+            object.__setattr__(self, attr, intern(getattr(self, attr)))
+        object.__setattr__(self, "_hash", hash(self._get_hash_key()))
+
+    def __getstate__(self) -> dict:
+        """Instance state when pickling, (hashes are process specific so are excluded)."""
+        return {i.name: getattr(self, i.name) for i in dataclasses.fields(self)}
+
+    def __hash__(self) -> int:
         """Instance hash representation."""
-        return hash(str(self))
+        return self._hash
+
+    def __setstate__(self, state: dict):
+        """Restores instance state when unpickling."""
+        for attr, value in state.items():
+            object.__setattr__(self, attr, value)
+        self.__post_init__()
 
     def __str__(self) -> str:
         """Instance string representation."""
@@ -31,6 +63,10 @@ class Entity():
         """Predicate: returns true if identifier can be matched."""
         return identifier.upper() in [self.acronym.upper(), self.identifier.upper()]
 
+    def _get_hash_key(self) -> str:
+        """Returns key from which instance hash is derived."""
+        return str(self)
+
 
 @dataclasses.dataclass
 class IterableEntity():
@@ -40,9 +76,19 @@ class IterableEntity():
     # Collection of associated contract terms.
     _terms: typing.List[Entity]
 
+    # Cached collection of items ordered by identifier.
+    _sorted: typing.List[Entity] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+        )
+
+    # Cached map: item identifier <-> item.
+    _index: typing.Dict[str, Entity] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+        )
+
     def __iter__(self) -> typing.Iterator[Entity]:
         """Instance iterator."""
-        return iter(sorted(self._terms, key=lambda i: i.identifier))
+        return iter(self._get_sorted())
 
     def __len__(self) -> int:
         """Instance iterator length."""
@@ -52,8 +98,23 @@ class IterableEntity():
         """Instance string representation."""
         return f"term-set|{len(self)}"
 
+    def add(self, item: Entity):
+        """Appends an item to the collection & invalidates cached views."""
+        self._terms.append(item)
+        self._sorted = None
+
     def get_item(self, identifier: str) -> Entity:
         """Returns first item matched by identifier."""
-        for item in self:
-            if item.identifier == identifier:
-                return item
+        self._get_sorted()
+
+        return self._index.get(identifier)
+
+    def _get_sorted(self) -> typing.List[Entity]:
+        """Returns cached ordered view over collection, rebuilding it when stale."""
+        if self._sorted is None or len(self._sorted) != len(self._terms):
+            self._sorted = sorted(self._terms, key=lambda i: i.identifier)
+            self._index = {}
+            for item in self._sorted:
+                self._index.setdefault(item.identifier, item)
+
+        return self._sorted
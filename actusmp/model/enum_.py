@@ -4,34 +4,73 @@ import typing
 from actusmp.model.entity import Entity
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class EnumMember(Entity):
     """Member of an enumerated type.
 
     """
+    __slots__ = ("is_default", "option")
+
     # Flag indicating whether member is enumeration scope default.
     is_default: typing.Optional[bool]
 
     # Ordinal position within enumeration scope.
     option: int
 
+    def __hash__(self) -> int:
+        """Instance hash representation."""
+        return self._hash
+
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class Enum(Entity):
     """An enumerated type that encloses a constrained set of members.
 
     """
+    # N.B. _sorted: cached members ordered by option.
+    # N.B. _index: cached map: upper cased member acronym & identifier <-> member.
+    __slots__ = ("members", "_sorted", "_index")
+
     # Collection of associated enumeration members.
     members: typing.List[EnumMember]
 
+    def __post_init__(self):
+        """Interns repeated strings, computes instance hash once & resets caches."""
+        super().__post_init__()
+        object.__setattr__(self, "_sorted", None)
+        object.__setattr__(self, "_index", None)
+
     def __hash__(self) -> int:
         """Instance hash representation."""
-        return hash(f"enum|{self.acronym}|{self.identifier}")
+        return self._hash
 
     def __iter__(self) -> typing.Iterator[EnumMember]:
         """Instance iterator."""
-        return iter(sorted(self.members, key=lambda i: i.option))
+        return iter(self._get_sorted())
 
     def __len__(self) -> int:
         """Instance iterator length."""
         return len(self.members)
+
+    def get_member(self, identifier: str) -> typing.Optional[EnumMember]:
+        """Returns first member matched by either acronym or identifier (case insensitive)."""
+        self._get_sorted()
+
+        return self._index.get(identifier.upper())
+
+    def _get_sorted(self) -> typing.List[EnumMember]:
+        """Returns cached ordered view over members, rebuilding it when stale."""
+        if self._sorted is None or len(self._sorted) != len(self.members):
+            ordered = sorted(self.members, key=lambda i: i.option)
+            index = {}
+            for member in ordered:
+                index.setdefault(member.acronym.upper(), member)
+                index.setdefault(member.identifier.upper(), member)
+            object.__setattr__(self, "_index", index)
+            object.__setattr__(self, "_sorted", ordered)
+
+        return self._sorted
+
+    def _get_hash_key(self) -> str:
+        """Returns key from which instance hash is derived."""
+        return f"enum|{self.acronym}|{self.identifier}"
@@ -0,0 +1,267 @@
+import typing
+
+from actusmp.model.contract import Contract
+from actusmp.model.scalar_type import ScalarType
+from actusmp.model.term import Term
+from actusmp.model.term import TermSet
+from actusmp.utils import memo
+
+if typing.TYPE_CHECKING:
+    from actusmp.model.dictionary import Dictionary
+
+
+class DictionaryIndex():
+    """Inverted indexes & applicability bitsets precomputed over a dictionary.
+
+    Terms & contracts are assigned bit positions in identifier & acronym order
+    respectively, thus applicability is held as one integer bitset per contract and
+    per term, over which set operations are word parallel.
+
+    """
+    def __init__(self, dictionary: "Dictionary"):
+        """Instance constructor.
+
+        :param dictionary: Dictionary over which indexes are built.
+
+        """
+        # Ordered set of terms, a term's position is its bit within a term bitset.
+        self.terms: typing.List[Term] = list(dictionary.term_set)
+
+        # Ordered set of contracts, a contract's position is its bit within a contract bitset.
+        self.contracts: typing.List[Contract] = list(dictionary.contract_set)
+
+        # Map: term identifier <-> bit position.
+        self._term_positions = {term.identifier: idx for idx, term in enumerate(self.terms)}
+
+        # Map: contract identifier <-> bit position.
+        self._contract_positions = \
+            {contract.identifier: idx for idx, contract in enumerate(self.contracts)}
+
+        # Map: contract identifier <-> bitset of applicable terms.
+        self._contract_terms: typing.Dict[str, int] = {}
+
+        # Map: term identifier <-> bitset of contracts to which term is applicable.
+        self._term_contracts: typing.Dict[str, int] = {i.identifier: 0 for i in self.terms}
+
+        for contract_pos, contract in enumerate(self.contracts):
+            bits = 0
+            for term in contract.term_set:
+                term_pos = self._term_positions.get(term.identifier)
+                if term_pos is not None:
+                    bits |= 1 << term_pos
+                    self._term_contracts[term.identifier] |= 1 << contract_pos
+            self._contract_terms[contract.identifier] = bits
+
+        # Map: scalar type <-> bitset of terms.
+        self._terms_by_scalar_type: typing.Dict[ScalarType, int] = \
+            self._get_term_bits(lambda i: i.scalar_type)
+
+        # Map: group identifier <-> bitset of terms.
+        self._terms_by_group: typing.Dict[str, int] = self._get_term_bits(lambda i: i.group_id)
+
+        # Map: enum identifier <-> bitset of terms referencing the enumeration.
+        self._terms_by_enum: typing.Dict[str, int] = self._get_enum_term_bits(dictionary)
+
+    def __str__(self) -> str:
+        """Instance string representation."""
+        return f"dictionary-index|{len(self.contracts)}|{len(self.terms)}"
+
+    def get_contracts(self, term_id: str) -> typing.List[Contract]:
+        """Returns contracts to which a term is applicable.
+
+        :param term_id: Identifier of a term.
+        :returns: Contracts ordered by acronym.
+
+        """
+        return self._to_contracts(self._term_contracts.get(term_id, 0))
+
+    def get_coverage(self, term_id: str) -> int:
+        """Returns number of contracts to which a term is applicable.
+
+        :param term_id: Identifier of a term.
+        :returns: Contract count.
+
+        """
+        return _count_bits(self._term_contracts.get(term_id, 0))
+
+    def get_terms(self, contract_id: str) -> TermSet:
+        """Returns terms applicable to a contract.
+
+        :param contract_id: Identifier of a contract.
+        :returns: Applicable terms.
+
+        """
+        return self._to_terms(self._contract_terms.get(contract_id, 0))
+
+    def get_terms_by_enum(self, enum_id: str) -> TermSet:
+        """Returns terms referencing an enumeration.
+
+        Enum terms sharing a member set share an enumeration, e.g. cyclePointOfRateReset &
+        cyclePointOfInterestPayment.  Stand-alone enumerations map to the terms of the
+        structure declaring them, e.g. referenceRole -> contractStructure, thus eventType,
+        which no term references, maps to none.
+
+        :param enum_id: Identifier of an enumeration, e.g. contractRole.
+        :returns: Matched terms.
+
+        """
+        return self._to_terms(self._terms_by_enum.get(enum_id, 0))
+
+    def get_terms_by_group(self, group_id: str) -> TermSet:
+        """Returns terms within a group.
+
+        :param group_id: Identifier of a term group, e.g. Interest.
+        :returns: Matched terms.
+
+        """
+        return self._to_terms(self._terms_by_group.get(group_id, 0))
+
+    def get_terms_by_scalar_type(self, scalar_type: ScalarType) -> TermSet:
+        """Returns terms of a scalar type.
+
+        :param scalar_type: A scalar type, e.g. ScalarType.Timestamp.
+        :returns: Matched terms.
+
+        """
+        return self._to_terms(self._terms_by_scalar_type.get(scalar_type, 0))
+
+    def get_common_terms(self, *contract_ids: str) -> TermSet:
+        """Returns terms applicable to every one of a set of contracts.
+
+        :param contract_ids: Identifiers of contracts.
+        :returns: Intersection of applicable terms.
+
+        """
+        if not contract_ids:
+            return TermSet([])
+
+        bits = self._contract_terms.get(contract_ids[0], 0)
+        for contract_id in contract_ids[1:]:
+            bits &= self._contract_terms.get(contract_id, 0)
+
+        return self._to_terms(bits)
+
+    def get_term_difference(self, contract_id: str, other_contract_id: str) -> TermSet:
+        """Returns terms applicable to a contract but not to another.
+
+        :param contract_id: Identifier of a contract.
+        :param other_contract_id: Identifier of a contract whose terms are excluded.
+        :returns: Difference of applicable terms.
+
+        """
+        bits = self._contract_terms.get(contract_id, 0)
+
+        return self._to_terms(bits & ~self._contract_terms.get(other_contract_id, 0))
+
+    def is_applicable(self, contract_id: str, term_id: str) -> bool:
+        """Predicate: returns true if a term is applicable to a contract.
+
+        :param contract_id: Identifier of a contract.
+        :param term_id: Identifier of a term.
+        :returns: True if applicable else False.
+
+        """
+        term_pos = self._term_positions.get(term_id)
+        if term_pos is None:
+            return False
+
+        return bool(self._contract_terms.get(contract_id, 0) >> term_pos & 1)
+
+    def uses_scalar_type(self, contract_id: str, scalar_type: ScalarType) -> bool:
+        """Predicate: returns true if a term applicable to a contract has a scalar type.
+
+        :param contract_id: Identifier of a contract.
+        :param scalar_type: A scalar type, e.g. ScalarType.Period.
+        :returns: True if matched else False.
+
+        """
+        bits = self._contract_terms.get(contract_id, 0)
+
+        return bits & self._terms_by_scalar_type.get(scalar_type, 0) != 0
+
+    def get_contract_bits(self, contract_id: str) -> int:
+        """Returns bitset of terms applicable to a contract.
+
+        :param contract_id: Identifier of a contract.
+        :returns: Bitset whose bit N is set if the Nth term, (see terms), is applicable.
+
+        """
+        return self._contract_terms.get(contract_id, 0)
+
+    def get_term_bits(self, term_id: str) -> int:
+        """Returns bitset of contracts to which a term is applicable.
+
+        :param term_id: Identifier of a term.
+        :returns: Bitset whose bit N is set if applicable to the Nth contract, (see contracts).
+
+        """
+        return self._term_contracts.get(term_id, 0)
+
+    def _get_enum_term_bits(self, dictionary: "Dictionary") -> typing.Dict[str, int]:
+        """Returns map: enum identifier <-> bitset of terms referencing the enumeration.
+
+        """
+        by_members = self._get_term_bits(lambda i: _get_members_key(i) if i.is_enum else None)
+        index = {i.identifier: by_members[_get_members_key(i)] for i in self.terms if i.is_enum}
+
+        references = self._terms_by_scalar_type.get(ScalarType.ContractReference, 0)
+        for enum, bits in (
+            (dictionary.contract_event_type, 0),
+            (dictionary.contract_reference_role, references),
+            (dictionary.contract_reference_type, references),
+        ):
+            index[enum.identifier] = bits | by_members.get(_get_members_key(enum), 0)
+
+        return index
+
+    def _get_term_bits(
+        self,
+        get_key: typing.Callable[[Term], typing.Any]
+    ) -> typing.Dict[typing.Any, int]:
+        """Returns map: key <-> bitset of terms sharing key, terms keyed by None are skipped.
+
+        """
+        index = {}
+        for idx, term in enumerate(self.terms):
+            key = get_key(term)
+            if key is not None:
+                index[key] = index.get(key, 0) | 1 << idx
+
+        return index
+
+    def _to_contracts(self, bits: int) -> typing.List[Contract]:
+        """Returns contracts whose positions are set within a bitset."""
+        return [self.contracts[i] for i in _yield_bits(bits)]
+
+    def _to_terms(self, bits: int) -> TermSet:
+        """Returns terms whose positions are set within a bitset."""
+        return TermSet([self.terms[i] for i in _yield_bits(bits)])
+
+
+@memo.per_instance
+def get_index(dictionary: "Dictionary") -> DictionaryIndex:
+    """Returns inverted indexes over a dictionary, built once per dictionary instance.
+
+    :param dictionary: Dictionary over which indexes are built.
+    :returns: Dictionary index.
+
+    """
+    return DictionaryIndex(dictionary)
+
+
+def _count_bits(bits: int) -> int:
+    """Returns number of set bits, (int.bit_count requires python 3.10)."""
+    return bin(bits).count("1")
+
+
+def _get_members_key(enum: typing.Any) -> typing.FrozenSet[str]:
+    """Returns key identifying an enumeration by its member set, (an enum term or an Enum)."""
+    return frozenset(i.acronym for i in enum.members)
+
+
+def _yield_bits(bits: int) -> typing.Iterator[int]:
+    """Yields positions of set bits in ascending order."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
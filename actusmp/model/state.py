@@ -5,11 +5,13 @@ from actusmp.model.entity import Entity
 from actusmp.model.scalar_type import ScalarType
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class State(Entity):
     """A state field assigned during calculation execution.
 
     """
+    __slots__ = ("allowed_values", "is_array", "scalar_type")
+
     # Constraint over set of allowed values, e.g. 'ISO8601 Datetime'.
     allowed_values: typing.List[typing.Union[dict, str]]
 
@@ -19,6 +21,10 @@ class State(Entity):
     # Associated scalar data type, e.g. Timestamp | Real | Enum ... etc.
     scalar_type: ScalarType
 
+    def __hash__(self) -> int:
+        """Instance hash representation."""
+        return self._hash
+
     def __str__(self) -> str:
         """Instance string representation."""
         return f"state|{self.identifier}"
@@ -38,9 +44,14 @@ class StateSet():
     # Collection of associated contract states.
     _states: typing.List[State]
 
+    # Cached collection of states ordered by identifier.
+    _sorted: typing.List[State] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+        )
+
     def __iter__(self) -> typing.Iterator[State]:
         """Instance iterator."""
-        return iter(sorted(self._states, key=lambda i: i.identifier))
+        return iter(self._get_sorted())
 
     def __len__(self) -> int:
         """Instance iterator length."""
@@ -49,3 +60,15 @@ class StateSet():
     def __str__(self) -> str:
         """Instance string representation."""
         return f"state-set|{len(self)}"
+
+    def add(self, state: State):
+        """Appends a state to the collection & invalidates cached views."""
+        self._states.append(state)
+        self._sorted = None
+
+    def _get_sorted(self) -> typing.List[State]:
+        """Returns cached ordered view over collection, rebuilding it when stale."""
+        if self._sorted is None or len(self._sorted) != len(self._states):
+            self._sorted = sorted(self._states, key=lambda i: i.identifier)
+
+        return self._sorted
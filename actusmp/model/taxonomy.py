@@ -15,12 +15,17 @@ class ContractTypePublicationStatus(enum.Enum):
     Unknown = enum.auto()
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class ContractTypeInfo(Entity):
     """A node within the ACTUS taxonomy representing a financial contract associated with
        an algorithm for deriving cash flow exposure amoungst a set of counter-parties.
 
     """
+    __slots__ = ("classification", "coverage", "family", "publication_status")
+
+    # Names of string attributes interned upon instantiation.
+    _INTERNED = Entity._INTERNED + ("classification", "family")
+
     # Contextual economic classification, e.g. 'Fixed Income'.
     classification: str
 
@@ -33,14 +38,18 @@ class ContractTypeInfo(Entity):
     # Publication status, e.g. 'Released'.
     publication_status: ContractTypePublicationStatus
 
-    def __hash__(self):
+    def __hash__(self) -> int:
         """Instance hash representation."""
-        return hash(self.identifier)
+        return self._hash
 
     def __str__(self) -> str:
         """Instance string representation."""
         return f"contract-type|{self.acronym}..{self.identifier}"
 
+    def _get_hash_key(self) -> str:
+        """Returns key from which instance hash is derived."""
+        return self.identifier
+
 
 @dataclasses.dataclass
 class Taxonomy():
@@ -50,9 +59,14 @@ class Taxonomy():
     # Collection of associated applicable contract terms.
     _items: typing.List[ContractTypeInfo]
 
+    # Cached collection of contract types ordered by acronym.
+    _sorted: typing.List[ContractTypeInfo] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+        )
+
     def __iter__(self) -> typing.Iterator[ContractTypeInfo]:
         """Instance iterator."""
-        return iter(sorted(self._items, key=lambda i: i.acronym))
+        return iter(self._get_sorted())
 
     def __len__(self) -> int:
         """Instance iterator length."""
@@ -61,3 +75,15 @@ class Taxonomy():
     def __str__(self) -> str:
         """Instance string representation."""
         return f"Taxonoty|{len(self)}"
+
+    def add(self, type_info: ContractTypeInfo):
+        """Appends a type_info to the collection & invalidates cached views."""
+        self._items.append(type_info)
+        self._sorted = None
+
+    def _get_sorted(self) -> typing.List[ContractTypeInfo]:
+        """Returns cached ordered view over collection, rebuilding it when stale."""
+        if self._sorted is None or len(self._sorted) != len(self._items):
+            self._sorted = sorted(self._items, key=lambda i: i.acronym)
+
+        return self._sorted
@@ -5,11 +5,16 @@ from actusmp.model.entity import Entity
 from actusmp.model.scalar_type import ScalarType
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class Term(Entity):
     """A contractual term associated with a specific type of financial contract.
 
     """
+    __slots__ = ("allowed_values", "default", "group_id", "is_array", "scalar_type")
+
+    # Names of string attributes interned upon instantiation.
+    _INTERNED = Entity._INTERNED + ("group_id",)
+
     # Constraint over set of allowed values, e.g. 'ISO8601 Datetime'.
     allowed_values: typing.List[typing.Union[dict, str]]
 
@@ -25,6 +30,10 @@ class Term(Entity):
     # Associated scalar data type, e.g. Timestamp | Real | Enum ... etc.
     scalar_type: ScalarType
 
+    def __hash__(self) -> int:
+        """Instance hash representation."""
+        return self._hash
+
     @property
     def has_default(self) -> bool:
         """Returns flag indicating whether the term field has a default value."""
@@ -51,9 +60,29 @@ class TermSet():
     # Collection of associated contract terms.
     _terms: typing.List[Term]
 
+    # Cached collection of terms ordered by identifier.
+    _sorted: typing.List[Term] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+        )
+
+    # Cached map: term identifier <-> term.
+    _index: typing.Dict[str, Term] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+        )
+
+    # Cached map: group identifier <-> sub-set of terms.
+    _groups: typing.Dict[str, "TermSet"] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+        )
+
+    # Cached sub-set of terms that are enumerations.
+    _enums: "TermSet" = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+        )
+
     def __iter__(self) -> typing.Iterator[Term]:
         """Instance iterator."""
-        return iter(sorted(self._terms, key=lambda i: i.identifier))
+        return iter(self._get_sorted())
 
     def __len__(self) -> int:
         """Instance iterator length."""
@@ -63,17 +92,45 @@ class TermSet():
         """Instance string representation."""
         return f"term-set|{len(self)}"
 
+    def add(self, term: Term):
+        """Appends a term to the collection & invalidates cached views."""
+        self._terms.append(term)
+        self._sorted = None
+
     def get_term(self, identifier: str) -> Term:
         """Returns first term matched by identifier."""
-        for item in self:
-            if item.identifier == identifier:
-                return item
+        self._get_sorted()
+
+        return self._index.get(identifier)
 
     def get_by_group_id(self, group_id: str) -> "TermSet":
         """Returns set of terms matched by group identifier."""
-        return TermSet([i for i in self if i.group_id == group_id])
+        self._get_sorted()
+        if self._groups is None:
+            groups = {}
+            for term in self._sorted:
+                groups.setdefault(term.group_id, []).append(term)
+            self._groups = {k: TermSet(v) for k, v in groups.items()}
+
+        return self._groups.get(group_id) or TermSet([])
 
     @property
     def enum_set(self):
         """Returns sub-set of terms that are enumerations."""
-        return TermSet([i for i in self if i.scalar_type == ScalarType.Enum])
+        self._get_sorted()
+        if self._enums is None:
+            self._enums = TermSet([i for i in self._sorted if i.scalar_type == ScalarType.Enum])
+
+        return self._enums
+
+    def _get_sorted(self) -> typing.List[Term]:
+        """Returns cached ordered view over collection, rebuilding it when stale."""
+        if self._sorted is None or len(self._sorted) != len(self._terms):
+            self._sorted = sorted(self._terms, key=lambda i: i.identifier)
+            self._groups = None
+            self._enums = None
+            self._index = {}
+            for term in self._sorted:
+                self._index.setdefault(term.identifier, term)
+
+        return self._sorted
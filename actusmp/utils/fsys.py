@@ -1,63 +1,106 @@
+import functools
 import os
 import pathlib
 import typing
 
-import jinja2
+from actusmp.utils import sinks
 
-from actusmp import model
 
+# Environment variable: overrides directory into which cached artefacts are written.
+_ENV_CACHE_DIR = "ACTUSMP_CACHE_DIR"
+
+# Environment variable: when set to a truthy value cached artefacts are neither read nor written.
+_ENV_CACHE_DISABLED = "ACTUSMP_NO_CACHE"
 
 # Set templates home folder.
-_TEMPLATES_DIR: pathlib.Path = pathlib.Path(os.path.dirname(__file__)).parent / "templates"
+TEMPLATES_DIR: pathlib.Path = pathlib.Path(os.path.dirname(__file__)).parent / "templates"
+
+
+def is_cache_enabled() -> bool:
+    """Returns flag indicating whether on-disk caching of derived artefacts is enabled.
+
+    """
+    return os.getenv(_ENV_CACHE_DISABLED, "").lower() not in ("1", "true", "yes")
+
+
+def get_cache_dir() -> pathlib.Path:
+    """Returns directory within which derived artefacts, (snapshots, bytecode ...), are stored.
+
+    """
+    if os.getenv(_ENV_CACHE_DIR):
+        return pathlib.Path(os.getenv(_ENV_CACHE_DIR))
+
+    if os.getenv("XDG_CACHE_HOME"):
+        return pathlib.Path(os.getenv("XDG_CACHE_HOME")) / "actusmp"
+
+    return pathlib.Path.home() / ".cache" / "actusmp"
 
-# Set codegen template engine.
-_CODEGEN_ENV: jinja2.Environment = jinja2.Environment(
-    loader=jinja2.FileSystemLoader(_TEMPLATES_DIR),
-    autoescape=jinja2.select_autoescape(),
-    trim_blocks=True
-)
 
-# Set template loading function.
-get_template: typing.Callable = _CODEGEN_ENV.get_template
+def get_template(name: str):
+    """Returns a compiled codegen template.
+
+    Templates are compiled once per process & their bytecode is persisted to the cache
+    directory, (keyed by source checksum), so that subsequent processes skip compilation.
+
+    :param name: Template file name.
+    :returns: A jinja2 template.
+
+    """
+    return _get_codegen_env().get_template(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_codegen_env():
+    """Returns codegen template engine, instantiated upon first use so as to defer jinja2 import.
+
+    """
+    import jinja2
+
+    bytecode_cache = None
+    if is_cache_enabled():
+        bytecode_dir = get_cache_dir() / "templates"
+        try:
+            bytecode_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            pass
+        else:
+            bytecode_cache = jinja2.FileSystemBytecodeCache(str(bytecode_dir))
+
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(TEMPLATES_DIR),
+        autoescape=jinja2.select_autoescape(),
+        bytecode_cache=bytecode_cache,
+        trim_blocks=True
+    )
 
 
 def write(fpath: pathlib.Path, content: str):
-    """Simple sink function to write file contents to file system.
+    """Simple sink function to atomically write file contents to file system.
 
-    Useful so as to simplify suspending writing when testing.
+    See actusmp.utils.sinks for batched, in-memory & archive alternatives.
 
     :param fpath: Target file path.
     :param content: File content to be written.
 
     """
-    if not fpath.parent.exists():
-        fpath.parent.mkdir(parents=True)
-    with open(fpath, "w") as fstream:
-        fstream.write(content)
-
+    fpath.parent.mkdir(parents=True, exist_ok=True)
+    sinks.write_atomic(fpath, content)
 
-def yield_funcset(
-    dictionary: model.Dictionary,
-    path_to_java_funcs: pathlib.Path,
-    f_type: model.FunctionType
-) -> typing.Tuple[model.Contract, model.FunctionType, str]:
-    """Yields set of functions for which code can be emitted.
 
-    In actus-core.functions there is a sub-package for each supported contract type.
-    Within each sub-package is the set of contract specific functions.  Each such
-    function is named: {func-type}_{event-type}_{contract-type}.java.
+def write_chunks(
+    fpath: pathlib.Path,
+    chunks: typing.Iterable[str],
+    is_changed: typing.Optional[typing.Callable[[], bool]] = None
+) -> bool:
+    """Simple sink function to atomically write file contents streamed as chunks.
 
-    :param dictionary: ACTUS dictionary wrapper.
-    :param path_to_java_funcs: Path to functions defined in actus-core.
-    :param f_type: Type of ACTUS function to be processed.
-    :returns: Iterator over set of functions declared in actus-core.
+    :param fpath: Target file path.
+    :param chunks: File content to be written, e.g. as yielded by a template.
+    :param is_changed: Predicate invoked once all chunks are written, if false the
+                       target is left untouched.
+    :returns: Flag indicating whether file was written.
 
     """
-    for contract in dictionary.contract_set:
-        path_to_java_funcs_contract = path_to_java_funcs / contract.type_info.acronym.lower()
-        if path_to_java_funcs_contract.exists() and path_to_java_funcs_contract.is_dir():
-            iterator = (i.stem.split("_") for i in path_to_java_funcs_contract.iterdir())
-            for (func_type, event_type, suffix) in iterator:
-                if f_type.name == func_type:
-                    suffix = suffix[-1] if suffix[-1].isnumeric() else ""
-                    yield contract, event_type, suffix
+    fpath.parent.mkdir(parents=True, exist_ok=True)
+
+    return sinks.write_atomic_chunks(fpath, chunks, is_changed)
@@ -0,0 +1,270 @@
+import dataclasses
+import hashlib
+import json
+import os
+import pathlib
+import threading
+import typing
+
+from actusmp import model
+from actusmp.utils import fsys
+from actusmp.utils import profiler
+from actusmp.utils import sinks
+
+
+# Index layout version - bump whenever the persisted shape changes.
+_INDEX_FORMAT = 2
+
+# Index file name prefix.
+_INDEX_PREFIX = "funcindex-"
+
+# Index file name suffix.
+_INDEX_SUFFIX = ".json"
+
+# Suffix of actus-core function files.
+_JAVA_SUFFIX = ".java"
+
+# Map: path to functions <-> (fingerprint, index), avoids re-reading index within a process.
+_INDEXES: typing.Dict[str, typing.Tuple[list, "FuncIndex"]] = {}
+
+# Guards in-process index map.
+_INDEXES_LOCK = threading.Lock()
+
+
+@dataclasses.dataclass(frozen=True)
+class FuncInfo():
+    """A contract specific function declared within actus-core.
+
+    """
+    # Lower cased acronym of associated contract type, i.e. name of containing package.
+    contract: str
+
+    # Type of function, e.g. POF.
+    f_type: str
+
+    # Type of event to which function relates, e.g. IED.
+    event_type: str
+
+    # Numeric suffix distinguishing function variants, e.g. '1' in STF_PRD_NAM1.
+    suffix: str
+
+    # Function file name, e.g. POF_IED_PAM.java.
+    fname: str
+
+
+@dataclasses.dataclass
+class FuncIndex():
+    """Index over set of contract specific functions declared within actus-core.
+
+    """
+    # Map: contract acronym (lower cased) <-> functions ordered by file name.
+    funcs: typing.Dict[str, typing.List[FuncInfo]] = dataclasses.field(default_factory=dict)
+
+    # Paths, relative to functions root, of function files whose names could not be parsed.
+    malformed: typing.List[str] = dataclasses.field(default_factory=list)
+
+    def __iter__(self) -> typing.Iterator[FuncInfo]:
+        """Instance iterator."""
+        for contract in sorted(self.funcs):
+            yield from self.funcs[contract]
+
+    def __len__(self) -> int:
+        """Instance iterator length."""
+        return sum(len(i) for i in self.funcs.values())
+
+    def __str__(self) -> str:
+        """Instance string representation."""
+        return f"func-index|{len(self.funcs)}|{len(self)}|{len(self.malformed)}"
+
+    def get_funcs(
+        self,
+        contract: str,
+        f_type: typing.Optional[model.FunctionType] = None
+    ) -> typing.List[FuncInfo]:
+        """Returns functions declared for a contract type.
+
+        :param contract: Contract type acronym.
+        :param f_type: Type of function to be returned, if omitted all are returned.
+        :returns: Functions ordered by file name.
+
+        """
+        funcs = self.funcs.get(contract.lower(), [])
+        if f_type is None:
+            return funcs
+
+        return [i for i in funcs if i.f_type == f_type.name]
+
+
+def get_fingerprint(path_to_java_funcs: pathlib.Path) -> list:
+    """Returns [name, mtime, size] of functions root & of each contract directory.
+
+    :param path_to_java_funcs: Path to functions defined in actus-core.
+    :returns: Ordered stat based fingerprint, empty if functions root is unreadable.
+
+    """
+    try:
+        stat = os.stat(path_to_java_funcs)
+    except OSError:
+        return []
+
+    fingerprint = [[".", stat.st_mtime_ns, stat.st_size]]
+    try:
+        with os.scandir(path_to_java_funcs) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    stat = entry.stat()
+                    fingerprint.append([entry.name, stat.st_mtime_ns, stat.st_size])
+    except OSError:
+        return []
+
+    return sorted(fingerprint)
+
+
+@profiler.timed("codegen.funcindex")
+def get_index(path_to_java_funcs: pathlib.Path) -> FuncIndex:
+    """Returns index over functions declared within actus-core.
+
+    The index is persisted to the cache directory & keyed by the mtimes & sizes of the
+    function directories, thus it is rebuilt whenever a function file is added, removed
+    or renamed.  N.B. edits to a file's content do not invalidate the index.
+
+    :param path_to_java_funcs: Path to functions defined in actus-core.
+    :returns: Function index.
+
+    """
+    key = str(pathlib.Path(path_to_java_funcs).resolve())
+    fingerprint = get_fingerprint(path_to_java_funcs)
+
+    with _INDEXES_LOCK:
+        if key in _INDEXES and _INDEXES[key][0] == fingerprint:
+            return _INDEXES[key][1]
+
+    index = _read(key, fingerprint) if fsys.is_cache_enabled() else None
+    if index is None:
+        index = _scan(path_to_java_funcs)
+        for fpath in index.malformed:
+            print(f"WARNING: malformed actus-core function name, ignoring :: {fpath}")
+        if fsys.is_cache_enabled():
+            _write(key, fingerprint, index)
+
+    with _INDEXES_LOCK:
+        _INDEXES[key] = (fingerprint, index)
+
+    return index
+
+
+def yield_funcset(
+    dictionary: model.Dictionary,
+    path_to_java_funcs: pathlib.Path,
+    f_type: model.FunctionType
+) -> typing.Iterator[typing.Tuple[model.Contract, str, str]]:
+    """Yields set of functions for which code can be emitted.
+
+    In actus-core.functions there is a sub-package for each supported contract type.
+    Within each sub-package is the set of contract specific functions.  Each such
+    function is named: {func-type}_{event-type}_{contract-type}.java.
+
+    :param dictionary: ACTUS dictionary wrapper.
+    :param path_to_java_funcs: Path to functions defined in actus-core.
+    :param f_type: Type of ACTUS function to be processed.
+    :returns: Iterator over set of functions declared in actus-core.
+
+    """
+    index = get_index(path_to_java_funcs)
+    for contract in dictionary.contract_set:
+        for func in index.get_funcs(contract.type_info.acronym, f_type):
+            yield contract, func.event_type, func.suffix
+
+
+def _get_path(key: str) -> pathlib.Path:
+    """Returns path to a persisted index.
+
+    """
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    return fsys.get_cache_dir() / f"{_INDEX_PREFIX}{digest}{_INDEX_SUFFIX}"
+
+
+def _is_func(fname: str) -> bool:
+    """Predicate: returns true if a file declares a function, i.e. has a function type prefix.
+
+    """
+    return fname.split("_", 1)[0] in model.FunctionType.__members__
+
+
+def _parse_fname(contract: str, fname: str) -> typing.Optional[FuncInfo]:
+    """Returns function information parsed from a file name, or None if malformed.
+
+    """
+    parts = fname[:-len(_JAVA_SUFFIX)].split("_")
+    if len(parts) != 3:
+        return None
+
+    f_type, event_type, suffix = parts
+    if not event_type or not suffix:
+        return None
+    suffix = suffix[-1] if suffix[-1].isnumeric() else ""
+
+    return FuncInfo(contract, f_type, event_type, suffix, fname)
+
+
+def _read(key: str, fingerprint: list) -> typing.Optional[FuncIndex]:
+    """Returns a persisted index if it matches current state of the file system.
+
+    """
+    try:
+        with open(_get_path(key), "r") as fstream:
+            obj = json.load(fstream)
+        if obj["format"] != _INDEX_FORMAT or obj["fingerprint"] != fingerprint:
+            return None
+        funcs = {}
+        for item in obj["funcs"]:
+            func = FuncInfo(**item)
+            funcs.setdefault(func.contract, []).append(func)
+        return FuncIndex(funcs, obj["malformed"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _scan(path_to_java_funcs: pathlib.Path) -> FuncIndex:
+    """Returns index built by a single pass over functions declared within actus-core.
+
+    """
+    index = FuncIndex()
+    if not os.path.isdir(path_to_java_funcs):
+        return index
+
+    with os.scandir(path_to_java_funcs) as contracts:
+        contracts = sorted((i for i in contracts if i.is_dir()), key=lambda i: i.name)
+    for contract in contracts:
+        with os.scandir(contract.path) as entries:
+            entries = sorted((i for i in entries if i.is_file()), key=lambda i: i.name)
+        for entry in entries:
+            # N.B. files other than functions, e.g. helpers, are skipped silently.
+            if not entry.name.endswith(_JAVA_SUFFIX) or not _is_func(entry.name):
+                continue
+            func = _parse_fname(contract.name, entry.name)
+            if func is None:
+                index.malformed.append(f"{contract.name}/{entry.name}")
+                continue
+            index.funcs.setdefault(contract.name, []).append(func)
+
+    return index
+
+
+def _write(key: str, fingerprint: list, index: FuncIndex):
+    """Atomically persists an index, failures are ignored as the index can be rebuilt.
+
+    """
+    fpath = _get_path(key)
+    obj = {
+        "format": _INDEX_FORMAT,
+        "fingerprint": fingerprint,
+        "funcs": [dataclasses.asdict(i) for i in index],
+        "malformed": index.malformed,
+    }
+    try:
+        fpath.parent.mkdir(parents=True, exist_ok=True)
+        sinks.write_atomic(fpath, json.dumps(obj))
+    except OSError:
+        pass
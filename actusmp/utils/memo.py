@@ -0,0 +1,38 @@
+import functools
+import threading
+import typing
+import weakref
+
+
+def per_instance(factory: typing.Callable[[typing.Any], typing.Any]) -> typing.Callable:
+    """Decorator: memoizes a single argument factory by argument identity.
+
+    Suited to arguments that are unhashable, (e.g. a mutable dataclass such as a
+    dictionary), but weakly referenceable.  Cached values are dropped once the argument
+    is garbage collected.
+
+    :param factory: Function mapping an instance to a derived value.
+    :returns: Memoized function.
+
+    """
+    cache: typing.Dict[int, typing.Any] = {}
+    lock = threading.Lock()
+
+    @functools.wraps(factory)
+    def _wrapper(instance):
+        key = id(instance)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        with lock:
+            if key not in cache:
+                cache[key] = factory(instance)
+                weakref.finalize(instance, cache.pop, key, None)
+
+        return cache[key]
+
+    _wrapper.cache = cache
+
+    return _wrapper
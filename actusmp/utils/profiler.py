@@ -0,0 +1,337 @@
+import collections
+import contextlib
+import functools
+import json
+import os
+import pathlib
+import threading
+import time
+import typing
+
+
+# Active profile, None when profiling is off.
+_PROFILE: typing.Optional["Profile"] = None
+
+# Spans & counters collected since previous drain: (trace events, map: counter <-> value).
+Trace = typing.Tuple[typing.List[dict], typing.Dict[str, int]]
+
+
+class Profile():
+    """Collects timed spans & counters emitted by instrumented pipeline stages.
+
+    """
+    def __init__(self, started_at: typing.Optional[int] = None):
+        """Instance constructor.
+
+        :param started_at: Origin of event timestamps, (perf counter nanoseconds), passed
+                           by worker processes so that their events align with the parent's.
+
+        """
+        self.counters: typing.Counter[str] = collections.Counter()
+        self.events: typing.List[dict] = []
+        self.started_at: int = time.perf_counter_ns() if started_at is None else started_at
+        self.stopped_at: typing.Optional[int] = None
+        self._lock = threading.Lock()
+
+    def __str__(self) -> str:
+        """Instance string representation."""
+        return f"profile|{len(self.events)}"
+
+    @property
+    def elapsed(self) -> float:
+        """Wall time, (seconds), between start & stop of profiling."""
+        return ((self.stopped_at or time.perf_counter_ns()) - self.started_at) / 1e9
+
+    def add_event(self, name: str, started_at: int, stopped_at: int, args: dict):
+        """Records a completed span.
+
+        :param name: Stage name, e.g. dictionary.parse.
+        :param started_at: Span start, (perf counter nanoseconds).
+        :param stopped_at: Span end, (perf counter nanoseconds).
+        :param args: Supplementary span information, e.g. template name.
+
+        """
+        event = {
+            "name": name,
+            "cat": name.split(".")[0],
+            "ph": "X",
+            "ts": (started_at - self.started_at) / 1000,
+            "dur": (stopped_at - started_at) / 1000,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+
+    def count(self, name: str, value: int = 1):
+        """Increments a counter.
+
+        :param name: Counter name, e.g. io.bytes_written.
+        :param value: Increment.
+
+        """
+        with self._lock:
+            self.counters[name] += value
+
+    def drain(self) -> Trace:
+        """Returns & clears spans & counters collected since previous drain.
+
+        """
+        with self._lock:
+            trace = self.events, dict(self.counters)
+            self.events = []
+            self.counters = collections.Counter()
+
+        return trace
+
+    def get_stages(self) -> typing.Dict[str, typing.Tuple[int, float]]:
+        """Returns map: stage name <-> (call count, total wall time in seconds).
+
+        """
+        stages = collections.defaultdict(lambda: [0, 0.0])
+        with self._lock:
+            for event in self.events:
+                stages[event["name"]][0] += 1
+                stages[event["name"]][1] += event["dur"] / 1e6
+
+        return {k: tuple(v) for k, v in stages.items()}
+
+    def get_summary(self) -> str:
+        """Returns a text table of per stage wall time followed by counters.
+
+        N.B. Nested stages are each reported in full, thus percentages may exceed 100.
+
+        """
+        elapsed = self.elapsed
+        lines = [
+            f"{'stage':<48} {'calls':>7} {'total ms':>11} {'mean ms':>9} {'%':>6}",
+            "-" * 85,
+        ]
+        stages = sorted(self.get_stages().items(), key=lambda i: i[1][1], reverse=True)
+        for name, (calls, total) in stages:
+            pct = 100 * total / elapsed if elapsed else 0
+            lines.append(
+                f"{name:<48} {calls:>7} {total * 1000:>11.3f} "
+                f"{total * 1000 / calls:>9.3f} {pct:>6.1f}"
+            )
+        lines.append("-" * 85)
+        lines.append(f"{'wall time':<48} {'':>7} {elapsed * 1000:>11.3f}")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name:<48} {value:>7}")
+
+        return "\n".join(lines)
+
+    def get_trace(self) -> dict:
+        """Returns Chrome trace event document, (viewable in chrome://tracing or Perfetto).
+
+        """
+        with self._lock:
+            events = list(self.events)
+            counters = dict(self.counters)
+        events.append({
+            "name": "counters",
+            "ph": "C",
+            "ts": self.elapsed * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": counters,
+        })
+
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+        }
+
+    def merge(self, trace: Trace):
+        """Merges spans & counters drained from another profile, e.g. of a worker process.
+
+        N.B. Events retain the pid of the process that emitted them.
+
+        :param trace: Drained trace events & counters.
+
+        """
+        events, counters = trace
+        with self._lock:
+            self.events += events
+            self.counters.update(counters)
+
+    def write_trace(self, fpath: pathlib.Path):
+        """Writes Chrome trace event file.
+
+        :param fpath: Path to target trace file.
+
+        """
+        fpath.parent.mkdir(parents=True, exist_ok=True)
+        with open(fpath, "w") as fstream:
+            json.dump(self.get_trace(), fstream)
+
+
+class _Span():
+    """Context manager timing a single execution of a pipeline stage.
+
+    """
+    __slots__ = ("args", "name", "profile", "started_at")
+
+    def __init__(self, profile: Profile, name: str, args: dict):
+        """Instance constructor."""
+        self.args = args
+        self.name = name
+        self.profile = profile
+        self.started_at = 0
+
+    def __enter__(self) -> "_Span":
+        """Context manager entry."""
+        self.started_at = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *args):
+        """Context manager exit."""
+        self.profile.add_event(self.name, self.started_at, time.perf_counter_ns(), self.args)
+
+
+class _NullSpan():
+    """Context manager returned when profiling is off, does nothing.
+
+    """
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *args):
+        """Context manager exit."""
+        pass
+
+
+# Shared no-op span.
+_NULL_SPAN = _NullSpan()
+
+
+def get_origin() -> typing.Optional[int]:
+    """Returns origin of active profile's event timestamps, None if profiling is off.
+
+    """
+    profile = _PROFILE
+
+    return None if profile is None else profile.started_at
+
+
+def is_enabled() -> bool:
+    """Returns flag indicating whether profiling is on.
+
+    """
+    return _PROFILE is not None
+
+
+def start(started_at: typing.Optional[int] = None) -> Profile:
+    """Switches profiling on.
+
+    :param started_at: Origin of event timestamps, (perf counter nanoseconds), defaults to now.
+    :returns: Profile to which instrumented stages report.
+
+    """
+    global _PROFILE
+
+    _PROFILE = Profile(started_at)
+
+    return _PROFILE
+
+
+def stop() -> typing.Optional[Profile]:
+    """Switches profiling off.
+
+    :returns: Profile to which instrumented stages reported, None if profiling was off.
+
+    """
+    global _PROFILE
+
+    profile, _PROFILE = _PROFILE, None
+    if profile is not None:
+        profile.stopped_at = time.perf_counter_ns()
+
+    return profile
+
+
+@contextlib.contextmanager
+def profiling() -> typing.Iterator[Profile]:
+    """Context manager: switches profiling on for the duration of a block.
+
+    :returns: Profile to which instrumented stages report.
+
+    """
+    profile = start()
+    try:
+        yield profile
+    finally:
+        stop()
+
+
+def drain() -> typing.Optional[Trace]:
+    """Returns & clears spans & counters collected since previous drain, None if off.
+
+    """
+    profile = _PROFILE
+
+    return None if profile is None else profile.drain()
+
+
+def merge(trace: typing.Optional[Trace]):
+    """Merges spans & counters drained from another profile if profiling is on.
+
+    :param trace: Drained trace events & counters, ignored if None.
+
+    """
+    profile = _PROFILE
+    if profile is not None and trace is not None:
+        profile.merge(trace)
+
+
+def span(name: str, **args) -> typing.Union[_Span, _NullSpan]:
+    """Returns context manager timing a pipeline stage, a shared no-op when profiling is off.
+
+    :param name: Stage name, e.g. dictionary.parse.
+    :param args: Supplementary span information, e.g. template name.
+    :returns: A context manager.
+
+    """
+    profile = _PROFILE
+    if profile is None:
+        return _NULL_SPAN
+
+    return _Span(profile, name, args)
+
+
+def count(name: str, value: int = 1):
+    """Increments a counter if profiling is on.
+
+    :param name: Counter name, e.g. io.bytes_written.
+    :param value: Increment.
+
+    """
+    profile = _PROFILE
+    if profile is not None:
+        profile.count(name, value)
+
+
+def timed(name: str) -> typing.Callable:
+    """Decorator: times each call of a function as a pipeline stage.
+
+    :param name: Stage name, e.g. dictionary.parse.
+    :returns: Decorator.
+
+    """
+    def _decorator(func: typing.Callable) -> typing.Callable:
+        @functools.wraps(func)
+        def _wrapper(*args, **kwargs):
+            profile = _PROFILE
+            if profile is None:
+                return func(*args, **kwargs)
+            with _Span(profile, name, None):
+                return func(*args, **kwargs)
+
+        return _wrapper
+
+    return _decorator
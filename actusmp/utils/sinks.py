@@ -0,0 +1,378 @@
+import concurrent.futures
+import io
+import os
+import pathlib
+import shutil
+import tarfile
+import tempfile
+import threading
+import time
+import typing
+import zipfile
+
+from actusmp.utils import profiler
+
+
+def _get_umask() -> int:
+    """Returns current process umask.
+
+    """
+    umask = os.umask(0o022)
+    os.umask(umask)
+
+    return umask
+
+
+# Permission bits of newly written files, (read once as umask cannot be read thread safely).
+_FILE_MODE: int = 0o666 & ~_get_umask()
+
+# Size, (bytes), beyond which a streamed archive member is spooled to disk rather than memory.
+_SPOOL_SIZE: int = 1 << 20
+
+
+class Sink():
+    """A destination to which generated code blocks are written.
+
+    """
+    def __enter__(self) -> "Sink":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, *args):
+        """Context manager exit."""
+        self.close()
+
+    def close(self):
+        """Flushes pending writes & releases resources."""
+        self.flush()
+
+    def flush(self):
+        """Blocks until all pending writes have completed."""
+        pass
+
+    def write(self, fpath: pathlib.Path, content: str):
+        """Writes file content.
+
+        :param fpath: Target file path.
+        :param content: File content to be written.
+
+        """
+        raise NotImplementedError()
+
+    def write_chunks(
+        self,
+        fpath: pathlib.Path,
+        chunks: typing.Iterable[str],
+        is_changed: typing.Optional[typing.Callable[[], bool]] = None
+    ) -> bool:
+        """Writes file content streamed as a sequence of chunks.
+
+        :param fpath: Target file path.
+        :param chunks: File content to be written, e.g. as yielded by a template.
+        :param is_changed: Predicate invoked once all chunks are consumed, if false the
+                           write is abandoned.
+        :returns: Flag indicating whether file was written.
+
+        """
+        content = "".join(chunks)
+        if is_changed is not None and not is_changed():
+            return False
+        self.write(fpath, content)
+
+        return True
+
+
+class FileSystemSink(Sink):
+    """Writes to file system via a thread pool, each file being atomically replaced.
+
+    """
+    def __init__(self, max_workers: int = 4):
+        """Instance constructor.
+
+        :param max_workers: Number of writer threads, if 1 writes are synchronous.
+
+        """
+        self._dirs: typing.Set[pathlib.Path] = set()
+        self._futures: typing.List[concurrent.futures.Future] = []
+        self._lock = threading.Lock()
+        self._pool = \
+            concurrent.futures.ThreadPoolExecutor(max_workers) if max_workers > 1 else None
+
+    def __str__(self) -> str:
+        """Instance string representation."""
+        return f"fs-sink|{len(self._dirs)}"
+
+    def close(self):
+        """Flushes pending writes & releases resources."""
+        self.flush()
+        if self._pool is not None:
+            self._pool.shutdown()
+
+    def flush(self):
+        """Blocks until all pending writes have completed."""
+        with self._lock:
+            futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def write(self, fpath: pathlib.Path, content: str):
+        """Writes file content.
+
+        :param fpath: Target file path.
+        :param content: File content to be written.
+
+        """
+        if fpath.parent not in self._dirs:
+            fpath.parent.mkdir(parents=True, exist_ok=True)
+            self._dirs.add(fpath.parent)
+
+        if self._pool is None:
+            write_atomic(fpath, content)
+        else:
+            future = self._pool.submit(write_atomic, fpath, content)
+            with self._lock:
+                self._futures.append(future)
+
+    def write_chunks(
+        self,
+        fpath: pathlib.Path,
+        chunks: typing.Iterable[str],
+        is_changed: typing.Optional[typing.Callable[[], bool]] = None
+    ) -> bool:
+        """Writes file content streamed as a sequence of chunks.
+
+        N.B. Chunks are written synchronously as they are typically rendered on demand.
+
+        :param fpath: Target file path.
+        :param chunks: File content to be written, e.g. as yielded by a template.
+        :param is_changed: Predicate invoked once all chunks are consumed, if false the
+                           write is abandoned.
+        :returns: Flag indicating whether file was written.
+
+        """
+        if fpath.parent not in self._dirs:
+            fpath.parent.mkdir(parents=True, exist_ok=True)
+            self._dirs.add(fpath.parent)
+
+        return write_atomic_chunks(fpath, chunks, is_changed)
+
+
+class MemorySink(Sink):
+    """Retains written files in memory, useful when testing & diffing.
+
+    """
+    def __init__(self):
+        """Instance constructor."""
+        self.files: typing.Dict[pathlib.Path, str] = {}
+
+    def __contains__(self, fpath: pathlib.Path) -> bool:
+        """Predicate: returns true if a file has been written."""
+        return fpath in self.files
+
+    def __getitem__(self, fpath: pathlib.Path) -> str:
+        """Returns content of a written file."""
+        return self.files[fpath]
+
+    def __iter__(self) -> typing.Iterator[pathlib.Path]:
+        """Instance iterator."""
+        return iter(sorted(self.files))
+
+    def __len__(self) -> int:
+        """Instance iterator length."""
+        return len(self.files)
+
+    def __str__(self) -> str:
+        """Instance string representation."""
+        return f"memory-sink|{len(self)}"
+
+    def write(self, fpath: pathlib.Path, content: str):
+        """Writes file content.
+
+        :param fpath: Target file path.
+        :param content: File content to be written.
+
+        """
+        self.files[fpath] = content
+
+
+class ArchiveSink(Sink):
+    """Streams written files into a single tar or zip archive.
+
+    """
+    def __init__(
+        self,
+        target: typing.Union[pathlib.Path, typing.BinaryIO],
+        root: typing.Optional[pathlib.Path] = None,
+        fmt: typing.Optional[str] = None
+    ):
+        """Instance constructor.
+
+        :param target: Path to archive file, or a writable binary stream.
+        :param root: Directory against which archive member names are relativised.
+        :param fmt: Archive format: zip | tar | tar.gz | tar.bz2 | tar.xz - if omitted it
+                    is derived from the target file suffix.
+
+        """
+        fmt = fmt or _get_archive_format(target)
+        self.root = root
+        self._lock = threading.Lock()
+        self._mtime = time.time()
+        if fmt == "zip":
+            self._tar, self._zip = None, zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED)
+        elif fmt.startswith("tar"):
+            compression = fmt[4:] if fmt != "tar" else ""
+            if isinstance(target, (str, os.PathLike)):
+                mode = f"w:{compression}"
+                self._tar = tarfile.open(target, mode)
+            else:
+                mode = f"w|{compression}"
+                self._tar = tarfile.open(fileobj=target, mode=mode)
+            self._zip = None
+        else:
+            raise ValueError(f"Unsupported archive format: {fmt}")
+
+    def __str__(self) -> str:
+        """Instance string representation."""
+        return f"archive-sink|{'zip' if self._zip else 'tar'}"
+
+    def close(self):
+        """Finalises archive."""
+        with self._lock:
+            if self._tar is not None:
+                self._tar.close()
+            if self._zip is not None:
+                self._zip.close()
+
+    def write(self, fpath: pathlib.Path, content: str):
+        """Writes file content.
+
+        :param fpath: Target file path.
+        :param content: File content to be written.
+
+        """
+        arcname = _get_archive_member_name(fpath, self.root)
+        data = content.encode("utf-8")
+        with self._lock:
+            if self._zip is not None:
+                self._zip.writestr(arcname, data)
+            else:
+                info = tarfile.TarInfo(arcname)
+                info.mode = 0o644
+                info.mtime = self._mtime
+                info.size = len(data)
+                self._tar.addfile(info, io.BytesIO(data))
+
+    def write_chunks(
+        self,
+        fpath: pathlib.Path,
+        chunks: typing.Iterable[str],
+        is_changed: typing.Optional[typing.Callable[[], bool]] = None
+    ) -> bool:
+        """Writes file content streamed as a sequence of chunks.
+
+        Chunks are spooled, (to disk if large), as a tar member's size precedes its data.
+
+        :param fpath: Target file path.
+        :param chunks: File content to be written, e.g. as yielded by a template.
+        :param is_changed: Predicate invoked once all chunks are consumed, if false the
+                           write is abandoned.
+        :returns: Flag indicating whether file was written.
+
+        """
+        arcname = _get_archive_member_name(fpath, self.root)
+        with tempfile.SpooledTemporaryFile(_SPOOL_SIZE) as spool:
+            for chunk in chunks:
+                spool.write(chunk.encode("utf-8"))
+            if is_changed is not None and not is_changed():
+                return False
+            size = spool.tell()
+            spool.seek(0)
+            with self._lock:
+                if self._zip is not None:
+                    info = zipfile.ZipInfo(arcname, time.localtime(time.time())[:6])
+                    info.compress_type = self._zip.compression
+                    info.external_attr = 0o600 << 16
+                    with self._zip.open(info, "w") as fstream:
+                        shutil.copyfileobj(spool, fstream)
+                else:
+                    info = tarfile.TarInfo(arcname)
+                    info.mode = 0o644
+                    info.mtime = self._mtime
+                    info.size = size
+                    self._tar.addfile(info, spool)
+
+        return True
+
+
+def write_atomic(fpath: pathlib.Path, content: str):
+    """Writes file content to a temporary file which then replaces the target.
+
+    :param fpath: Target file path.
+    :param content: File content to be written.
+
+    """
+    write_atomic_chunks(fpath, (content,))
+
+
+def write_atomic_chunks(
+    fpath: pathlib.Path,
+    chunks: typing.Iterable[str],
+    is_changed: typing.Optional[typing.Callable[[], bool]] = None
+) -> bool:
+    """Writes file content chunks to a temporary file which then replaces the target.
+
+    :param fpath: Target file path.
+    :param chunks: File content to be written, e.g. as yielded by a template.
+    :param is_changed: Predicate invoked once all chunks are written, if false the
+                       temporary file is discarded & the target left untouched.
+    :returns: Flag indicating whether target was replaced.
+
+    """
+    with profiler.span("io.write"):
+        fd, fpath_tmp = tempfile.mkstemp(dir=fpath.parent, prefix=f".{fpath.name}.")
+        try:
+            with os.fdopen(fd, "w") as fstream:
+                for chunk in chunks:
+                    fstream.write(chunk)
+            if is_changed is not None and not is_changed():
+                os.unlink(fpath_tmp)
+                return False
+            os.chmod(fpath_tmp, _FILE_MODE)
+            if profiler.is_enabled():
+                profiler.count("io.files_written")
+                profiler.count("io.bytes_written", os.path.getsize(fpath_tmp))
+            os.replace(fpath_tmp, fpath)
+        except BaseException:
+            if os.path.exists(fpath_tmp):
+                os.unlink(fpath_tmp)
+            raise
+
+    return True
+
+
+def _get_archive_format(target: typing.Union[pathlib.Path, typing.BinaryIO]) -> str:
+    """Returns archive format derived from a target file name.
+
+    """
+    name = str(getattr(target, "name", target)).lower()
+    for suffix, fmt in (
+        (".zip", "zip"),
+        (".tar.gz", "tar.gz"),
+        (".tgz", "tar.gz"),
+        (".tar.bz2", "tar.bz2"),
+        (".tar.xz", "tar.xz"),
+    ):
+        if name.endswith(suffix):
+            return fmt
+
+    return "tar"
+
+
+def _get_archive_member_name(fpath: pathlib.Path, root: typing.Optional[pathlib.Path]) -> str:
+    """Returns name of an archive member.
+
+    """
+    if root is not None:
+        return pathlib.Path(os.path.relpath(fpath, root)).as_posix()
+
+    return pathlib.PurePath(*fpath.parts[1:] if fpath.is_absolute() else fpath.parts).as_posix()
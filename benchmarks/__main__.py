@@ -0,0 +1,119 @@
+import argparse
+import importlib
+import os
+import pathlib
+import sys
+import tempfile
+
+# Isolate on-disk caches, (dictionary snapshots, template bytecode), from those of the user.
+os.environ.setdefault("ACTUSMP_CACHE_DIR", tempfile.mkdtemp(prefix="actusmp-bench-cache-"))
+
+from benchmarks import harness  # noqa: E402
+
+
+# Modules declaring benchmarks.
+_MODULES = (
+    "benchmarks.bench_dictionary",
+    "benchmarks.bench_codegen",
+    "benchmarks.bench_scaling",
+    "benchmarks.bench_termsets",
+)
+
+# Path to local baseline, (machine specific thus not under version control).
+_BASELINE = pathlib.Path(__file__).parent / "baseline.json"
+
+# CLI argument parser.
+_ARGS = argparse.ArgumentParser("Times the dictionary & codegen pipeline.")
+
+# Set CLI argument: name filter.
+_ARGS.add_argument(
+    "-k",
+    dest="pattern",
+    help="Only run benchmarks whose name contains this substring."
+    )
+
+# Set CLI argument: number of timed repetitions.
+_ARGS.add_argument(
+    "--repeat",
+    dest="repeat",
+    help="Number of timed repetitions, overrides per benchmark default.",
+    type=int
+    )
+
+# Set CLI argument: report output path.
+_ARGS.add_argument(
+    "--output",
+    dest="output",
+    help="Path to which a JSON report is written.",
+    type=pathlib.Path
+    )
+
+# Set CLI argument: baseline path.
+_ARGS.add_argument(
+    "--baseline",
+    default=_BASELINE,
+    dest="baseline",
+    help="Path to a baseline report against which results are compared.",
+    type=pathlib.Path
+    )
+
+# Set CLI argument: save baseline.
+_ARGS.add_argument(
+    "--save-baseline",
+    action="store_true",
+    dest="save_baseline",
+    help="Record results of this run within baseline, other benchmarks are left untouched."
+    )
+
+# Set CLI argument: regression threshold.
+_ARGS.add_argument(
+    "--threshold",
+    default=harness.DEFAULT_THRESHOLD,
+    dest="threshold",
+    help="Relative slowdown of fastest time beyond which a benchmark regresses, e.g. 0.25.",
+    type=float
+    )
+
+
+def _main(args: argparse.Namespace) -> int:
+    """Main entry point.
+
+    :param args: Parsed command line arguments.
+    :returns: Exit code, 1 if any benchmark regressed against baseline.
+
+    """
+    for module in _MODULES:
+        importlib.import_module(module)
+
+    results = []
+    for item in harness.get_benchmarks(args.pattern):
+        result = harness.run(item, args.repeat)
+        print(result, flush=True)
+        results.append(result)
+
+    plot = importlib.import_module("benchmarks.bench_scaling").get_plot(results)
+    if plot:
+        print(plot)
+
+    if args.output:
+        harness.write_report(args.output, results)
+
+    if args.save_baseline:
+        harness.update_baseline(args.baseline, results)
+        return 0
+
+    baseline = harness.read_report(args.baseline)
+    if not baseline:
+        print(f"No baseline at {args.baseline}, record one locally with --save-baseline.")
+        return 0
+
+    regressions = harness.compare(results, baseline, args.threshold)
+    for result, ratio in regressions:
+        print(f"REGRESSION: {result.name} :: {ratio:.2f}x baseline")
+
+    return 1 if regressions else 0
+
+
+# Entry point.
+if __name__ == "__main__":
+    sys.exit(_main(_ARGS.parse_args()))
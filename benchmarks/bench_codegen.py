@@ -0,0 +1,61 @@
+from actusmp.codegen import generator
+from actusmp.codegen import writer
+from actusmp.codegen.enums import TargetGenerator
+from actusmp.codegen.enums import TargetLanguage
+from actusmp.utils import fsys
+from benchmarks.fixtures import get_bench_dictionary
+from benchmarks.fixtures import get_path_to_core
+from benchmarks.fixtures import get_tmp_dir
+from benchmarks.harness import Benchmark
+from benchmarks.harness import benchmark
+from benchmarks.harness import register
+
+
+# Number of files written by file system benchmark.
+_FSYS_FILE_COUNT = 100
+
+# Size of each file written by file system benchmark.
+_FSYS_FILE_SIZE = 4096
+
+
+def _get_generate(lang: TargetLanguage, typeof: TargetGenerator):
+    """Returns function rendering every code block emitted by a generator."""
+    def _generate():
+        dictionary = get_bench_dictionary()
+        ctx = generator.GeneratorContext(lang, typeof, dictionary, get_path_to_core())
+        return {"items": len(list(generator.generate(ctx)))}
+
+    return _generate
+
+
+def _get_write(lang: TargetLanguage):
+    """Returns function writing all code emitted for a language to an empty directory."""
+    def _write(dest):
+        writer.write(lang, dest, get_path_to_core(), get_bench_dictionary())
+
+    return _write
+
+
+@benchmark("io", "io.fsys.write", setup=get_tmp_dir)
+def _fsys_write(dest):
+    content = "x" * _FSYS_FILE_SIZE
+    for idx in range(_FSYS_FILE_COUNT):
+        fsys.write(dest / "sub" / f"{idx}.txt", content)
+
+    return {"items": _FSYS_FILE_COUNT}
+
+
+for _lang in TargetLanguage:
+    for _typeof in generator.get_generators(_lang):
+        register(Benchmark(
+            "codegen",
+            f"codegen.generate.{_lang.name}.{_typeof.name}",
+            _get_generate(_lang, _typeof)
+        ))
+    register(Benchmark(
+        "e2e",
+        f"e2e.writer.write.{_lang.name}",
+        _get_write(_lang),
+        repeat=3,
+        setup=get_tmp_dir
+    ))
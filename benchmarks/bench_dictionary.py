@@ -0,0 +1,86 @@
+import json
+
+from actusmp.dictionary import factory
+from actusmp.dictionary import parser
+from actusmp.dictionary.accessor import Accessor
+from actusmp.dictionary import get_dictionary
+from benchmarks.fixtures import get_content
+from benchmarks.harness import benchmark
+
+
+@benchmark("dictionary", "dictionary.json_load")
+def _json_load():
+    return json.loads(get_content())
+
+
+@benchmark("dictionary", "dictionary.parse", setup=lambda: json.loads(get_content()))
+def _parse(obj: dict):
+    return parser.parse(obj)
+
+
+@benchmark("dictionary", "dictionary.accessor")
+def _accessor():
+    return Accessor(get_content())
+
+
+@benchmark("dictionary", "dictionary.factory.get_applicability", setup=lambda: _get_accessor())
+def _get_applicability(accessor: Accessor):
+    return factory._get_applicability(accessor)
+
+
+@benchmark("dictionary", "dictionary.factory.get_contract_set", setup=lambda: _get_sections())
+def _get_contract_set(sections: tuple):
+    return factory._get_contract_set(*sections)
+
+
+@benchmark("dictionary", "dictionary.factory.get_enums", setup=lambda: _get_accessor())
+def _get_enums(accessor: Accessor):
+    return [factory._get_enum(i) for i in (
+        accessor.contract_event_type,
+        accessor.contract_performance,
+        accessor.contract_reference_role,
+        accessor.contract_reference_type,
+        accessor.contract_role,
+        accessor.contract_type,
+    )]
+
+
+@benchmark("dictionary", "dictionary.factory.get_state_set", setup=lambda: _get_accessor())
+def _get_state_set(accessor: Accessor):
+    return factory._get_state_set(accessor)
+
+
+@benchmark("dictionary", "dictionary.factory.get_taxonomy", setup=lambda: _get_accessor())
+def _get_taxonomy(accessor: Accessor):
+    return factory._get_taxonomy(accessor)
+
+
+@benchmark("dictionary", "dictionary.factory.get_term_set", setup=lambda: _get_accessor())
+def _get_term_set(accessor: Accessor):
+    return factory._get_term_set(accessor)
+
+
+@benchmark("dictionary", "dictionary.get_dictionary.cold")
+def _get_dictionary_cold():
+    return get_dictionary(use_cache=False)
+
+
+@benchmark("dictionary", "dictionary.get_dictionary.snapshot")
+def _get_dictionary_snapshot():
+    return get_dictionary()
+
+
+def _get_accessor() -> Accessor:
+    """Returns accessor over bundled dictionary."""
+    return Accessor(get_content())
+
+
+def _get_sections() -> tuple:
+    """Returns inputs of contract set builder."""
+    accessor = _get_accessor()
+
+    return (
+        factory._get_applicability(accessor),
+        factory._get_taxonomy(accessor),
+        factory._get_term_set(accessor),
+    )
@@ -0,0 +1,125 @@
+import functools
+import math
+import re
+import typing
+
+from actusmp.codegen import writer
+from actusmp.codegen.enums import TargetLanguage
+from actusmp.dictionary import synthetic
+from actusmp.dictionary.factory import get_dictionary_from_content
+from actusmp.model import Dictionary
+from actusmp.utils.sinks import MemorySink
+from benchmarks.fixtures import get_path_to_core
+from benchmarks.fixtures import get_tmp_dir
+from benchmarks.harness import Benchmark
+from benchmarks.harness import Result
+from benchmarks.harness import register
+
+
+# Size of a unit synthetic dictionary: (contract types, terms, applicability rows).
+_UNIT_SIZE = (32, 128, 1024)
+
+# Multiples of unit size at which scaling is measured.
+_FACTORS = (1, 2, 4, 8)
+
+# Width, (characters), of longest bar in a scaling plot.
+_PLOT_WIDTH = 40
+
+# Benchmark name pattern: scaling.{series}.x{factor}.
+_NAME = re.compile(r"^scaling\.(?P<series>.+)\.x(?P<factor>\d+)$")
+
+
+@functools.lru_cache(maxsize=None)
+def get_synthetic_content(factor: int) -> bytes:
+    """Returns raw content of a synthetic dictionary at a multiple of unit size."""
+    return synthetic.get_content(*[i * factor for i in _UNIT_SIZE])
+
+
+@functools.lru_cache(maxsize=None)
+def get_synthetic_dictionary(factor: int) -> Dictionary:
+    """Returns synthetic dictionary at a multiple of unit size, built once per run."""
+    return get_dictionary_from_content(get_synthetic_content(factor), use_cache=False)
+
+
+def get_plot(results: typing.List[Result]) -> str:
+    """Returns text plot of time against dictionary size for each measured scaling series.
+
+    Each series is annotated with its log-log slope, i.e. ~1 implies linear scaling
+    and ~2 quadratic.
+
+    """
+    series: typing.Dict[str, typing.List[typing.Tuple[int, Result]]] = {}
+    for result in results:
+        match = _NAME.match(result.name)
+        if match:
+            series.setdefault(match["series"], []).append((int(match["factor"]), result))
+    if not series:
+        return ""
+
+    lines = []
+    for name, points in series.items():
+        points = sorted(points, key=lambda i: i[0])
+        longest = max(i.min for _, i in points) or 1
+        lines.append(f"{name} :: log-log slope {_get_slope(points):.2f}")
+        for factor, result in points:
+            rows = _UNIT_SIZE[2] * factor
+            bar = "#" * max(1, round(_PLOT_WIDTH * result.min / longest))
+            lines.append(f"  {rows:>8} rows {result.min * 1000:>10.3f} ms {bar}")
+
+    return "\n".join(lines)
+
+
+def _get_generate(factor: int):
+    """Returns function rendering all code for each language to an in-memory sink."""
+    def _generate(dictionary: Dictionary):
+        sink = MemorySink()
+        for lang in TargetLanguage:
+            writer.write(lang, _get_dest(), get_path_to_core(), dictionary, sink=sink)
+        return {"items": _UNIT_SIZE[2] * factor}
+
+    return _generate
+
+
+@functools.lru_cache(maxsize=None)
+def _get_dest():
+    """Returns directory against which generated files are written to an in-memory sink."""
+    return get_tmp_dir()
+
+
+def _get_load(factor: int):
+    """Returns function building a dictionary, without a snapshot, from synthetic content."""
+    def _load(content: bytes):
+        get_dictionary_from_content(content, use_cache=False)
+        return {"items": _UNIT_SIZE[2] * factor}
+
+    return _load
+
+
+def _get_slope(points: typing.List[typing.Tuple[int, Result]]) -> float:
+    """Returns least squares slope of log(time) against log(size)."""
+    xs = [math.log(factor) for factor, _ in points]
+    ys = [math.log(max(result.min, 1e-9)) for _, result in points]
+    x_mean, y_mean = sum(xs) / len(xs), sum(ys) / len(ys)
+    denominator = sum((x - x_mean) ** 2 for x in xs)
+    if denominator == 0:
+        return 0.0
+
+    return sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys)) / denominator
+
+
+for _factor in _FACTORS:
+    register(Benchmark(
+        "scaling",
+        f"scaling.load.x{_factor}",
+        _get_load(_factor),
+        repeat=3,
+        setup=functools.partial(get_synthetic_content, _factor)
+    ))
+for _factor in _FACTORS:
+    register(Benchmark(
+        "scaling",
+        f"scaling.generate.x{_factor}",
+        _get_generate(_factor),
+        repeat=3,
+        setup=functools.partial(get_synthetic_dictionary, _factor)
+    ))
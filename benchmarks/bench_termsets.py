@@ -0,0 +1,267 @@
+import csv
+import dataclasses
+import datetime
+import enum
+import functools
+import importlib
+import importlib.util
+import io
+import sys
+import typing
+
+from actusmp.codegen import writer
+from actusmp.codegen.enums import TargetLanguage
+from actusmp.codegen.viewmodel import get_view_model
+from actusmp.model import ScalarType
+from benchmarks.fixtures import get_bench_dictionary
+from benchmarks.fixtures import get_path_to_core
+from benchmarks.fixtures import get_tmp_dir
+from benchmarks.harness import Benchmark
+from benchmarks.harness import register
+
+
+# Number of termsets instantiated per repetition.
+_INSTANCE_COUNT = 20000
+
+# Number of termsets decoded per repetition.
+_DECODE_COUNT = 5000
+
+# Number of CSV rows loaded per repetition.
+_LOAD_COUNT = 20000
+
+# Contract types whose generated termsets are instantiated.
+_CONTRACTS = ("PAM", "SWAPS")
+
+# Map: scalar type <-> JSON value assigned to terms of the type within decoder payloads.
+_PAYLOAD_VALUES = {
+    ScalarType.Cycle: "P1ML0",
+    ScalarType.Period: "P3M",
+    ScalarType.Real: 1000.0,
+    ScalarType.Timestamp: "2015-01-01T00:00:00",
+    ScalarType.Varchar: "abc",
+}
+
+# Stand-in for the hand written pyactus.types.core package upon which generated code depends.
+_CORE_PACKAGE = '''
+from pyactus.types.core.states import StateSpace
+
+
+class ContractReference():
+    __slots__ = ()
+
+
+class ContractTermset():
+    __slots__ = ()
+
+
+class Cycle():
+    __slots__ = ()
+
+
+class Period():
+    __slots__ = ()
+'''
+
+
+@functools.lru_cache(maxsize=None)
+def get_generated_package() -> str:
+    """Returns name of importable package into which python target is generated."""
+    root = get_tmp_dir()
+    dest = root / "pyactus"
+    dest.mkdir()
+    writer.write(TargetLanguage.python, dest, get_path_to_core(), get_bench_dictionary())
+    for path in (dest, dest / "types"):
+        (path / "__init__.py").touch()
+    (dest / "types" / "core" / "__init__.py").write_text(_CORE_PACKAGE)
+    sys.path.insert(0, str(root))
+
+    return "pyactus"
+
+
+@functools.lru_cache(maxsize=None)
+def get_termset_classes() -> typing.Dict[str, type]:
+    """Returns map: contract acronym <-> generated termset class."""
+    module = importlib.import_module(f"{get_generated_package()}.types.terms")
+
+    return {k.name: v for k, v in module.CONTRACT_TERMSETS.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def get_legacy_class(termset: type) -> type:
+    """Returns dataclass equivalent to a generated termset, (i.e. the prior output)."""
+    return dataclasses.make_dataclass(
+        f"Legacy{termset.__name__}",
+        [(i.name, i.type, dataclasses.field(default=i.default)) for i in termset.FIELDS],
+        bases=(termset.__mro__[1],)
+    )
+
+
+def _get_class(acronym: str, is_legacy: bool) -> type:
+    """Returns class of a contract's termset, as currently or previously generated."""
+    termset = get_termset_classes()[acronym]
+
+    return get_legacy_class(termset) if is_legacy else termset
+
+
+def _construct(cls: type):
+    """Instantiates a termset with default values."""
+    instances = [cls() for _ in range(_INSTANCE_COUNT)]
+
+    return {"items": _INSTANCE_COUNT, "bytes_per_item": _get_size(instances[0])}
+
+
+def _decode(args: tuple):
+    """Decodes a set of payloads into termsets."""
+    decoder, payloads = args
+    for payload in payloads:
+        decoder(payload)
+
+    return {"items": len(payloads)}
+
+
+def _get_decoder(acronym: str, is_legacy: bool) -> typing.Callable[[dict], typing.Any]:
+    """Returns termset decoder of a contract, generated or reflective, (i.e. prior approach)."""
+    package = get_generated_package()
+    if not is_legacy:
+        return importlib.import_module(f"{package}.types.decoders.{acronym.lower()}").from_dict
+
+    termset = get_termset_classes()[acronym]
+    fields = importlib.import_module(f"{package}.types.terms").CONTRACT_FIELDSETS[termset]
+    views = get_view_model(get_bench_dictionary()).fields
+    names = {i.identifier: views[i].snake for i in _get_contract(acronym).term_set}
+
+    def _convert(typedef: typing.Any, value: typing.Any) -> typing.Any:
+        if typing.get_origin(typedef) is list:
+            return [_convert(typing.get_args(typedef)[0], i) for i in value]
+        elif typedef is float:
+            return float(value)
+        elif typedef is datetime.datetime:
+            return datetime.datetime.fromisoformat(value)
+        elif isinstance(typedef, type) and issubclass(typedef, enum.Enum):
+            return typedef[value]
+        return value
+
+    def _decoder(obj: dict):
+        instance = termset()
+        for key, value in obj.items():
+            field = fields.get(names.get(key))
+            if field is not None and value is not None:
+                setattr(instance, field.name, _convert(field.type, value))
+        return instance
+
+    return _decoder
+
+
+def _get_csv(acronym: str) -> typing.List[str]:
+    """Returns lines of a CSV extract, keyed by term identifier, of a contract's payload."""
+    payload = _get_payload(acronym)
+    row = [";".join(i) if isinstance(i, list) else i for i in payload.values()]
+    fstream = io.StringIO()
+    writer = csv.writer(fstream)
+    writer.writerow(payload)
+    writer.writerows([row] * _LOAD_COUNT)
+
+    return fstream.getvalue().splitlines(keepends=True)
+
+
+def _get_contract(acronym: str):
+    """Returns a contract defined within benchmark dictionary."""
+    return [i for i in get_bench_dictionary().contract_set if i.type_info.acronym == acronym][0]
+
+
+def _get_payload(acronym: str) -> dict:
+    """Returns JSON shaped payload assigning a value to every term of a contract."""
+    payload = {}
+    for term in _get_contract(acronym).term_set:
+        if term.is_enum:
+            value = term.members[0].acronym
+        elif term.scalar_type in _PAYLOAD_VALUES:
+            value = _PAYLOAD_VALUES[term.scalar_type]
+        else:
+            continue
+        payload[term.identifier] = [value] if term.is_array else value
+    payload["contractType"] = acronym
+
+    return payload
+
+
+def _get_loader(acronym: str, is_batched: bool) -> typing.Callable:
+    """Returns generated CSV loader of a contract, yielding either termsets or batches."""
+    package = get_generated_package()
+    module = importlib.import_module(f"{package}.types.decoders.{acronym.lower()}")
+
+    return module.load_csv_batches if is_batched else module.load_csv
+
+
+def _get_fieldsets(is_legacy: bool):
+    """Returns function deriving map: termset <-> field set, (as per termset index)."""
+    def _fieldsets(classes: list):
+        if is_legacy:
+            fieldsets = {i: {j.name: j for j in dataclasses.fields(i)} for i in classes}
+        else:
+            fieldsets = {i: {j.name: j for j in i.FIELDS} for i in classes}
+        return {"items": len(fieldsets)}
+
+    return _fieldsets
+
+
+def _load(args: tuple):
+    """Streams lines of a CSV extract through a loader, (peak memory is thus that of loading)."""
+    loader, lines = args
+    for _ in loader(iter(lines)):
+        pass
+
+    return {"items": _LOAD_COUNT}
+
+
+def _get_size(instance: typing.Any) -> int:
+    """Returns shallow size of an instance plus that of its attribute dictionary, (if any)."""
+    size = sys.getsizeof(instance)
+    if hasattr(instance, "__dict__"):
+        size += sys.getsizeof(instance.__dict__)
+
+    return size
+
+
+for _acronym in _CONTRACTS:
+    for _is_legacy, _label in ((True, "dataclass"), (False, "slots")):
+        register(Benchmark(
+            "termsets",
+            f"termsets.construct.{_acronym.lower()}.{_label}",
+            _construct,
+            setup=functools.partial(_get_class, _acronym, _is_legacy)
+        ))
+for _is_legacy, _label in ((True, "dataclass"), (False, "slots")):
+    register(Benchmark(
+        "termsets",
+        f"termsets.fieldsets.{_label}",
+        _get_fieldsets(_is_legacy),
+        setup=functools.partial(
+            lambda i: [_get_class(j, i) for j in get_termset_classes()], _is_legacy
+        )
+    ))
+for _acronym in _CONTRACTS:
+    for _is_legacy, _label in ((True, "reflective"), (False, "generated")):
+        register(Benchmark(
+            "termsets",
+            f"termsets.decode.{_acronym.lower()}.{_label}",
+            _decode,
+            setup=functools.partial(
+                lambda i, j: (_get_decoder(i, j), [_get_payload(i)] * _DECODE_COUNT),
+                _acronym,
+                _is_legacy
+            )
+        ))
+for _acronym in _CONTRACTS:
+    # N.B. batches depend upon numpy which is not an actus-mp dependency.
+    for _is_batched in (False, True) if importlib.util.find_spec("numpy") else (False,):
+        register(Benchmark(
+            "termsets",
+            f"termsets.load_csv.{_acronym.lower()}.{'batches' if _is_batched else 'termsets'}",
+            _load,
+            setup=functools.partial(
+                lambda i, j: (_get_loader(i, j), _get_csv(i)),
+                _acronym,
+                _is_batched
+            )
+        ))
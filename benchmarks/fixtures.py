@@ -0,0 +1,64 @@
+import atexit
+import functools
+import os
+import pathlib
+import shutil
+import tempfile
+
+from actusmp.dictionary import get_dictionary
+from actusmp.dictionary.accessor import read_content
+from actusmp.model import Dictionary
+
+
+# Environment variable: path to an actus-core functions tree, else a synthetic one is used.
+ENV_CORE = "ACTUSMP_BENCH_CORE"
+
+# Set of synthetic function files written per contract type: (func type, event type).
+_SYNTHETIC_FUNCS = (
+    ("POF", "IED"),
+    ("POF", "IP"),
+    ("POF", "MD"),
+    ("STF", "IED"),
+    ("STF", "IP"),
+    ("STF", "MD"),
+)
+
+# Root of temporary directories created during a run, removed upon exit.
+_TMP_ROOT = pathlib.Path(tempfile.mkdtemp(prefix="actusmp-bench-"))
+atexit.register(shutil.rmtree, _TMP_ROOT, True)
+
+
+@functools.lru_cache(maxsize=None)
+def get_content() -> bytes:
+    """Returns raw content of bundled dictionary."""
+    return read_content()
+
+
+@functools.lru_cache(maxsize=None)
+def get_bench_dictionary() -> Dictionary:
+    """Returns bundled dictionary, built once per run without a snapshot."""
+    return get_dictionary(use_cache=False)
+
+
+@functools.lru_cache(maxsize=None)
+def get_path_to_core() -> pathlib.Path:
+    """Returns path to an actus-core functions tree.
+
+    """
+    if os.getenv(ENV_CORE):
+        return pathlib.Path(os.getenv(ENV_CORE))
+
+    path = _TMP_ROOT / "core"
+    for contract in get_bench_dictionary().contract_set:
+        acronym = contract.type_info.acronym
+        contract_dir = path / acronym.lower()
+        contract_dir.mkdir(parents=True, exist_ok=True)
+        for f_type, event_type in _SYNTHETIC_FUNCS:
+            (contract_dir / f"{f_type}_{event_type}_{acronym}.java").touch()
+
+    return path
+
+
+def get_tmp_dir() -> pathlib.Path:
+    """Returns a new, empty, temporary directory."""
+    return pathlib.Path(tempfile.mkdtemp(dir=_TMP_ROOT))
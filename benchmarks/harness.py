@@ -0,0 +1,289 @@
+import contextlib
+import dataclasses
+import datetime
+import gc
+import io
+import json
+import pathlib
+import platform
+import statistics
+import time
+import tracemalloc
+import typing
+
+import actusmp
+
+
+# Default relative slowdown, (of fastest time), beyond which a benchmark is deemed to regress.
+DEFAULT_THRESHOLD = 0.25
+
+# Absolute slowdown, in seconds, below which differences are deemed to be noise.
+NOISE_FLOOR = 0.0002
+
+# Set of registered benchmarks.
+_REGISTRY: typing.List["Benchmark"] = []
+
+
+@dataclasses.dataclass
+class Benchmark():
+    """A named unit of work whose execution time & peak memory are measured.
+
+    """
+    # Benchmark group, e.g. dictionary | codegen | io.
+    group: str
+
+    # Benchmark name, unique across suite, e.g. codegen.generate.python.Termset.
+    name: str
+
+    # Function under measurement, passed the value returned by setup (if any).
+    func: typing.Callable
+
+    # Number of timed repetitions.
+    repeat: int = 5
+
+    # Function invoked, untimed, before each repetition - its return value is passed to func.
+    setup: typing.Optional[typing.Callable] = None
+
+    def __str__(self) -> str:
+        """Instance string representation."""
+        return f"benchmark|{self.name}"
+
+
+@dataclasses.dataclass
+class Result():
+    """Measurements of a single benchmark.
+
+    """
+    # Benchmark group.
+    group: str
+
+    # Benchmark name.
+    name: str
+
+    # Number of timed repetitions.
+    repeat: int
+
+    # Fastest repetition, (seconds).
+    min: float
+
+    # Median repetition, (seconds).
+    median: float
+
+    # Mean repetition, (seconds).
+    mean: float
+
+    # Standard deviation of repetitions, (seconds).
+    stdev: float
+
+    # Peak memory allocated whilst executing a single repetition, (bytes).
+    peak_memory: int
+
+    # Supplementary measurements, e.g. rows per second.
+    extra: dict = dataclasses.field(default_factory=dict)
+
+    def __str__(self) -> str:
+        """Instance string representation."""
+        median, peak_memory = self.median * 1000, self.peak_memory / 1024
+
+        return f"{self.name:<56} {median:>10.3f} ms {peak_memory:>10.1f} KiB"
+
+
+def benchmark(
+    group: str,
+    name: str,
+    repeat: int = 5,
+    setup: typing.Optional[typing.Callable] = None
+) -> typing.Callable:
+    """Decorator: registers a benchmark.
+
+    :param group: Benchmark group.
+    :param name: Benchmark name, unique across suite.
+    :param repeat: Number of timed repetitions.
+    :param setup: Function invoked, untimed, before each repetition.
+    :returns: Decorator returning decorated function unchanged.
+
+    """
+    def _decorator(func: typing.Callable) -> typing.Callable:
+        register(Benchmark(group, name, func, repeat, setup))
+        return func
+
+    return _decorator
+
+
+def register(item: Benchmark):
+    """Registers a benchmark.
+
+    :param item: Benchmark to be registered.
+
+    """
+    assert item.name not in {i.name for i in _REGISTRY}, f"Duplicate benchmark: {item.name}"
+
+    _REGISTRY.append(item)
+
+
+def get_benchmarks(pattern: typing.Optional[str] = None) -> typing.List[Benchmark]:
+    """Returns registered benchmarks.
+
+    :param pattern: Substring filter applied to benchmark names.
+    :returns: Benchmarks in registration order.
+
+    """
+    return [i for i in _REGISTRY if pattern is None or pattern in i.name]
+
+
+def run(item: Benchmark, repeat: typing.Optional[int] = None) -> Result:
+    """Executes a benchmark & returns its measurements.
+
+    Timed repetitions run without memory tracing, peak memory is then measured over
+    one further, untimed, repetition.
+
+    :param item: Benchmark to be executed.
+    :param repeat: Number of timed repetitions, defaults to that of benchmark.
+    :returns: Benchmark measurements.
+
+    """
+    def _execute(trace: bool = False) -> typing.Tuple[float, typing.Any, int]:
+        # N.B. diagnostics printed by library code are discarded.
+        with contextlib.redirect_stdout(io.StringIO()):
+            arg = item.setup() if item.setup else None
+            gc.collect()
+            if trace:
+                tracemalloc.start()
+            try:
+                started_at = time.perf_counter()
+                value = item.func(arg) if item.setup else item.func()
+                elapsed = time.perf_counter() - started_at
+                peak_memory = tracemalloc.get_traced_memory()[1] if trace else 0
+            finally:
+                if trace:
+                    tracemalloc.stop()
+
+        return elapsed, value, peak_memory
+
+    # Warm up - also primes caches, (e.g. compiled templates).
+    _, value, _ = _execute()
+
+    timings = [_execute()[0] for _ in range(repeat or item.repeat)]
+
+    _, _, peak_memory = _execute(trace=True)
+
+    median = statistics.median(timings)
+
+    return Result(
+        group=item.group,
+        name=item.name,
+        repeat=len(timings),
+        min=min(timings),
+        median=median,
+        mean=statistics.mean(timings),
+        stdev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        peak_memory=peak_memory,
+        extra=_get_extra(value, median)
+    )
+
+
+def compare(
+    results: typing.List[Result],
+    baseline: dict,
+    threshold: float = DEFAULT_THRESHOLD
+) -> typing.List[typing.Tuple[Result, float]]:
+    """Returns benchmarks whose fastest time regressed beyond threshold against a baseline.
+
+    The fastest repetition is compared as it is least sensitive to scheduling noise.
+
+    :param results: Current measurements.
+    :param baseline: Previously saved report, (see get_report).
+    :param threshold: Relative slowdown beyond which a benchmark is deemed to regress.
+    :returns: Regressed benchmarks: (result, ratio of current to baseline time).
+
+    """
+    timings = {i["name"]: i["min"] for i in baseline.get("results", [])}
+
+    regressions = []
+    for result in results:
+        if result.name not in timings or timings[result.name] <= 0:
+            continue
+        ratio = result.min / timings[result.name]
+        if ratio > 1 + threshold and result.min - timings[result.name] > NOISE_FLOOR:
+            regressions.append((result, ratio))
+
+    return regressions
+
+
+def get_report(results: typing.List[Result]) -> dict:
+    """Returns machine readable report of a set of measurements.
+
+    :param results: Benchmark measurements.
+    :returns: JSON serialisable report.
+
+    """
+    return {
+        "meta": {
+            "actusmp": actusmp.__version__,
+            "machine": platform.machine(),
+            "python": platform.python_version(),
+            "system": platform.system(),
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        },
+        "results": [dataclasses.asdict(i) for i in results],
+    }
+
+
+def read_report(fpath: pathlib.Path) -> dict:
+    """Returns a previously written report.
+
+    :param fpath: Path to a report file.
+    :returns: Report, empty if file does not exist.
+
+    """
+    if not fpath.exists():
+        return {}
+    with open(fpath, "r") as fstream:
+        return json.load(fstream)
+
+
+def update_baseline(fpath: pathlib.Path, results: typing.List[Result]):
+    """Records a set of measurements within a baseline, other benchmarks are left untouched.
+
+    Thus re-recording a subset, (e.g. -k termsets), neither drops nor churns the rest.
+
+    :param fpath: Path to a baseline report file, created if it does not exist.
+    :param results: Benchmark measurements.
+
+    """
+    measured = {i.name: i for i in results}
+    merged = []
+    for item in read_report(fpath).get("results", []):
+        merged.append(measured.pop(item["name"], None) or Result(**item))
+    merged += [i for i in results if i.name in measured]
+
+    write_report(fpath, merged)
+
+
+def write_report(fpath: pathlib.Path, results: typing.List[Result]):
+    """Writes a machine readable report of a set of measurements.
+
+    :param fpath: Path to a report file.
+    :param results: Benchmark measurements.
+
+    """
+    fpath.parent.mkdir(parents=True, exist_ok=True)
+    with open(fpath, "w") as fstream:
+        json.dump(get_report(results), fstream, indent=1)
+        fstream.write("\n")
+
+
+def _get_extra(value: typing.Any, median: float) -> dict:
+    """Returns supplementary measurements derived from a benchmark's return value.
+
+    A benchmark returning {"items": N} yields a throughput, i.e. items per second, any
+    further keys, (e.g. bytes_per_item), are reported as is.
+
+    """
+    if isinstance(value, dict) and "items" in value:
+        return {
+            **value,
+            "items_per_sec": value["items"] / median if median > 0 else None,
+        }
+
+    return {}
@@ -1,16 +1,21 @@
 import argparse
 import pathlib
 import actusmp
+from actusmp.codegen import watcher
+from actusmp.codegen.manifest import WriteSummary
+from actusmp.dictionary import get_dictionary
+from actusmp.utils import profiler
 
 # CLI argument parser.
 _ARGS = argparse.ArgumentParser("Writes code generated from ACTUS dictionary to file system.")
 
-# Set CLI argument: target programming language.
+# Set CLI argument: target programming language(s).
 _ARGS.add_argument(
     "--lang",
     choices=[i for i in actusmp.TargetLanguage],
-    dest="lang",
-    help="Target programming language status.",
+    dest="langs",
+    help="Target programming language(s).",
+    nargs="+",
     type=lambda x: actusmp.TargetLanguage[x]
     )
 
@@ -18,7 +23,60 @@ _ARGS.add_argument(
 _ARGS.add_argument(
     "--dest",
     dest="dest",
-    help="Target file system directory into which code will be written.",
+    help="Target file system directory into which code will be written.  "
+         "If several languages are targeted, each is written to a sub-directory.",
+    type=pathlib.Path
+    )
+
+# Set CLI argument: number of parallel workers.
+_ARGS.add_argument(
+    "--jobs",
+    default=1,
+    dest="jobs",
+    help="Number of parallel workers, 0 implies number of CPUs.",
+    type=int
+    )
+
+# Set CLI argument: prune stale files.
+_ARGS.add_argument(
+    "--prune",
+    action="store_true",
+    dest="prune",
+    help="Delete previously generated files that are no longer emitted."
+    )
+
+# Set CLI argument: path to dictionary file.
+_ARGS.add_argument(
+    "--dictionary",
+    dest="path_to_dictionary",
+    help="Path to an actus-dictionary.json file, defaults to the bundled dictionary.",
+    type=pathlib.Path
+    )
+
+# Set CLI argument: watch sources & regenerate upon change.
+_ARGS.add_argument(
+    "--watch",
+    action="store_true",
+    dest="watch",
+    help="Keep running & regenerate affected files whenever the dictionary, "
+         "templates or actus-core change."
+    )
+
+# Set CLI argument: watch mode polling interval.
+_ARGS.add_argument(
+    "--interval",
+    default=0.5,
+    dest="interval",
+    help="Seconds between polls for changes when watching.",
+    type=float
+    )
+
+# Set CLI argument: profile output file.
+_ARGS.add_argument(
+    "--profile",
+    dest="path_to_profile",
+    help="Path to which a Chrome trace of pipeline stages is written, a summary is also "
+         "printed.  Spans of worker processes, (--jobs > 1), are tagged by worker pid.",
     type=pathlib.Path
     )
 
@@ -37,7 +95,69 @@ def _main(args: argparse.Namespace):
     :param args: Parsed command line arguments.
 
     """
-    actusmp.write(args.lang, args.dest, args.path_to_core)
+    if args.path_to_profile is None:
+        _generate(args)
+        return
+
+    with profiler.profiling() as profile:
+        _generate(args)
+    profile.write_trace(args.path_to_profile)
+    print(profile.get_summary())
+    print(f"trace: {args.path_to_profile}")
+
+
+def _generate(args: argparse.Namespace):
+    """Writes generated code, once or whenever sources change.
+
+    :param args: Parsed command line arguments.
+
+    """
+    if args.watch:
+        _watch(args)
+        return
+
+    dictionary = get_dictionary(path=args.path_to_dictionary)
+    summary = actusmp.write_many(
+        args.langs,
+        args.dest,
+        args.path_to_core,
+        jobs=args.jobs or None,
+        prune=args.prune,
+        dictionary=dictionary
+        )
+    _print_summary(summary)
+
+
+def _print_summary(summary: WriteSummary):
+    """Prints summary of a generation run.
+
+    """
+    for fpath in summary.stale:
+        print(f"{'pruned' if summary.pruned else 'stale'}: {fpath}")
+    print(summary)
+
+
+def _watch(args: argparse.Namespace):
+    """Regenerates affected files whenever sources change, until interrupted.
+
+    :param args: Parsed command line arguments.
+
+    """
+    def _on_change(changes, summary, elapsed):
+        for fpath in summary.written:
+            print(f"written: {fpath}")
+        _print_summary(summary)
+        print(f"changed: {', '.join(changes[:8])}{' ...' if len(changes) > 8 else ''} "
+              f":: {elapsed * 1000:.1f} ms")
+
+    pipeline = watcher.Pipeline(
+        args.langs, args.dest, args.path_to_core, args.path_to_dictionary, args.prune
+        )
+    print(f"watching: {pipeline.path_to_dictionary} | templates | {args.path_to_core}")
+    try:
+        watcher.watch(pipeline, args.interval, _on_change)
+    except KeyboardInterrupt:
+        pass
 
 
 # Entry point.
@@ -0,0 +1,88 @@
+import argparse
+import pathlib
+from actusmp.codegen import server
+
+# CLI argument parser.
+_ARGS = argparse.ArgumentParser("Serves code generated from ACTUS dictionary over local HTTP.")
+
+# Set CLI argument: path to JAVA reference implementation repo (actus-core).
+_ARGS.add_argument(
+    "--core",
+    dest="path_to_core",
+    help="path to JAVA reference implementation repo (actus-core).",
+    type=pathlib.Path
+    )
+
+# Set CLI argument: path to dictionary file.
+_ARGS.add_argument(
+    "--dictionary",
+    dest="path_to_dictionary",
+    help="Path to an actus-dictionary.json file, defaults to the bundled dictionary.",
+    type=pathlib.Path
+    )
+
+# Set CLI argument: host.
+_ARGS.add_argument(
+    "--host",
+    default="127.0.0.1",
+    dest="host",
+    help="Host to which server binds.",
+    type=str
+    )
+
+# Set CLI argument: port.
+_ARGS.add_argument(
+    "--port",
+    default=8737,
+    dest="port",
+    help="Port to which server binds.",
+    type=int
+    )
+
+# Set CLI argument: unix socket.
+_ARGS.add_argument(
+    "--socket",
+    dest="socket_path",
+    help="Path to a unix socket on which to listen, (overrides host & port).",
+    type=pathlib.Path
+    )
+
+# Set CLI argument: cache size.
+_ARGS.add_argument(
+    "--cache-size",
+    default=1024,
+    dest="cache_size",
+    help="Maximum number of rendered artifacts retained in memory.",
+    type=int
+    )
+
+# Set CLI argument: quiet.
+_ARGS.add_argument(
+    "--quiet",
+    action="store_true",
+    dest="quiet",
+    help="Suppress request logging."
+    )
+
+
+def _main(args: argparse.Namespace):
+    """Main entry point.
+
+    :param args: Parsed command line arguments.
+
+    """
+    service = server.Service(args.path_to_core, args.path_to_dictionary, args.cache_size)
+    service.refresh(force=True)
+    httpd = server.create_server(service, args.host, args.port, args.socket_path, args.quiet)
+    print(f"serving: {args.socket_path or f'http://{args.host}:{args.port}'}")
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+
+
+# Entry point.
+if __name__ == "__main__":
+    _main(_ARGS.parse_args())
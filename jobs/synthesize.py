@@ -0,0 +1,70 @@
+import argparse
+import pathlib
+
+from actusmp.dictionary import synthetic
+
+# CLI argument parser.
+_ARGS = argparse.ArgumentParser("Writes a synthetic ACTUS dictionary scaled to a given size.")
+
+# Set CLI argument: output file.
+_ARGS.add_argument(
+    "--dest",
+    dest="dest",
+    help="Path to target dictionary file.",
+    required=True,
+    type=pathlib.Path
+    )
+
+# Set CLI argument: number of contract types.
+_ARGS.add_argument(
+    "--contracts",
+    default=0,
+    dest="contract_count",
+    help="Number of contract types, raised to that of the bundled dictionary if smaller.",
+    type=int
+    )
+
+# Set CLI argument: number of terms.
+_ARGS.add_argument(
+    "--terms",
+    default=0,
+    dest="term_count",
+    help="Number of terms, raised to that of the bundled dictionary if smaller.",
+    type=int
+    )
+
+# Set CLI argument: number of applicability rows.
+_ARGS.add_argument(
+    "--rows",
+    default=0,
+    dest="row_count",
+    help="Number of applicability rows, i.e. (contract type, term) pairs.",
+    type=int
+    )
+
+# Set CLI argument: random seed.
+_ARGS.add_argument(
+    "--seed",
+    default=0,
+    dest="seed",
+    help="Random seed, the same arguments always yield the same dictionary.",
+    type=int
+    )
+
+
+def _main(args: argparse.Namespace):
+    """Main entry point.
+
+    :param args: Parsed command line arguments.
+
+    """
+    synthetic.write(args.dest, args.contract_count, args.term_count, args.row_count, args.seed)
+    with open(args.dest, "rb") as fstream:
+        contract_count, term_count, row_count = synthetic.get_size(fstream.read())
+    print(f"written: {args.dest} :: contracts={contract_count} terms={term_count} "
+          f"rows={row_count}")
+
+
+# Entry point.
+if __name__ == "__main__":
+    _main(_ARGS.parse_args())